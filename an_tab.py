@@ -29,6 +29,7 @@ class AdditionalNotesTab(QWidget):
         self.notes_edit.setReadOnly(read_only)
 
 _tab_instance = None
+_tab_builder = None
 
 def create_additional_notes_tab(tab_widget: QWidget, dirty_tracker=None):
     global _tab_instance
@@ -37,12 +38,26 @@ def create_additional_notes_tab(tab_widget: QWidget, dirty_tracker=None):
     layout.setContentsMargins(0, 0, 0, 0)
     layout.addWidget(_tab_instance)
 
+def set_tab_builder(builder):
+    """Register the callable launch.py uses to build this tab on first use."""
+    global _tab_builder
+    _tab_builder = builder
+
+def ensure_additional_notes_tab():
+    """Return the tab instance, building it now if construction was deferred."""
+    if _tab_instance is None and _tab_builder is not None:
+        _tab_builder()
+    return _tab_instance
+
 def get_notes_text():
-    return _tab_instance.get_notes_text() if _tab_instance else ""
+    tab = ensure_additional_notes_tab()
+    return tab.get_notes_text() if tab else ""
 
 def set_notes_text(text):
-    if _tab_instance:
-        _tab_instance.set_notes_text(text)
+    # Clearing a tab that was never built is a no-op; only real text builds it
+    tab = ensure_additional_notes_tab() if text else _tab_instance
+    if tab:
+        tab.set_notes_text(text)
 
 def set_read_only(read_only):
     if _tab_instance:
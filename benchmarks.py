@@ -0,0 +1,1106 @@
+"""
+Developer benchmarks (not part of the app). Run from the repo folder, e.g.:
+
+    python benchmarks.py startup --runs 5
+    python benchmarks.py startup --runs 5 --eager    # old behaviour: build every tab
+    python benchmarks.py imports                     # -X importtime audit of launch.py
+    python benchmarks.py questions --count 400       # question-bank loaders
+    python benchmarks.py checklist --count 400       # Checklist tab build / load / clear
+    python benchmarks.py quoteinfo --count 200       # Quote Info tab load / read back / clear
+    python benchmarks.py bom --count 1000            # BOM import (CSV / XLSX) into Quote Info
+    python benchmarks.py keystrokes --runs 5         # typing into a 3D cost panel
+    python benchmarks.py mesh --triangles 2000000    # STL load + volume/area/bbox
+    python benchmarks.py packing                     # build-plate estimate, 1-10,000 parts
+    python benchmarks.py paste --width 7680          # screenshot paste: GUI-thread time
+    python benchmarks.py codec                       # adaptive screenshot encoding sizes
+    python benchmarks.py thumbs --count 40           # opening vendor cards with screenshots
+    python benchmarks.py pixcache --count 30         # "View" through the decoded-pixmap LRU
+    python benchmarks.py viewer --width 16000        # opening / zooming a huge screenshot
+    python benchmarks.py dedupe --files 60           # archive duplicate-screenshot report
+    python benchmarks.py cards --count 60            # Vendor Quotes load / resize with lazy cards
+    python benchmarks.py vendors --count 800         # vendor directory build / type-to-filter / add
+    python benchmarks.py usage --files 2000          # vendor usage index: build / refresh / rank
+    python benchmarks.py pricebreaks --vendors 12    # quote text -> price breaks -> comparison matrix
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Libraries that should only load when the action needing them runs
+DEFERRED_MODULES = ["openpyxl", "docx", "PIL", "win32com", "numpy"]
+
+
+def _report(label, times):
+    times_ms = [t * 1000 for t in times]
+    print(f"{label:<40} min {min(times_ms):8.1f} ms   median {statistics.median(times_ms):8.1f} ms   (n={len(times_ms)})")
+
+
+def _app():
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+# ---------- Import-time audit ----------
+
+def import_times(target="launch"):
+    """
+    Run `python -X importtime -c "import <target>"` in a fresh interpreter and
+    return [(module, self_us, cumulative_us, depth), ...] in import order.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=BASE_DIR, capture_output=True, text=True
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumul_us, name = line[len("import time:"):].split("|", 2)
+        try:
+            self_us, cumul_us = int(self_us), int(cumul_us)
+        except ValueError:
+            continue  # header line
+        name = name[1:]  # drop the single separator space; the rest is nesting
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        rows.append((name.strip(), self_us, cumul_us, depth))
+    if proc.returncode != 0:
+        print(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "import failed")
+    return rows
+
+
+def bench_imports(target="launch", top=15):
+    """Print the slowest imports and flag any deferred library that loaded at import time."""
+    rows = import_times(target)
+    if not rows:
+        print("No import timings collected.")
+        return
+    total = max(r[2] for r in rows)
+    print(f"Import of {target!r}: {total / 1000:.1f} ms cumulative")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for name, self_us, cumul_us, depth in sorted(rows, key=lambda r: r[2], reverse=True)[:top]:
+        print(f"{cumul_us / 1000:14.1f} {self_us / 1000:9.1f}  {'  ' * depth}{name}")
+
+    loaded = {r[0].split(".")[0] for r in rows}
+    eager = [m for m in DEFERRED_MODULES if m in loaded]
+    if eager:
+        print("WARNING: loaded at startup but should be deferred: " + ", ".join(eager))
+    else:
+        print("OK: no deferred library is imported at startup")
+
+
+# ---------- Startup ----------
+
+def bench_startup(runs=5, eager=False, imports=True):
+    """
+    Time MainWindow construction + first show. With eager=True every tab is
+    built up front, which is what launch.py did before lazy tab construction.
+    The import-time audit runs first (in a fresh interpreter) unless imports=False.
+    """
+    if imports:
+        bench_imports()
+        print()
+    app = _app()
+    import launch
+
+    construct, shown = [], []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        window = launch.MainWindow()
+        if eager:
+            for name in window.tab_names:
+                window.ensure_tab(name)
+        t1 = time.perf_counter()
+        window.show()
+        app.processEvents()
+        t2 = time.perf_counter()
+        construct.append(t1 - t0)
+        shown.append(t2 - t0)
+        # Don't go through on_close (it would write user settings)
+        window.hide()
+        window.deleteLater()
+        app.processEvents()
+
+    mode = "eager" if eager else "lazy"
+    _report(f"MainWindow() [{mode}]", construct)
+    _report(f"MainWindow() + first show [{mode}]", shown)
+
+
+# ---------- Question bank ----------
+
+def _legacy_load_questions(path):
+    """The loader ChecklistTab used before question_bank: full workbook load + regroup."""
+    import openpyxl
+    wb = openpyxl.load_workbook(path)
+    ws = wb.active
+    questions = []
+    for row in ws.iter_rows(min_row=2, values_only=True):
+        if not any(row):
+            continue
+        category, question, note = row[:3]
+        if not category or not question:
+            continue
+        questions.append({"category": category.strip(), "question": question.strip(),
+                          "note": (note or "").strip()})
+    grouped = {}
+    for q in questions:
+        grouped.setdefault(q["category"], []).append(q)
+    return grouped
+
+
+def _write_question_workbook(path, count):
+    import openpyxl
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["Category", "Question", "Note"])
+    cats = ["General", "CD", "MT", "MIS"]
+    for i in range(count):
+        note = f"Check the drawing callout for item {i}" if i % 3 == 0 else None
+        ws.append([cats[i % 4], f"Question {i}: has the requirement been reviewed with the customer?", note])
+    wb.save(path)
+
+
+def bench_questions(count=400, runs=5):
+    """Old full-mode loader vs streaming compile vs warm-start cache hit."""
+    import doc_cache
+    import question_bank
+
+    with tempfile.TemporaryDirectory() as tmp:
+        xlsx = os.path.join(tmp, "checklist_questions.xlsx")
+        _write_question_workbook(xlsx, count)
+        doc_cache.CACHE_DIR = os.path.join(tmp, "doc_cache")
+        doc_cache.SETTINGS_DIR = tmp
+        doc_cache.LEGACY_BUNDLE_PATH = os.path.join(tmp, "cache.json")
+        doc_cache._cache.clear()
+
+        def timed(fn):
+            times = []
+            for _ in range(runs):
+                t0 = time.perf_counter()
+                fn()
+                times.append(time.perf_counter() - t0)
+            return times
+
+        print(f"{count} questions")
+        _report("legacy load_workbook (read/write)", timed(lambda: _legacy_load_questions(xlsx)))
+        _report("compile_question_bank (read-only)", timed(lambda: question_bank.compile_question_bank(xlsx)))
+        question_bank.load_question_bank(xlsx)  # prime the cache
+        _report("load_question_bank (cache hit)", timed(lambda: question_bank.load_question_bank(xlsx)))
+
+
+# ---------- Checklist tab ----------
+
+def bench_checklist(count=400, runs=5):
+    """Build, load and clear a ChecklistTab over a synthetic question bank."""
+    app = _app()
+    import cl_tab
+    import question_bank
+
+    cats = ["General", "CD", "MT", "MIS"]
+    grouped = {c: [] for c in cats}
+    for i in range(count):
+        grouped[cats[i % 4]].append([f"Question {i}: reviewed with the customer?", "Note" if i % 3 == 0 else "", i + 1])
+    bank = question_bank.QuestionBank({"categories": grouped, "aliases": {}})
+    question_bank.load_question_bank = lambda path: bank
+
+    answer_codes = {str(i + 1): (i % 3) + 1 for i in range(count)}
+    data = {"top_fields": ["Customer", "Opp", "12345", "Sales"], "answer_codes": answer_codes}
+
+    build, load, clear = [], [], []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        tab = cl_tab.ChecklistTab()
+        tab.show()
+        app.processEvents()
+        t1 = time.perf_counter()
+        tab.load_checklist_data(data)
+        app.processEvents()
+        t2 = time.perf_counter()
+        tab.clear_checklist_tab()
+        app.processEvents()
+        t3 = time.perf_counter()
+        build.append(t1 - t0)
+        load.append(t2 - t1)
+        clear.append(t3 - t2)
+        tab.deleteLater()
+        app.processEvents()
+
+    print(f"{count} questions")
+    _report("ChecklistTab() + show", build)
+    _report("load_checklist_data", load)
+    _report("clear_checklist_tab", clear)
+
+
+# ---------- Quote Info tab ----------
+
+def _synthetic_quote_lines(count, share_3d=0.05):
+    lines = []
+    every = int(1 / share_3d) if share_3d else 0
+    for i in range(count):
+        enable_3d = bool(every) and i % every == 0
+        lines.append({
+            "include": True,
+            "fields": [f"10{i:04d}", "6061-T6 Aluminum", str(1 + i % 25), f"CUST-{i}"],
+            "enable_3d": enable_3d,
+            "stratasys": {"985 AB": "1.5", "Time (hrs)": "3"} if enable_3d else {},
+            "formlabs": {"RS-F2": "20", "Time (hrs)": "2"} if enable_3d else {},
+        })
+    return lines
+
+
+def bench_quote_info(count=200, runs=5, share_3d=0.05):
+    """
+    Load, read back and clear a QuoteInfoTab holding `count` line items, and
+    count the widgets it ends up with (3D panels are only built when visible).
+    """
+    app = _app()
+    from PySide6.QtWidgets import QWidget
+    import qi_tab
+
+    data = _synthetic_quote_lines(count, share_3d)
+    load, read, clear = [], [], []
+    widgets = 0
+    for _ in range(runs):
+        tab = qi_tab.QuoteInfoTab()
+        tab.show()
+        app.processEvents()
+        t0 = time.perf_counter()
+        tab.load_quote_info_data(data)
+        app.processEvents()
+        t1 = time.perf_counter()
+        widgets = len(tab.findChildren(QWidget))
+        tab.get_quote_info_data(include_all=True)
+        t2 = time.perf_counter()
+        tab.clear_quote_info_tab()
+        app.processEvents()
+        t3 = time.perf_counter()
+        load.append(t1 - t0)
+        read.append(t2 - t1)
+        clear.append(t3 - t2)
+        tab.deleteLater()
+        app.processEvents()
+
+    print(f"{count} line items, {share_3d:.0%} with 3D -> {widgets} widgets after load")
+    _report("load_quote_info_data", load)
+    _report("get_quote_info_data", read)
+    _report("clear_quote_info_tab", clear)
+
+
+# ---------- 3D panel typing ----------
+
+TYPED = [("stratasys", "985 AB", "12.75"), ("stratasys", "Time (hrs)", "3.5"),
+         ("formlabs", "RS-F2", "140"), ("formlabs", "Time (hrs)", "2.25")]
+
+
+def bench_keystrokes(runs=5):
+    """
+    Type into the inputs of one 3D panel. Compares the old per-keystroke full
+    recompute (every field re-parsed, four cost fields rewritten) with the
+    debounced incremental recompute, in time per keystroke and setText calls.
+    """
+    app = _app()
+    import qi_tab
+
+    keystrokes = sum(len(text) for _, _, text in TYPED)
+    legacy, incremental = [], []
+    legacy_sets = incremental_sets = 0
+    for _ in range(runs):
+        tab = qi_tab.QuoteInfoTab()
+        tab.resize(1000, 600)
+        tab.show()
+        tab.add_lines([{"enable_3d": True}])
+        app.processEvents()
+        panel = tab.view.open_panels()[0]
+        line = panel.line
+
+        # Old behaviour: full recompute and four setText calls per keystroke
+        legacy_sets = 0
+        t0 = time.perf_counter()
+        for printer, key, text in TYPED:
+            for i in range(1, len(text) + 1):
+                line[printer][key] = text[:i]
+                qi_tab.update_line_costs(line)
+                for k in ("Material $", "3D Cost"):
+                    panel.s_vars[k].setText(line["stratasys"][k])
+                    panel.f_vars[k].setText(line["formlabs"][k])
+                    legacy_sets += 2
+        legacy.append((time.perf_counter() - t0) / keystrokes)
+
+        # Current behaviour: type into the real inputs, then let the debounce fire
+        for printer, key, _ in TYPED:
+            (panel.s_vars if printer == "stratasys" else panel.f_vars)[key].setText("")
+        panel.flush()
+        panel.text_updates = 0
+        t0 = time.perf_counter()
+        for printer, key, text in TYPED:
+            widget = (panel.s_vars if printer == "stratasys" else panel.f_vars)[key]
+            for i in range(1, len(text) + 1):
+                widget.setText(text[:i])
+        typing = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        panel.flush()  # what the timer does RECOMPUTE_DELAY_MS after the last key
+        incremental.append((typing + time.perf_counter() - t0) / keystrokes)
+        incremental_sets = panel.text_updates
+
+        tab.deleteLater()
+        app.processEvents()
+
+    print(f"{keystrokes} keystrokes across {len(TYPED)} inputs")
+    _report("per keystroke: full recompute", legacy)
+    _report("per keystroke: debounced incremental", incremental)
+    print(f"cost setText calls: full {legacy_sets}, debounced incremental {incremental_sets}")
+
+
+# ---------- STL analysis ----------
+
+def _write_binary_stl(path, triangles):
+    import numpy as np
+    rng = np.random.default_rng(0)
+    records = np.zeros(triangles, dtype=[("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attr", "<u2")])
+    records["vertices"] = rng.random((triangles, 3, 3), dtype=np.float32) * 100
+    with open(path, "wb") as f:
+        f.write(b"benchmark".ljust(80, b" "))
+        f.write(int(triangles).to_bytes(4, "little"))
+        f.write(records.tobytes())
+
+
+def bench_mesh(triangles=2_000_000, runs=5):
+    """Parse + analyze a binary STL, cold (hash + parse) and warm (hash cache hit)."""
+    import mesh_engine
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "MT99999_Rev0.stl")
+        _write_binary_stl(path, triangles)
+        with open(path, "rb") as f:
+            data = f.read()
+        mesh_engine.CACHE_PATH = os.path.join(tmp, "mesh_cache.json")
+        mesh_engine.SETTINGS_DIR = tmp
+
+        parse, analyze, cold, warm = [], [], [], []
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            tris = mesh_engine.parse_stl(data)
+            t1 = time.perf_counter()
+            mesh_engine.analyze(tris)
+            t2 = time.perf_counter()
+            parse.append(t1 - t0)
+            analyze.append(t2 - t1)
+
+            mesh_engine._cache = {}
+            mesh_engine._hash_by_stat.clear()
+            t0 = time.perf_counter()
+            mesh_engine.analyze_file(path)
+            cold.append(time.perf_counter() - t0)
+            t0 = time.perf_counter()
+            mesh_engine.analyze_file(path)
+            warm.append(time.perf_counter() - t0)
+
+    print(f"{triangles:,} triangles ({len(data) / 1e6:.0f} MB binary STL)")
+    _report("parse_stl", parse)
+    _report("analyze (volume/area/bbox)", analyze)
+    _report("analyze_file (read + sha1 + parse)", cold)
+    _report("analyze_file (cache hit)", warm)
+
+
+# ---------- Build-plate packing ----------
+
+def bench_packing(runs=5, sizes=(1, 10, 100, 1000, 10000)):
+    """packing.estimate: what a quantity edit on a 3D line runs."""
+    import packing
+
+    printers = packing.PRINTERS  # skip the price-table lookup
+    bbox, volume = (42.0, 18.5, 12.0), 6200.0
+    for n in sizes:
+        est = []
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            results = {name: packing.estimate(bbox, volume, n, p) for name, p in printers.items()}
+            est.append(time.perf_counter() - t0)
+        s = results["stratasys"]
+        print(f"{n} parts: Stratasys {s['plates']} plate(s) / {s['hours']:.1f} h")
+        _report(f"  estimate [{n}]", est)
+
+
+# ---------- Screenshot paste ----------
+
+def _synthetic_screenshot(width, height):
+    """A busy RGB image roughly like a multi-monitor capture."""
+    from PySide6.QtGui import QImage, QPainter, QColor, QFont
+    img = QImage(width, height, QImage.Format_RGB32)
+    img.fill(QColor("white"))
+    painter = QPainter(img)
+    painter.setFont(QFont("Arial", 11))
+    for y in range(0, height, 18):
+        painter.setPen(QColor((y * 7) % 255, (y * 3) % 255, (y * 11) % 255))
+        painter.drawText(4, y + 14, f"Line {y // 18}: quote 12345  qty 500  $0.{y % 97:02d} ea  " * 6)
+    painter.end()
+    return img
+
+
+def bench_paste(width=7680, height=2160, runs=5):
+    """
+    GUI-thread time of a screenshot paste: the old inline PNG encode +
+    thumbnail versus handing the image to the encode pool (plus how long the
+    result takes to land).
+    """
+    app = _app()
+    import vq_tab
+
+    img = _synthetic_screenshot(width, height)
+    tab = vq_tab.VendorQuoteTab()
+    tab.add_vendor_row(("Bench Vendor", "", []))
+    row = tab.vendor_rows[0]
+    print(f"{width}x{height} capture, MAX_SCREENSHOT_DIM={vq_tab.MAX_SCREENSHOT_DIM}")
+
+    inline, submit, landed = [], [], []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        vq_tab.prepare_screenshot(img, None)
+        inline.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        task = row.start_screenshot_encode(img)
+        submit.append(time.perf_counter() - t0)
+        task.wait()
+        app.processEvents()
+        landed.append(time.perf_counter() - t0)
+
+    _report("inline encode + thumbnail (old)", inline)
+    _report("paste on GUI thread (pool)", submit)
+    _report("  ...until thumbnail shows", landed)
+    tab.deleteLater()
+    app.processEvents()
+
+
+# ---------- Screenshot encoding ----------
+
+def bench_codec(width=2560, height=1440, runs=3):
+    """Size and time of the old RGBA PNG encode versus image_codec.encode_adaptive."""
+    _app()
+    from PySide6.QtCore import QBuffer
+    from PySide6.QtGui import QImage
+    import image_codec
+
+    img = _synthetic_screenshot(width, height)
+    old, new = [], []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        buf = QBuffer()
+        buf.open(QBuffer.WriteOnly)
+        img.convertToFormat(QImage.Format_RGBA8888).save(buf, "PNG")
+        old_bytes = buf.data().size()
+        old.append(time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        data, info = image_codec.encode_adaptive(img)
+        new.append(time.perf_counter() - t0)
+    print(f"{width}x{height}: RGBA PNG {old_bytes / 1024:.0f} KB -> {info['format']} "
+          f"{info['bytes'] / 1024:.0f} KB (PSNR {info['psnr']:.1f} dB)")
+    _report("RGBA PNG (old)", old)
+    _report("encode_adaptive", new)
+
+
+# ---------- Screenshot thumbnails ----------
+
+def bench_thumbs(count=40, runs=3):
+    """
+    Load Vendor Quotes data with `count` screenshots: GUI-thread time with a
+    cold thumbnail cache (placeholders + background pool), time until every
+    thumbnail has landed, and a warm-cache open.
+    """
+    app = _app()
+    from PySide6.QtCore import QBuffer
+    import thumb_cache
+    import vq_tab
+    import base64
+
+    shots = []
+    for i in range(count):
+        img = _synthetic_screenshot(1600 + i, 900)
+        buf = QBuffer()
+        buf.open(QBuffer.WriteOnly)
+        img.save(buf, "PNG")
+        shots.append(base64.b64encode(bytes(buf.data())).decode("ascii"))
+    data = [(f"Vendor {v}", "", shots[v::4]) for v in range(4)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        thumb_cache.THUMB_DIR = tmp
+        cold_gui, cold_done, warm = [], [], []
+        for _ in range(runs):
+            for name in os.listdir(tmp):
+                os.remove(os.path.join(tmp, name))
+            tab = vq_tab.VendorQuoteTab()
+            t0 = time.perf_counter()
+            tab.load_vendor_quote_data(data)
+            for row in list(tab.vendor_rows):
+                tab.materialize(row)  # the tab is never shown here, so build the cards explicitly
+            cold_gui.append(time.perf_counter() - t0)
+            while len(os.listdir(tmp)) < count or thumb_cache._inflight:
+                app.processEvents()
+                time.sleep(0.005)
+            app.processEvents()
+            cold_done.append(time.perf_counter() - t0)
+
+            t0 = time.perf_counter()
+            tab.load_vendor_quote_data(data)
+            for row in list(tab.vendor_rows):
+                tab.materialize(row)
+            warm.append(time.perf_counter() - t0)
+            tab.deleteLater()
+            app.processEvents()
+
+    print(f"{count} screenshots on 4 vendor cards")
+    _report("load (cold cache, GUI thread)", cold_gui)
+    _report("load (cold cache, all thumbnails in)", cold_done)
+    _report("load (warm cache)", warm)
+
+
+def bench_pixcache(count=30, budget_mb=128, views=200):
+    """
+    Open "View" on random screenshots (recent ones more often) through the
+    shared pixmap LRU: time of a cache hit versus a re-decode, and the memory
+    the cache settles at compared with keeping every pixmap.
+    """
+    _app()
+    import random
+    import base64
+    import image_store
+    from PySide6.QtCore import QBuffer
+
+    keys = []
+    full_bytes = 0
+    for i in range(count):
+        img = _synthetic_screenshot(2560, 1440 + i)
+        buf = QBuffer()
+        buf.open(QBuffer.WriteOnly)
+        img.save(buf, "PNG")
+        keys.append(image_store.add(base64.b64encode(bytes(buf.data())).decode("ascii")))
+        full_bytes += img.sizeInBytes()
+
+    image_store.set_budget_mb(budget_mb)
+    rng = random.Random(1)
+    hits, misses = [], []
+    for _ in range(views):
+        key = keys[min(int(rng.expovariate(1 / (count / 4))), count - 1)]
+        before = image_store.usage()["misses"]
+        t0 = time.perf_counter()
+        image_store.pixmap(key)
+        elapsed = time.perf_counter() - t0
+        (misses if image_store.usage()["misses"] > before else hits).append(elapsed)
+
+    print(f"{count} screenshots, {views} views, budget {budget_mb} MB "
+          f"(keeping every pixmap would hold {full_bytes / 1024 / 1024:.0f} MB)")
+    if hits:
+        _report("view (cached pixmap)", hits)
+    if misses:
+        _report("view (evicted, decoded again)", misses)
+    print(image_store.describe_usage())
+    for key in keys:
+        image_store.release(key)
+
+
+def bench_viewer(width=16000, height=12000, runs=3):
+    """
+    Open a very large screenshot: the old QLabel-in-QScrollArea dialog versus
+    the tiled viewer decoding tiles from the JPEG bytes (time to first paint,
+    then a zoom in and a pan), and the tile memory the viewer ends up holding.
+    """
+    app = _app()
+    from PySide6.QtGui import QPixmap
+    from PySide6.QtCore import QBuffer
+    from PySide6.QtWidgets import QLabel, QScrollArea
+    import screenshot_viewer
+
+    img = _synthetic_screenshot(width, height)
+    buf = QBuffer()
+    buf.open(QBuffer.WriteOnly)
+    img.save(buf, "JPG", 90)
+    data = bytes(buf.data())
+    pixmap = QPixmap.fromImage(img)
+    del img
+    old, new, zoom = [], [], []
+    tiles = (0, 0)
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        scroll = QScrollArea()
+        label = QLabel()
+        label.setPixmap(pixmap)
+        scroll.setWidget(label)
+        scroll.resize(1600, 1000)
+        scroll.show()
+        app.processEvents()
+        old.append(time.perf_counter() - t0)
+        scroll.close()
+        scroll.deleteLater()
+
+        t0 = time.perf_counter()
+        dlg = screenshot_viewer.ScreenshotViewer(data)
+        dlg.resize(1600, 1000)
+        dlg.show()
+        app.processEvents()
+        new.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        for _ in range(6):
+            dlg.view.zoom(screenshot_viewer.ZOOM_STEP)
+            dlg.view.viewport().repaint()
+        sb = dlg.view.horizontalScrollBar()
+        for step in range(10):
+            sb.setValue(sb.maximum() * step // 10)
+            dlg.view.viewport().repaint()
+        zoom.append(time.perf_counter() - t0)
+        tiles = dlg.view.item.tile_usage()
+        dlg.close()
+        dlg.deleteLater()
+        app.processEvents()
+
+    print(f"{width}x{height} screenshot ({width * height * 4 / 1024 / 1024:.0f} MB decoded, "
+          f"{len(data) / 1024 / 1024:.1f} MB JPEG)")
+    _report("open (QLabel in QScrollArea)", old)
+    _report("open (tiled viewer)", new)
+    _report("6 zoom steps + 10 pans (tiled)", zoom)
+    print(f"tiles held: {tiles[0]} ({tiles[1] / 1024 / 1024:.1f} MB)")
+
+
+def bench_dedupe(files=60, per_file=3, runs=3):
+    """
+    Archive duplicate report over `files` checklists: hashing serially versus
+    on the process pool, plus how many exact / near groups it finds. Every
+    fifth checklist repeats a screenshot exactly and every seventh carries a
+    JPEG re-encode of one.
+    """
+    _app()
+    import json
+    import base64
+    from PySide6.QtCore import QBuffer
+    import image_dedupe
+
+    def encoded(img, fmt, quality=-1):
+        buf = QBuffer()
+        buf.open(QBuffer.WriteOnly)
+        img.save(buf, fmt, quality)
+        return base64.b64encode(bytes(buf.data())).decode("ascii")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for f in range(files):
+            shots = [encoded(_synthetic_screenshot(1400 + f * per_file + i, 800), "PNG") for i in range(per_file)]
+            if f % 5 == 4:
+                shots.append(encoded(_synthetic_screenshot(1400, 800), "PNG"))
+            if f % 7 == 6:
+                shots.append(encoded(_synthetic_screenshot(1401, 800), "JPG", 85))
+            with open(os.path.join(tmp, f"CHK{f:04d}.json"), "w", encoding="utf-8") as fh:
+                json.dump({"vendor_quotes": [[f"Vendor {f % 4}", "", shots]]}, fh)
+
+        serial, pooled = [], []
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            image_dedupe.scan_archive(tmp, workers=1)
+            serial.append(time.perf_counter() - t0)
+            t0 = time.perf_counter()
+            entries, _errors = image_dedupe.scan_archive(tmp)
+            pooled.append(time.perf_counter() - t0)
+        exact, near = image_dedupe.find_duplicates(entries)
+
+    print(f"{files} checklists, {len(entries)} screenshots: {len(exact)} exact groups, {len(near)} near groups")
+    _report("hash archive (serial)", serial)
+    _report(f"hash archive (pool, {os.cpu_count()} procs)", pooled)
+
+
+def bench_cards(count=60, runs=3):
+    """
+    Vendor Quotes tab with `count` vendors (a few lines of quote text each):
+    load with placeholders until the first paint, versus building every card,
+    and a burst of window resizes afterwards.
+    """
+    app = _app()
+    import vq_tab
+
+    text = "\n".join(f"Qty {q}: ${q * 0.37:.2f} ea, lead time {q // 50 + 2} weeks" for q in (100, 500, 1000, 5000))
+    data = [(f"Vendor {i:03d}", text + " tooling $450" * (i % 4), []) for i in range(count)]
+    lazy, eager, resize = [], [], []
+    for _ in range(runs):
+        tab = vq_tab.VendorQuoteTab()
+        tab.resize(900, 800)
+        tab.show()
+        app.processEvents()
+
+        t0 = time.perf_counter()
+        tab.load_vendor_quote_data(data)
+        app.processEvents()
+        lazy.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        for w in (700, 1100, 850, 1000, 900, 760, 1200, 900):
+            tab.resize(w, 800)
+            app.processEvents()
+        resize.append(time.perf_counter() - t0)
+        built = sum(1 for row in tab.vendor_rows if isinstance(row, vq_tab.VendorQuoteRow))
+
+        t0 = time.perf_counter()
+        tab.load_vendor_quote_data(data)
+        for row in list(tab.vendor_rows):
+            tab.materialize(row)
+        app.processEvents()
+        eager.append(time.perf_counter() - t0)
+        tab.close()
+        tab.deleteLater()
+        app.processEvents()
+
+    print(f"{count} vendor cards ({built} built after load + resizes)")
+    _report("load (placeholders, first paint)", lazy)
+    _report("load (every card built)", eager)
+    _report("8 window resizes (lazy cards)", resize)
+
+
+def bench_vendors(count=800, cards=60, runs=5):
+    """
+    Vendor directory with `count` names: rebuilding the list, filtering as a
+    name is typed one key at a time, and add_vendor_by_name hitting an
+    existing card on a tab with `cards` vendors.
+    """
+    app = _app()
+    import vq_tab
+
+    words = ["Precision", "Tool", "Die", "Laser", "Converting", "Supply", "Plastics", "Machining", "Foam", "Steel"]
+    names = [f"{words[i % 10]} {words[(i // 10) % 10]} {i:04d}" for i in range(count)]
+    tab = vq_tab.VendorQuoteTab()
+    tab.load_vendor_quote_data([(names[i * 7], "", []) for i in range(cards)])
+    build, typing, lookup = [], [], []
+    query = "laser ste"
+    for _ in range(runs):
+        tab._vendor_names = names
+        t0 = time.perf_counter()
+        tab._rebuild_vendor_links()
+        app.processEvents()
+        build.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        for n in range(1, len(query) + 1):
+            tab.vendor_filter.setText(query[:n])
+        typing.append(time.perf_counter() - t0)
+        tab.vendor_filter.clear()
+
+        t0 = time.perf_counter()
+        for i in range(cards):
+            tab.add_vendor_by_name(names[i * 7])
+        lookup.append((time.perf_counter() - t0) / cards)
+
+    print(f"{count} vendors in the directory, {cards} cards on the tab")
+    _report("rebuild directory", build)
+    _report(f"type '{query}' ({len(query)} keys)", typing)
+    _report("add_vendor_by_name (existing card)", lookup)
+
+
+def bench_usage(files=2000, vendors=800, runs=5):
+    """
+    Vendor usage index over `files` synthetic checklists: cold build, an
+    incremental refresh after one file changes, and ranking `vendors` names
+    for a quote (what runs on each Quote Info edit).
+    """
+    import json
+    import vendor_usage
+
+    names = [f"Vendor {i:04d}" for i in range(vendors)]
+    prefixes = ["CD", "MT", "MIS"]
+    materials = ["PET .005", "PC .010", "STEEL 304", "FOAM 4701", "PSA 467"]
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = os.path.join(tmp, "json_files")
+        os.makedirs(archive)
+
+        def write(i):
+            data = {
+                "checklist": {"top_fields": [f"Customer {i % 40}", "", str(1000 + i), ""]},
+                "quote_info": [{"fields": [f"{prefixes[(i + j) % 3]}{i * 3 + j}", materials[(i + j) % 5], "100", ""]}
+                               for j in range(3)],
+                "vendor_quotes": [[names[(i * 7 + k * 13) % vendors], "", []] for k in range(3)],
+            }
+            with open(os.path.join(archive, f"CHK{i:05d}.json"), "w", encoding="utf-8") as f:
+                json.dump(data, f)
+
+        for i in range(files):
+            write(i)
+        vendor_usage.INDEX_PATH = os.path.join(tmp, "vendor_usage.json")
+        vendor_usage.SETTINGS_DIR = tmp
+
+        cold, warm, rank = [], [], []
+        for run in range(runs):
+            vendor_usage._files = None
+            if os.path.exists(vendor_usage.INDEX_PATH):
+                os.remove(vendor_usage.INDEX_PATH)
+            t0 = time.perf_counter()
+            vendor_usage.refresh(archive)
+            cold.append(time.perf_counter() - t0)
+
+            time.sleep(0.01)
+            write(run)
+            vendor_usage._files = None   # as on the next app start: persisted index + one changed file
+            t0 = time.perf_counter()
+            vendor_usage.refresh(archive)
+            warm.append(time.perf_counter() - t0)
+
+            features = vendor_usage.quote_features(["CD120", "MT77"], ["PET .005"], "Customer 7")
+            t0 = time.perf_counter()
+            top = vendor_usage.rank(names, features)[:3]
+            rank.append(time.perf_counter() - t0)
+
+    print(f"{files} checklists, {vendors} vendors; top 3 for the sample quote: {[n for n, _ in top]}")
+    _report("build index (cold)", cold)
+    _report("load + refresh (1 file changed)", warm)
+    _report("rank vendors for a quote", rank)
+
+
+def bench_pricebreaks(vendors=12, parts=8, runs=5):
+    """
+    Price-break parsing and the cross-vendor matrix: `vendors` quotes covering
+    `parts` drawings with five breaks each. Times a full parse of every quote,
+    re-parsing one quote after a keystroke (the memoized path), and compare()
+    at the quoted breaks and at 200 quantities, stepped and interpolated.
+    """
+    import price_breaks
+
+    def quote(v):
+        lines = [f"Thanks for the opportunity - vendor {v}", "Lead time: 3-4 weeks ARO"]
+        for p in range(parts):
+            if (p + v) % 5 == 0:
+                continue   # not every vendor quotes every part
+            lines.append(f"CD{1000 + p}:")
+            base = 1.5 + p * 0.4 + v * 0.03
+            for i, qty in enumerate((100, 500, 1000, 5000, 10000)):
+                lines.append(f"  Qty {qty:,} - ${base * 0.8 ** i:.3f} ea")
+            lines.append(f"  Tooling ${250 + 25 * v}")
+        return "\n".join(lines)
+
+    texts = [quote(v) for v in range(vendors)]
+    names = [f"Vendor {v:02d}" for v in range(vendors)]
+    full, edit_one, step, interp = [], [], [], []
+    for run in range(runs):
+        price_breaks._line_cache.clear()
+        t0 = time.perf_counter()
+        tables = [price_breaks.parse_quote(t) for t in texts]
+        full.append(time.perf_counter() - t0)
+
+        typed = texts[0] + f"\nQty 25,000 - ${0.5 + run * 0.01:.2f} ea"
+        t0 = time.perf_counter()
+        tables[0] = price_breaks.parse_quote(typed)
+        edit_one.append(time.perf_counter() - t0)
+
+        quantities = price_breaks.default_quantities(tables)
+        many = list(range(50, 20050, 100))
+        t0 = time.perf_counter()
+        price_breaks.compare(names, tables, quantities, "step")
+        price_breaks.compare(names, tables, many, "step")
+        step.append(time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        result = price_breaks.compare(names, tables, many, "interp")
+        interp.append(time.perf_counter() - t0)
+
+    breaks = sum(len(t["breaks"]) for t in tables)
+    print(f"{vendors} quotes, {parts} parts, {breaks} breaks; matrix {result['unit'].shape}")
+    _report("parse every quote (cold)", full)
+    _report("re-parse one quote after a keystroke", edit_one)
+    _report("compare, stepped (breaks + 200 qtys)", step)
+    _report("compare, interpolated (200 qtys)", interp)
+
+
+# ---------- BOM import ----------
+
+def _write_bom_files(folder, count):
+    """A CSV and an XLSX BOM with `count` rows (~5% repeats), plus a fake PDF Drawings folder."""
+    import csv
+    import openpyxl
+
+    drawings = os.path.join(folder, "PDF Drawings")
+    os.makedirs(drawings)
+    header = ["Item", "Part Number", "Description", "Qty", "Customer PN"]
+    rows = []
+    for i in range(count):
+        n = i if i % 20 else max(i - 1, 0)  # every 20th row repeats the previous drawing
+        rows.append([str(i + 1), f"MT{30000 + n}", "0.010 PET w/ 467MP", str(1 + i % 9), f"CUST-{n}"])
+        if i % 2 == 0:
+            open(os.path.join(drawings, f"MT{30000 + n}_Rev{i % 3}.pdf"), "w").close()
+
+    csv_path = os.path.join(folder, "bom.csv")
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+    xlsx_path = os.path.join(folder, "bom.xlsx")
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(header)
+    for row in rows:
+        ws.append(row)
+    wb.save(xlsx_path)
+    return csv_path, xlsx_path, drawings
+
+
+def bench_bom(count=1000, runs=5):
+    """import_bom on CSV and XLSX, then inserting the lines into a QuoteInfoTab."""
+    app = _app()
+    import bom_import
+    import qi_tab
+    import utilities
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path, xlsx_path, drawings = _write_bom_files(tmp, count)
+        for label, path in (("CSV", csv_path), ("XLSX", xlsx_path)):
+            times = []
+            for _ in range(runs):
+                utilities._DRAWINGS_CACHE["index"] = None  # include the folder listing
+                t0 = time.perf_counter()
+                lines, stats = bom_import.import_bom(path, drawings_folder=drawings)
+                times.append(time.perf_counter() - t0)
+            _report(f"import_bom [{label}]", times)
+        print(f"{stats['rows']} rows -> {len(lines)} lines ({stats['merged']} merged, "
+              f"{len(stats['unresolved'])} unresolved)")
+
+        times = []
+        for _ in range(runs):
+            tab = qi_tab.QuoteInfoTab()
+            tab.show()
+            app.processEvents()
+            t0 = time.perf_counter()
+            tab.add_lines(lines)
+            app.processEvents()
+            times.append(time.perf_counter() - t0)
+            tab.deleteLater()
+            app.processEvents()
+        _report("QuoteInfoTab.add_lines", times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Engineering Checklist benchmarks")
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    p = sub.add_parser("startup", help="MainWindow construction and first show")
+    p.add_argument("--runs", type=int, default=5)
+    p.add_argument("--eager", action="store_true", help="build every tab up front")
+    p.add_argument("--no-imports", action="store_true", help="skip the import-time audit")
+
+    p = sub.add_parser("imports", help="-X importtime audit of launch.py")
+    p.add_argument("--target", default="launch")
+    p.add_argument("--top", type=int, default=15)
+
+    p = sub.add_parser("questions", help="question-bank loaders")
+    p.add_argument("--count", type=int, default=400)
+    p.add_argument("--runs", type=int, default=5)
+
+    p = sub.add_parser("checklist", help="Checklist tab build / load / clear")
+    p.add_argument("--count", type=int, default=400)
+    p.add_argument("--runs", type=int, default=5)
+
+    p = sub.add_parser("quoteinfo", help="Quote Info tab load / read back / clear")
+    p.add_argument("--count", type=int, default=200)
+    p.add_argument("--runs", type=int, default=5)
+    p.add_argument("--share-3d", type=float, default=0.05, help="fraction of lines with 3D enabled")
+
+    p = sub.add_parser("keystrokes", help="typing into a 3D cost panel")
+    p.add_argument("--runs", type=int, default=5)
+
+    p = sub.add_parser("mesh", help="STL load + volume/area/bbox")
+    p.add_argument("--triangles", type=int, default=2_000_000)
+    p.add_argument("--runs", type=int, default=5)
+
+    p = sub.add_parser("packing", help="build-plate estimate, 1-10,000 parts")
+    p.add_argument("--runs", type=int, default=5)
+
+    p = sub.add_parser("paste", help="screenshot paste: GUI-thread time")
+    p.add_argument("--width", type=int, default=7680)
+    p.add_argument("--height", type=int, default=2160)
+    p.add_argument("--runs", type=int, default=5)
+
+    p = sub.add_parser("codec", help="adaptive screenshot encoding sizes")
+    p.add_argument("--width", type=int, default=2560)
+    p.add_argument("--height", type=int, default=1440)
+    p.add_argument("--runs", type=int, default=3)
+
+    p = sub.add_parser("thumbs", help="opening vendor cards with screenshots")
+    p.add_argument("--count", type=int, default=40)
+    p.add_argument("--runs", type=int, default=3)
+
+    p = sub.add_parser("pixcache", help="\"View\" through the decoded-pixmap LRU")
+    p.add_argument("--count", type=int, default=30)
+    p.add_argument("--budget-mb", type=float, default=128)
+    p.add_argument("--views", type=int, default=200)
+
+    p = sub.add_parser("viewer", help="opening / zooming a huge screenshot")
+    p.add_argument("--width", type=int, default=16000)
+    p.add_argument("--height", type=int, default=12000)
+    p.add_argument("--runs", type=int, default=3)
+
+    p = sub.add_parser("dedupe", help="archive duplicate-screenshot report")
+    p.add_argument("--files", type=int, default=60)
+    p.add_argument("--per-file", type=int, default=3)
+    p.add_argument("--runs", type=int, default=3)
+
+    p = sub.add_parser("cards", help="Vendor Quotes load / resize with lazy cards")
+    p.add_argument("--count", type=int, default=60)
+    p.add_argument("--runs", type=int, default=3)
+
+    p = sub.add_parser("vendors", help="vendor directory build / type-to-filter / add")
+    p.add_argument("--count", type=int, default=800)
+    p.add_argument("--cards", type=int, default=60)
+    p.add_argument("--runs", type=int, default=5)
+
+    p = sub.add_parser("usage", help="vendor usage index: build / refresh / rank")
+    p.add_argument("--files", type=int, default=2000)
+    p.add_argument("--vendors", type=int, default=800)
+    p.add_argument("--runs", type=int, default=5)
+
+    p = sub.add_parser("pricebreaks", help="price-break parsing and vendor comparison matrix")
+    p.add_argument("--vendors", type=int, default=12)
+    p.add_argument("--parts", type=int, default=8)
+    p.add_argument("--runs", type=int, default=5)
+
+    p = sub.add_parser("bom", help="BOM import into Quote Info")
+    p.add_argument("--count", type=int, default=1000)
+    p.add_argument("--runs", type=int, default=5)
+
+    args = parser.parse_args(argv)
+    if args.bench == "startup":
+        bench_startup(runs=args.runs, eager=args.eager, imports=not args.no_imports)
+    elif args.bench == "imports":
+        bench_imports(target=args.target, top=args.top)
+    elif args.bench == "questions":
+        bench_questions(count=args.count, runs=args.runs)
+    elif args.bench == "checklist":
+        bench_checklist(count=args.count, runs=args.runs)
+    elif args.bench == "quoteinfo":
+        bench_quote_info(count=args.count, runs=args.runs, share_3d=args.share_3d)
+    elif args.bench == "keystrokes":
+        bench_keystrokes(runs=args.runs)
+    elif args.bench == "mesh":
+        bench_mesh(triangles=args.triangles, runs=args.runs)
+    elif args.bench == "packing":
+        bench_packing(runs=args.runs)
+    elif args.bench == "paste":
+        bench_paste(width=args.width, height=args.height, runs=args.runs)
+    elif args.bench == "codec":
+        bench_codec(width=args.width, height=args.height, runs=args.runs)
+    elif args.bench == "thumbs":
+        bench_thumbs(count=args.count, runs=args.runs)
+    elif args.bench == "pixcache":
+        bench_pixcache(count=args.count, budget_mb=args.budget_mb, views=args.views)
+    elif args.bench == "viewer":
+        bench_viewer(width=args.width, height=args.height, runs=args.runs)
+    elif args.bench == "dedupe":
+        bench_dedupe(files=args.files, per_file=args.per_file, runs=args.runs)
+    elif args.bench == "cards":
+        bench_cards(count=args.count, runs=args.runs)
+    elif args.bench == "vendors":
+        bench_vendors(count=args.count, cards=args.cards, runs=args.runs)
+    elif args.bench == "usage":
+        bench_usage(files=args.files, vendors=args.vendors, runs=args.runs)
+    elif args.bench == "pricebreaks":
+        bench_pricebreaks(vendors=args.vendors, parts=args.parts, runs=args.runs)
+    elif args.bench == "bom":
+        bench_bom(count=args.count, runs=args.runs)
+
+
+if __name__ == "__main__":
+    main()
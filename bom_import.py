@@ -0,0 +1,181 @@
+"""
+BOM import for Quote Info.
+
+Reads a customer BOM (CSV or XLSX), maps its columns onto the four Quote Info
+fields, cleans and de-duplicates drawing numbers with one batch lookup in the
+drawings index, and returns ready-made Quote Info rows so the tab can insert
+them in a single model update.
+
+XLSX files are streamed with openpyxl's read-only mode.
+"""
+import os
+import csv
+
+from utilities import lazy_import, resolve_drawings_batch
+
+openpyxl = lazy_import("openpyxl")
+
+FIELDS = ["drawing", "material", "quantity", "customer_pn"]
+FIELD_LABELS = {
+    "drawing": "Drawing Number",
+    "material": "Material",
+    "quantity": "Quantity",
+    "customer_pn": "Customer Part Number",
+}
+
+# Header text (lower case, punctuation stripped) -> field. First match wins.
+HEADER_SYNONYMS = {
+    "drawing": ["drawing number", "drawing", "drawing no", "dwg", "dwg no", "part number", "part no", "part"],
+    "material": ["material", "matl", "mat", "material description", "description"],
+    "quantity": ["quantity", "qty", "qty per", "count", "eau", "annual usage"],
+    "customer_pn": ["customer part number", "customer pn", "cust pn", "customer part", "cust part no", "customer item"],
+}
+
+HEADER_SCAN_ROWS = 10  # look this far down for the header row
+
+
+def _header_key(value):
+    text = str(value or "").lower().replace("#", " no ").replace(".", " ").replace("_", " ")
+    return " ".join(text.split())
+
+
+def read_table(path):
+    """Return all rows of the first sheet / the CSV as lists of strings."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".xlsx", ".xlsm"):
+        wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        try:
+            ws = wb.worksheets[0]
+            return [
+                ["" if v is None else str(v).strip() for v in row]
+                for row in ws.iter_rows(values_only=True)
+            ]
+        finally:
+            wb.close()
+    try:
+        return _read_csv(path, "utf-8-sig")
+    except UnicodeDecodeError:
+        return _read_csv(path, "cp1252")   # Excel's "CSV" on Windows (°, µ, ±)
+
+
+def _read_csv(path, encoding):
+    with open(path, "r", encoding=encoding, newline="") as f:
+        sample = f.read(4096)
+        f.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t|")
+        except csv.Error:
+            dialect = csv.excel
+        return [[cell.strip() for cell in row] for row in csv.reader(f, dialect)]
+
+
+def find_header(rows):
+    """Index of the row that looks most like a header (most recognised column names)."""
+    known = {syn for syns in HEADER_SYNONYMS.values() for syn in syns}
+    best, best_hits = 0, 0
+    for i, row in enumerate(rows[:HEADER_SCAN_ROWS]):
+        hits = sum(1 for cell in row if _header_key(cell) in known)
+        if hits > best_hits:
+            best, best_hits = i, hits
+    return best
+
+
+def guess_mapping(header):
+    """{field: column index or None} from the header row's text."""
+    keys = [_header_key(h) for h in header]
+    mapping, used = {}, set()
+    for field in FIELDS:
+        mapping[field] = None
+        for syn in HEADER_SYNONYMS[field]:
+            col = next((i for i, k in enumerate(keys) if k == syn and i not in used), None)
+            if col is not None:
+                mapping[field] = col
+                used.add(col)
+                break
+    return mapping
+
+
+def _quantity(text):
+    """'10', '10.0', '1,000' -> (number, display text); non-numbers keep their text."""
+    text = (text or "").strip()
+    try:
+        value = float(text.replace(",", ""))
+    except ValueError:
+        return None, text
+    return value, (str(int(value)) if value.is_integer() else f"{value:g}")
+
+
+def build_lines(rows, mapping, drawings_folder="P:/PDF Drawings"):
+    """
+    Turn data rows into Quote Info rows.
+
+    Drawing numbers are cleaned (upper case, rev suffix dropped) and resolved in
+    one batch. Rows that share a drawing, material and customer PN are merged
+    and their quantities added. Returns (lines, stats) where stats has
+    "rows", "blank", "merged", "unresolved" (drawings not in the index) and
+    "unsummed" (merged drawings whose quantities weren't all numbers, so the
+    line keeps the first row's quantity or the sum of the numeric ones).
+    """
+    def cell(row, field):
+        col = mapping.get(field)
+        return row[col].strip() if col is not None and col < len(row) else ""
+
+    raw = []
+    blank = 0
+    for row in rows:
+        values = {field: cell(row, field) for field in FIELDS}
+        if not values["drawing"]:
+            blank += 1
+            continue
+        raw.append(values)
+
+    resolved = resolve_drawings_batch({v["drawing"] for v in raw}, drawings_folder)
+
+    merged = {}
+    order = []
+    unsummed = set()
+    for values in raw:
+        cleaned, root, _rev = resolved[values["drawing"]]
+        key = (root, values["material"].upper(), values["customer_pn"].upper())
+        qty_value, qty_text = _quantity(values["quantity"])
+        if key in merged:
+            entry = merged[key]
+            if entry["qty"] is not None and qty_value is not None:
+                entry["qty"] += qty_value
+            else:
+                unsummed.add(entry["drawing"])
+            entry["count"] += 1
+            continue
+        merged[key] = {"drawing": cleaned, "material": values["material"], "qty": qty_value,
+                       "qty_text": qty_text, "customer_pn": values["customer_pn"], "count": 1}
+        order.append(key)
+
+    lines = []
+    for key in order:
+        entry = merged[key]
+        qty = entry["qty_text"]
+        if entry["count"] > 1 and entry["qty"] is not None:
+            qty = _quantity(str(entry["qty"]))[1]
+        lines.append({
+            "include": True,
+            "fields": [entry["drawing"], entry["material"], qty, entry["customer_pn"]],
+            "enable_3d": False,
+            "stratasys": {},
+            "formlabs": {},
+        })
+
+    unresolved = sorted({resolved[v["drawing"]][0] for v in raw if resolved[v["drawing"]][2] is None})
+    stats = {"rows": len(raw) + blank, "blank": blank, "merged": len(raw) - len(lines), "unresolved": unresolved,
+             "unsummed": sorted(unsummed)}
+    return lines, stats
+
+
+def import_bom(path, mapping=None, drawings_folder="P:/PDF Drawings"):
+    """Read, map and resolve a BOM file in one go. Returns (lines, stats)."""
+    rows = read_table(path)
+    if not rows:
+        return [], {"rows": 0, "blank": 0, "merged": 0, "unresolved": [], "unsummed": []}
+    header_row = find_header(rows)
+    if mapping is None:
+        mapping = guess_mapping(rows[header_row])
+    return build_lines(rows[header_row + 1:], mapping, drawings_folder)
@@ -1,19 +1,201 @@
 import os
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QScrollArea, QLabel, QLineEdit,
-    QCheckBox, QButtonGroup, QPushButton, QFrame, QSizePolicy, QCompleter
+    QFrame, QSizePolicy, QCompleter, QListView, QStyledItemDelegate,
+    QStyle, QStyleOptionButton, QApplication, QAbstractItemView
 )
-from PySide6.QtCore import Qt, QEvent, QTimer
-from PySide6.QtGui import QFontMetrics
-import openpyxl
+from PySide6.QtCore import (
+    Qt, QEvent, QTimer, QAbstractListModel, QModelIndex, QRect, QSize, Signal
+)
+from PySide6.QtGui import QFontMetrics, QFont, QColor
 from utilities import require_file
+import doc_cache
+import question_bank
 
 EXCEL_PATH = r"P:\ENGINEERING\Design Checklist\supporting_documents\checklist_questions.xlsx"
+SALES_LIST_PATH = r"P:\ENGINEERING\Design Checklist\supporting_documents\sales_list.txt"
 
 
 # Cap for the four top text fields (adjust if you want them a bit wider/narrower)
 TOP_FIELD_MAX_W = 380
 
+# ---- Supporting-file parser (plain data; also run off-thread by doc_cache) ----
+def read_sales_names(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+# ---- Answers: stored as compact codes, 0 = unanswered ----
+ANSWERS = ["Yes", "No", "N/A"]
+ANSWER_CODES = {a: i + 1 for i, a in enumerate(ANSWERS)}
+
+NOTE_ROLE = Qt.UserRole + 1
+ANSWER_ROLE = Qt.UserRole + 2
+
+
+class QuestionListModel(QAbstractListModel):
+    """
+    One category's questions plus a compact answer array (one byte per question).
+    Load/clear are a slice assignment and a single dataChanged.
+    """
+    answerChanged = Signal(int)  # row toggled by the user
+
+    def __init__(self, category, questions, parent=None):
+        super().__init__(parent)
+        self.category = category
+        self.questions = [(q, note) for q, note, _ in questions]
+        self.ids = [qid for _, _, qid in questions]  # stable question-bank IDs
+        self.answers = bytearray(len(self.questions))
+        self.read_only = False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.questions)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        question, note = self.questions[index.row()]
+        if role == Qt.DisplayRole:
+            return question
+        if role == NOTE_ROLE:
+            return note
+        if role == ANSWER_ROLE:
+            return self.answers[index.row()]
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled if not self.read_only else Qt.NoItemFlags
+
+    def _changed_all(self):
+        if self.questions:
+            self.dataChanged.emit(self.index(0), self.index(len(self.questions) - 1), [ANSWER_ROLE])
+
+    def toggle(self, row, code):
+        """User click: pick an answer, or clear it if it's already picked."""
+        if self.read_only:
+            return
+        self.answers[row] = 0 if self.answers[row] == code else code
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx, [ANSWER_ROLE])
+        self.answerChanged.emit(row)
+
+    def assign(self, codes, read_only=False):
+        self.answers[:] = codes
+        self.read_only = read_only
+        self._changed_all()
+
+
+class QuestionDelegate(QStyledItemDelegate):
+    """Paints question, note and Yes/No/N/A toggles; clicks are hit-tested, no widgets."""
+    BTN_W = 62
+    BTN_H = 24
+    BTN_SPACING = 10
+    MARGINS = (2, 0, 2, 10)  # left, top, right, bottom (matches the old wrapper layout)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.q_font = QFont()
+        self.q_font.setPixelSize(13)
+        self.n_font = QFont()
+        self.n_font.setPixelSize(11)
+        self.n_font.setItalic(True)
+        self.q_fm = QFontMetrics(self.q_font)
+        self.n_fm = QFontMetrics(self.n_font)
+
+    def _rects(self, rect, has_note):
+        left, top, _, _ = self.MARGINS
+        x, y = rect.x() + left, rect.y() + top
+        q_rect = QRect(x, y, rect.width() - left, self.q_fm.height())
+        y += self.q_fm.height() + 2
+        n_rect = None
+        if has_note:
+            n_rect = QRect(x, y, rect.width() - left, self.n_fm.height())
+            y += self.n_fm.height() + 2
+        btns = [
+            QRect(x + i * (self.BTN_W + self.BTN_SPACING), y, self.BTN_W, self.BTN_H)
+            for i in range(len(ANSWERS))
+        ]
+        return q_rect, n_rect, btns
+
+    def sizeHint(self, option, index):
+        question = index.data(Qt.DisplayRole) or ""
+        note = index.data(NOTE_ROLE) or ""
+        left, top, right, bottom = self.MARGINS
+        h = top + self.q_fm.height() + 2 + self.BTN_H + bottom
+        w = self.q_fm.horizontalAdvance(question)
+        if note:
+            h += self.n_fm.height() + 2
+            w = max(w, self.n_fm.horizontalAdvance(note))
+        w = max(w, len(ANSWERS) * (self.BTN_W + self.BTN_SPACING))
+        return QSize(left + w + right, h)
+
+    def paint(self, painter, option, index):
+        note = index.data(NOTE_ROLE) or ""
+        code = index.data(ANSWER_ROLE) or 0
+        enabled = bool(index.flags() & Qt.ItemIsEnabled)
+        q_rect, n_rect, btns = self._rects(option.rect, bool(note))
+
+        painter.save()
+        painter.setFont(self.q_font)
+        painter.setPen(option.palette.color(option.palette.ColorRole.Text))
+        painter.drawText(q_rect, Qt.AlignLeft | Qt.AlignVCenter, index.data(Qt.DisplayRole) or "")
+        if n_rect is not None:
+            painter.setFont(self.n_font)
+            painter.setPen(QColor("gray"))
+            painter.drawText(n_rect, Qt.AlignLeft | Qt.AlignVCenter, note)
+
+        style = option.widget.style() if option.widget else QApplication.style()
+        painter.setFont(self.q_font)
+        for i, rect in enumerate(btns):
+            btn = QStyleOptionButton()
+            btn.rect = rect
+            btn.text = ANSWERS[i]
+            btn.palette = option.palette
+            btn.fontMetrics = self.q_fm
+            btn.state = QStyle.State_Raised
+            if enabled:
+                btn.state |= QStyle.State_Enabled
+            btn.state |= QStyle.State_On if code == i + 1 else QStyle.State_Off
+            if code == i + 1:
+                btn.state |= QStyle.State_Sunken
+            style.drawControl(QStyle.CE_PushButton, btn, painter, option.widget)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton
+                and index.flags() & Qt.ItemIsEnabled):
+            _, _, btns = self._rects(option.rect, bool(index.data(NOTE_ROLE)))
+            pos = event.position().toPoint()
+            for i, rect in enumerate(btns):
+                if rect.contains(pos):
+                    model.toggle(index.row(), i + 1)
+                    return True
+        return False
+
+
+class QuestionListView(QListView):
+    """Non-scrolling list that sizes itself to its rows (the tab's scroll area scrolls)."""
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.setModel(model)
+        self.setItemDelegate(QuestionDelegate(self))
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setStyleSheet("QListView { background: transparent; }")
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.fit_to_contents()
+
+    def fit_to_contents(self):
+        rows = self.model().rowCount()
+        height = sum(self.sizeHintForRow(r) for r in range(rows))
+        self.setFixedHeight(max(height, 1) + 2 * self.frameWidth())
+        self.setMinimumWidth(self.sizeHintForColumn(0))
+
+
 # ---- Auto width with dynamic max (passed in at call time) ----
 def auto_resize_lineedit(lineedit, min_width=120, extra=18, max_width=None):
     text = lineedit.text() or lineedit.placeholderText() or ""
@@ -32,7 +214,9 @@ class ChecklistTab(QWidget):
         self.dirty_tracker = dirty_tracker
         self._loading = False
         self.category_frames = {}
-        self.question_widgets = {}
+        self.question_models = {}
+        self._id_index = {}  # question ID -> (category, row)
+        self.bank = None
         self.top_fields = []
         self.init_ui()
 
@@ -75,11 +259,9 @@ class ChecklistTab(QWidget):
         self.update_topfield_caps()
 
         # ----- Sales/CSR autocomplete -----
-        sales_file = r"P:\ENGINEERING\Design Checklist\supporting_documents\sales_list.txt"
-        if os.path.exists(sales_file):
-            with open(sales_file, "r", encoding="utf-8") as f:
-                names = [line.strip() for line in f if line.strip()]
-            names.sort(key=lambda s: s.lower())
+        names = doc_cache.get("sales_list", SALES_LIST_PATH, read_sales_names)
+        if names:
+            names = sorted(names, key=lambda s: s.lower())
 
             comp = QCompleter(names)
             comp.setCaseSensitivity(Qt.CaseInsensitive)
@@ -101,11 +283,8 @@ class ChecklistTab(QWidget):
         scroll_area.setWidget(scroll_content)
         main_layout.addWidget(scroll_area, stretch=1)
 
-        # Load questions from Excel and group
-        questions = self.load_questions_from_excel()
-        grouped = {}
-        for q in questions:
-            grouped.setdefault(q["category"], []).append(q)
+        # Questions come pre-grouped by category from the (cached) question bank
+        grouped = self.bank = question_bank.load_question_bank(EXCEL_PATH)
 
         # ----- General Questions -----
         general_frame = QFrame()
@@ -115,8 +294,7 @@ class ChecklistTab(QWidget):
         general_label = QLabel("General Questions")
         general_label.setStyleSheet("font-weight: bold; font-size: 15px; text-decoration: underline; margin-bottom: 4px;")
         general_layout.addWidget(general_label)
-        for q in grouped.get("General", []):
-            self.add_question(general_layout, "General", q["question"], q["note"])
+        self.add_question_list(general_layout, "General", grouped.get("General", []))
         scroll_layout.addWidget(general_frame)
 
         # ----- CD, MT, MIS side-by-side -----
@@ -139,8 +317,7 @@ class ChecklistTab(QWidget):
                 header_lbl.setStyleSheet("font-weight: bold; text-decoration: underline; font-size: 14px; margin-bottom: 2px;")
                 frame.layout().addWidget(header_lbl)
 
-                for q in grouped[category]:
-                    self.add_question(frame.layout(), category, q["question"], q["note"])
+                self.add_question_list(frame.layout(), category, grouped.get(category))
 
             category_layout.addWidget(frame, alignment=Qt.AlignTop)
 
@@ -171,85 +348,21 @@ class ChecklistTab(QWidget):
         if self.dirty_tracker:
             self.dirty_tracker.mark_dirty()
 
-    def load_questions_from_excel(self):
-        # If the Excel file with questions is missing, just return an empty list.
-        # The tab will still load; you just won't see any questions.
-        if not os.path.exists(EXCEL_PATH):
-            return []
-
-        wb = openpyxl.load_workbook(EXCEL_PATH)
-        ws = wb.active
-        questions = []
-        for row in ws.iter_rows(min_row=2, values_only=True):
-            if not any(row):
-                continue
-            category, question, note = row[:3]
-            if not category or not question:
-                continue
-            questions.append({
-                "category": category.strip(),
-                "question": question.strip(),
-                "note": (note or "").strip()
-            })
-        return questions
-
-
-
-    def add_question(self, parent_layout, category, question, note=None):
-        wrapper = QWidget()
-        layout = QVBoxLayout(wrapper)
-        layout.setContentsMargins(2, 0, 2, 10)
-        layout.setSpacing(2)
-
-        label = QLabel(question)
-        label.setStyleSheet("font-size: 13px; margin-bottom: 0;")
-        layout.addWidget(label, alignment=Qt.AlignLeft)
-        if note:
-            note_lbl = QLabel(note)
-            note_lbl.setStyleSheet("font-style: italic; color: gray; font-size: 11px; margin-bottom: 0;")
-            layout.addWidget(note_lbl, alignment=Qt.AlignLeft)
-
-        btn_group = QButtonGroup(wrapper)
-        btn_group.setExclusive(False)
-        btn_row = QWidget()
-        btn_layout = QHBoxLayout(btn_row)
-        btn_layout.setContentsMargins(0, 0, 0, 0)
-        btn_layout.setSpacing(10)
-
-        answers = ["Yes", "No", "N/A"]
-        buttons = {}
-
-        def on_btn_clicked(btn, qkey):
-            if self._loading:
-                return
-            if btn.isChecked():
-                for other in btn_group.buttons():
-                    if other is not btn:
-                        other.setChecked(False)
-                self.question_widgets[qkey]["selected"] = btn.text()
-            else:
-                self.question_widgets[qkey]["selected"] = None
-            if self.dirty_tracker:
-                self.dirty_tracker.mark_dirty()
-
-        qkey = (category, question)
-        self.question_widgets[qkey] = {"selected": None, "buttons": {}, "btn_group": btn_group}
-
-        for answer in answers:
-            btn = QPushButton(answer)
-            btn.setCheckable(True)
-            btn.setStyleSheet("font-size: 13px; padding: 1px 12px;")
-            btn.setFixedWidth(62)
-            btn_group.addButton(btn)
-            btn.clicked.connect(lambda checked, b=btn, qkey=qkey: on_btn_clicked(b, qkey))
-            btn_layout.addWidget(btn)
-            buttons[answer] = btn
-
-        btn_layout.addStretch()
-        layout.addWidget(btn_row, alignment=Qt.AlignLeft)
-
-        self.question_widgets[qkey]["buttons"] = buttons
-        parent_layout.addWidget(wrapper)
+
+
+    def add_question_list(self, parent_layout, category, questions):
+        model = QuestionListModel(category, questions, self)
+        model.answerChanged.connect(self.on_answer_changed)
+        self.question_models[category] = model
+        for row, qid in enumerate(model.ids):
+            self._id_index[qid] = (category, row)
+        parent_layout.addWidget(QuestionListView(model))
+
+    def on_answer_changed(self, _row):
+        if self._loading:
+            return
+        if self.dirty_tracker:
+            self.dirty_tracker.mark_dirty()
 
     # ---------- SAVE (keep legacy order for Saved Checklists) ----------
     def get_checklist_data(self):
@@ -265,11 +378,22 @@ class ChecklistTab(QWidget):
         return {
             "top_fields": top_fields_legacy,
             "categories": {},
+            # Compact form: {question ID: answer code}. Load reads both forms.
+            "answer_codes": {
+                str(qid): code
+                for model in self.question_models.values()
+                for qid, code in zip(model.ids, model.answers)
+                if code
+            },
+            # Legacy form, still written so builds that predate answer_codes
+            # (the checklists are shared) show the answers and don't drop them
+            # on their next save. Remove once every build reads answer_codes.
             "answers": {
-                f"{cat}::{question}": data["selected"]
-                for (cat, question), data in self.question_widgets.items()
-                if data["selected"]
-            }
+                question_bank.question_key(cat, question): ANSWERS[code - 1]
+                for cat, model in self.question_models.items()
+                for (question, _note), code in zip(model.questions, model.answers)
+                if code
+            },
         }
 
     # ---------- LOAD (legacy -> new UI order) ----------
@@ -296,18 +420,19 @@ class ChecklistTab(QWidget):
                 auto_resize_lineedit(field, min_width=140, extra=22, max_width=maxw)
                 field.setReadOnly(read_only)
 
-        # Answers
-        for key, answer in data.get("answers", {}).items():
-            cat, question = key.split("::", 1)
-            qkey = (cat, question)
-            if qkey in self.question_widgets:
-                self.question_widgets[qkey]["selected"] = answer
-                btns = self.question_widgets[qkey]["buttons"]
-                for btn in btns.values():
-                    should_be_checked = btn.text() == answer
-                    if btn.isChecked() != should_be_checked:
-                        btn.setChecked(should_be_checked)
-                    btn.setEnabled(not read_only)
+        # Answers: build each category's code array, then assign it in one go.
+        # Keys are question IDs (or legacy "Category::Question" text); the bank
+        # resolves old IDs/wording through its alias table.
+        codes = {cat: bytearray(len(m.questions)) for cat, m in self.question_models.items()}
+        pairs = [(k, ANSWER_CODES.get(a, 0)) for k, a in (data.get("answers") or {}).items()]
+        pairs += list((data.get("answer_codes") or {}).items())
+        for key, code in pairs:
+            loc = self._id_index.get(self.bank.resolve(key)) if self.bank else None
+            if loc is not None and code in (1, 2, 3):
+                cat, row = loc
+                codes[cat][row] = code
+        for cat, model in self.question_models.items():
+            model.assign(codes[cat], read_only=read_only)
 
         self.setUpdatesEnabled(True)
         self._loading = False
@@ -322,14 +447,8 @@ class ChecklistTab(QWidget):
             if field.isReadOnly():
                 field.setReadOnly(False)
 
-        for qkey in self.question_widgets:
-            self.question_widgets[qkey]["selected"] = None
-            btns = self.question_widgets[qkey]["buttons"]
-            for btn in btns.values():
-                if btn.isChecked():
-                    btn.setChecked(False)
-                if not btn.isEnabled():
-                    btn.setEnabled(True)
+        for model in self.question_models.values():
+            model.assign(bytes(len(model.questions)), read_only=False)
 
         self.setUpdatesEnabled(True)
         self._loading = False
@@ -345,6 +464,7 @@ class ChecklistTab(QWidget):
 
 # ---- Factory functions for external API ----
 _tab_instance = None
+_tab_builder = None
 
 def create_checklist_tab(tab_widget: QWidget, dirty_tracker=None):
     global _tab_instance
@@ -353,13 +473,30 @@ def create_checklist_tab(tab_widget: QWidget, dirty_tracker=None):
     layout.setContentsMargins(0, 0, 0, 0)
     layout.addWidget(_tab_instance)
 
+def set_tab_builder(builder):
+    """Register the callable launch.py uses to build this tab on first use."""
+    global _tab_builder
+    _tab_builder = builder
+
+def ensure_checklist_tab():
+    """Return the tab instance, building it now if construction was deferred."""
+    if _tab_instance is None and _tab_builder is not None:
+        _tab_builder()
+    return _tab_instance
+
 def get_checklist_data():
-    return _tab_instance.get_checklist_data() if _tab_instance else {}
+    tab = ensure_checklist_tab()
+    return tab.get_checklist_data() if tab else {}
 
 def load_checklist_data(data, read_only=False):
-    if _tab_instance:
-        _tab_instance.load_checklist_data(data, read_only=read_only)
+    tab = ensure_checklist_tab()
+    if tab:
+        tab.load_checklist_data(data, read_only=read_only)
 
 def clear_checklist_tab():
     if _tab_instance:
         _tab_instance.clear_checklist_tab()
+
+def get_customer_name():
+    """Customer Name top field ("" until the tab is built)."""
+    return _tab_instance.top_fields[1].text().strip() if _tab_instance else ""
@@ -0,0 +1,314 @@
+"""
+3D print costing for Quote Info lines.
+
+Prices, markup and hourly rates come from a versioned JSON table on the share
+(served through the warm-start cache like the other supporting documents):
+
+    {
+      "version": "2025-01",
+      "markup": 1.3,
+      "stratasys": {"prices": {"985 AB": 0.3465, ...}, "hourly_rate": 20},
+      "formlabs":  {"prices": {"RS-F2": 0.349},     "hourly_rate": 20}
+    }
+
+Missing keys fall back to the built-in table (the old constants in
+utilities), so a partial file only overrides what it lists.
+
+Costs are computed for many lines at once: the Stratasys quantities form a
+lines x materials matrix that is multiplied by the price vector.
+"""
+import os
+import json
+import argparse
+from datetime import datetime
+
+from utilities import (
+    lazy_import, STRATASYS_PRICES, FORMLABS_PRICE, STRATASYS_ORDER,
+    lock_checklist, unlock_checklist
+)
+import doc_cache
+import user_settings
+
+np = lazy_import("numpy")
+
+PRICE_TABLE_PATH = r"P:\ENGINEERING\Design Checklist\supporting_documents\print_price_table.json"
+CHECKLISTS_DIR = r"P:\ENGINEERING\Design Checklist\json_files"
+CACHE_KEY = "print_price_table"
+
+BUILTIN_TABLE = {
+    "version": "builtin",
+    "markup": 1.3,
+    "stratasys": {"prices": dict(STRATASYS_PRICES), "hourly_rate": 20.0},
+    "formlabs": {"prices": {"RS-F2": FORMLABS_PRICE}, "hourly_rate": 20.0},
+}
+
+
+def read_price_table(path):
+    """Parse the price table file; the built-in table if the file is missing."""
+    if not os.path.exists(path):
+        return BUILTIN_TABLE
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class PriceTable:
+    """Price vector, markup and rates for one version of the table."""
+    def __init__(self, raw=None):
+        raw = raw or {}
+        s = raw.get("stratasys") or {}
+        f = raw.get("formlabs") or {}
+        s_prices = dict(BUILTIN_TABLE["stratasys"]["prices"], **(s.get("prices") or {}))
+        f_prices = dict(BUILTIN_TABLE["formlabs"]["prices"], **(f.get("prices") or {}))
+
+        self.version = str(raw.get("version") or "unversioned")
+        self.markup = float(raw.get("markup", BUILTIN_TABLE["markup"]))
+        # Same column order as the Stratasys grid in Quote Info
+        self.stratasys_prices = [float(s_prices.get(m, 0.0)) for m in STRATASYS_ORDER]
+        self.stratasys_rate = float(s.get("hourly_rate", BUILTIN_TABLE["stratasys"]["hourly_rate"]))
+        self.formlabs_price = float(f_prices.get("RS-F2", 0.0))
+        self.formlabs_rate = float(f.get("hourly_rate", BUILTIN_TABLE["formlabs"]["hourly_rate"]))
+        self.printers = raw.get("printers") or {}  # build-volume overrides, see packing.py
+
+    def __repr__(self):
+        return f"<PriceTable {self.version}>"
+
+
+_table = None
+
+
+def load_price_table(path=PRICE_TABLE_PATH, refresh=False):
+    """Current PriceTable. refresh=True re-reads the share instead of the local cache."""
+    global _table
+    if refresh:
+        doc_cache.invalidate(CACHE_KEY)
+        _table = None
+    if _table is None:
+        _table = PriceTable(doc_cache.get(CACHE_KEY, path, read_price_table))
+    return _table
+
+
+# ---------- Vectorized costing ----------
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def compute_costs(lines, table=None):
+    """
+    Costs for every line at once. Returns a dict of float arrays, one entry
+    per line: s_material, s_total, f_material, f_total.
+    """
+    table = table or load_price_table()
+    n = len(lines)
+    k = len(STRATASYS_ORDER)
+
+    s_qty = np.fromiter(
+        (_to_float(line["stratasys"].get(m)) for line in lines for m in STRATASYS_ORDER),
+        dtype=float, count=n * k
+    ).reshape(n, k)
+    s_time = np.fromiter((_to_float(line["stratasys"].get("Time (hrs)")) for line in lines), dtype=float, count=n)
+    f_qty = np.fromiter((_to_float(line["formlabs"].get("RS-F2")) for line in lines), dtype=float, count=n)
+    f_time = np.fromiter((_to_float(line["formlabs"].get("Time (hrs)")) for line in lines), dtype=float, count=n)
+
+    s_material = (s_qty @ np.asarray(table.stratasys_prices)) * table.markup
+    f_material = f_qty * (table.formlabs_price * table.markup)
+    return {
+        "s_material": s_material,
+        "s_total": s_material + s_time * table.stratasys_rate,
+        "f_material": f_material,
+        "f_total": f_material + f_time * table.formlabs_rate,
+    }
+
+
+def apply_costs(lines, table=None):
+    """
+    Write Material $ / 3D Cost into the line dicts. Returns the indexes of
+    lines whose written values changed.
+    """
+    if not lines:
+        return []
+    costs = compute_costs(lines, table)
+    changed = []
+    for i, line in enumerate(lines):
+        s, f = line["stratasys"], line["formlabs"]
+        new = (
+            f"${costs['s_material'][i]:.2f}", f"${costs['s_total'][i]:.2f}",
+            f"${costs['f_material'][i]:.2f}", f"${costs['f_total'][i]:.2f}",
+        )
+        old = (s.get("Material $"), s.get("3D Cost"), f.get("Material $"), f.get("3D Cost"))
+        if new != old:
+            s["Material $"], s["3D Cost"], f["Material $"], f["3D Cost"] = new
+            changed.append(i)
+    return changed
+
+
+# ---------- Incremental costing (one line being edited) ----------
+
+# Which outputs depend on which input
+_DEPENDS = {
+    "stratasys": {"Time (hrs)": ("3D Cost",)},
+    "formlabs": {"Time (hrs)": ("3D Cost",), "RS-F2": ("Material $", "3D Cost")},
+}
+_STRATASYS_MATERIAL_DEPS = ("Material $", "3D Cost")
+
+
+class LineCostCalc:
+    """
+    Costs for the line being edited in a 3D panel. Each input is parsed once
+    when it changes; recompute() only redoes the totals that depend on the
+    inputs changed since the last call and returns just the outputs whose
+    text changed.
+    """
+    def __init__(self, line):
+        self.line = line
+        self._values = {}
+        for printer, keys in (("stratasys", STRATASYS_ORDER + ["Time (hrs)"]), ("formlabs", ["RS-F2", "Time (hrs)"])):
+            for key in keys:
+                self._values[(printer, key)] = _to_float(line[printer].get(key))
+        self._dirty = set()   # (printer, output key)
+
+    def set_input(self, printer, key, text):
+        self.line[printer][key] = text
+        value = _to_float(text)
+        if self._values.get((printer, key)) == value:
+            return False
+        self._values[(printer, key)] = value
+        deps = _DEPENDS[printer].get(key, _STRATASYS_MATERIAL_DEPS if printer == "stratasys" else ())
+        self._dirty.update((printer, out) for out in deps)
+        return True
+
+    @property
+    def pending(self):
+        return bool(self._dirty)
+
+    def recompute(self, table=None):
+        """Returns {(printer, output key): new text} for the outputs that changed."""
+        if not self._dirty:
+            return {}
+        table = table or load_price_table()
+        v = self._values
+        results = {}
+        if ("stratasys", "Material $") in self._dirty or ("stratasys", "3D Cost") in self._dirty:
+            material = sum(v[("stratasys", m)] * p for m, p in zip(STRATASYS_ORDER, table.stratasys_prices)) * table.markup
+            results[("stratasys", "Material $")] = material
+            results[("stratasys", "3D Cost")] = material + v[("stratasys", "Time (hrs)")] * table.stratasys_rate
+        if ("formlabs", "Material $") in self._dirty or ("formlabs", "3D Cost") in self._dirty:
+            material = v[("formlabs", "RS-F2")] * table.formlabs_price * table.markup
+            results[("formlabs", "Material $")] = material
+            results[("formlabs", "3D Cost")] = material + v[("formlabs", "Time (hrs)")] * table.formlabs_rate
+        self._dirty.clear()
+
+        changed = {}
+        for (printer, key), amount in results.items():
+            text = f"${amount:.2f}"
+            if self.line[printer].get(key) != text:
+                self.line[printer][key] = text
+                changed[(printer, key)] = text
+        return changed
+
+
+def _money(text):
+    return _to_float(str(text or "").replace("$", "").replace(",", ""))
+
+
+def quote_total(lines):
+    """Sum of the Stratasys + Formlabs 3D Cost of the lines with 3D enabled."""
+    return sum(
+        _money(line["stratasys"].get("3D Cost")) + _money(line["formlabs"].get("3D Cost"))
+        for line in lines if line.get("enable_3d")
+    )
+
+
+def reprice_quote(lines, table=None):
+    """
+    Re-price every 3D line of a quote under `table` (default: current table).
+    Returns (changed_count, old_total, new_total).
+    """
+    lines_3d = [line for line in lines if line.get("enable_3d")]
+    old_total = quote_total(lines_3d)
+    changed = apply_costs(lines_3d, table)
+    return len(changed), old_total, quote_total(lines_3d)
+
+
+# ---------- Archive repricing ----------
+
+def _normalize_saved_line(row):
+    """Give a saved quote_info row the keys compute_costs reads."""
+    row.setdefault("stratasys", {})
+    row.setdefault("formlabs", {})
+    return row
+
+
+def reprice_checklist_file(path, table, write=True):
+    """
+    Re-price one saved checklist. Returns (changed_count, old_total, new_total),
+    or None if the file is locked by someone editing it or can't be read.
+    """
+    if write:
+        locked, _locker = lock_checklist(path)
+        if not locked:
+            return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        lines = [_normalize_saved_line(row) for row in data.get("quote_info") or [] if isinstance(row, dict)]
+        changed, old_total, new_total = reprice_quote(lines, table)
+        if write and changed:
+            data["price_table_version"] = table.version
+            # Same compact format and last_user stamp as a save from the app
+            tmp = path + ".tmp"
+            user_settings.save_combined_data(tmp, data)
+            os.replace(tmp, path)
+        return changed, old_total, new_total
+    except Exception as e:
+        print(f"[CostEngine] Failed to reprice {path}: {e}")
+        return None
+    finally:
+        if write:
+            unlock_checklist(path)
+
+
+def reprice_archive(folder=CHECKLISTS_DIR, table=None, write=True):
+    """
+    Re-price every saved checklist with 3D lines. Returns a list of
+    (filename, changed_count, old_total, new_total); skipped files have changed_count None.
+    """
+    table = table or load_price_table(refresh=True)
+    results = []
+    for name in sorted(os.listdir(folder)):
+        if not name.lower().endswith(".json"):
+            continue
+        result = reprice_checklist_file(os.path.join(folder, name), table, write=write)
+        if result is None:
+            results.append((name, None, 0.0, 0.0))
+        elif result[0]:
+            results.append((name,) + result)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Re-price saved checklists under the current 3D price table")
+    parser.add_argument("--folder", default=CHECKLISTS_DIR)
+    parser.add_argument("--table", default=PRICE_TABLE_PATH, help="price table JSON")
+    parser.add_argument("--dry-run", action="store_true", help="report changes without writing files")
+    args = parser.parse_args(argv)
+
+    table = PriceTable(read_price_table(args.table))
+    started = datetime.now()
+    results = reprice_archive(args.folder, table, write=not args.dry_run)
+    for name, changed, old_total, new_total in results:
+        if changed is None:
+            print(f"SKIPPED (locked/unreadable)  {name}")
+        else:
+            print(f"{changed:3d} line(s)  ${old_total:10.2f} -> ${new_total:10.2f}  {name}")
+    repriced = sum(1 for r in results if r[1])
+    action = "would change" if args.dry_run else "changed"
+    print(f"Price table {table.version}: {repriced} checklist(s) {action} "
+          f"in {(datetime.now() - started).total_seconds():.1f} s")
+
+
+if __name__ == "__main__":
+    main()
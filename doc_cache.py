@@ -0,0 +1,136 @@
+"""
+Local warm-start cache for the supporting documents read at launch.
+
+Each supporting file's parsed form (question rows, reference blocks with image
+bytes, name lists) is kept in its own JSON file under
+%APPDATA%\\EngineeringChecklist\\supporting_docs_cache, keyed by a short name,
+so storing one entry never rewrites the others. Every entry remembers the
+size and mtime of the source file so a single stat() decides whether it's
+still good:
+
+  - fresh entry            -> cached data, no parse
+  - stale entry            -> re-parsed now and stored (cached data if that fails)
+  - no entry               -> parsed now and stored
+  - share unreachable      -> cached data if there is any
+"""
+import os
+import re
+import json
+import threading
+
+import startup_profile
+
+APPDATA_DIR = os.environ.get("APPDATA") or os.path.expanduser("~")
+SETTINGS_DIR = os.path.join(APPDATA_DIR, "EngineeringChecklist")
+CACHE_DIR = os.path.join(SETTINGS_DIR, "supporting_docs_cache")
+LEGACY_BUNDLE_PATH = os.path.join(SETTINGS_DIR, "supporting_docs_cache.json")   # one file for every key
+CACHE_VERSION = 2
+
+_cache = {}             # key -> {"version", "path", "size", "mtime", "data"}, or None if there is no file
+_lock = threading.RLock()
+_legacy_checked = False
+
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+        return st.st_size, st.st_mtime
+    except Exception:
+        return None
+
+
+def _entry_path(key):
+    return os.path.join(CACHE_DIR, re.sub(r"[^\w.-]", "_", key) + ".json")
+
+
+def _entry(key):
+    """Load one key's entry from disk once per process."""
+    with _lock:
+        if key not in _cache:
+            try:
+                with open(_entry_path(key), "r", encoding="utf-8") as f:
+                    obj = json.load(f)
+                if obj.get("version") != CACHE_VERSION:
+                    raise ValueError("old cache format")
+                _cache[key] = obj
+            except Exception:
+                _cache[key] = None
+        return _cache[key]
+
+
+def _remove_legacy_bundle():
+    global _legacy_checked
+    if not _legacy_checked:
+        _legacy_checked = True
+        try:
+            os.remove(LEGACY_BUNDLE_PATH)
+        except OSError:
+            pass
+
+
+def _store(key, path, stat, data, encode):
+    entry = {
+        "version": CACHE_VERSION,
+        "path": path,
+        "size": stat[0] if stat else None,
+        "mtime": stat[1] if stat else None,
+        "data": encode(data) if encode else data,
+    }
+    target = _entry_path(key)
+    with _lock:
+        _cache[key] = entry
+        try:
+            _remove_legacy_bundle()
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp = target + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(entry, f, separators=(",", ":"))
+            os.replace(tmp, target)
+        except Exception as e:
+            print(f"[DocCache] Failed to write {target}: {e}")
+
+
+def _parse(path, parse):
+    with startup_profile.span(f"parse {os.path.basename(path)}", "file"):
+        return parse(path)
+
+
+def get(key, path, parse, encode=None, decode=None):
+    """
+    Return parse(path), served from the local cache while the source is unchanged.
+    encode/decode convert the parsed value to/from a JSON-safe form.
+    """
+    with startup_profile.span(f"stat {os.path.basename(path)}", "file"):
+        stat = _stat(path)
+    entry = _entry(key)
+
+    if entry is not None and entry.get("path") == path:
+        if stat is None or (entry.get("size"), entry.get("mtime")) == stat:
+            return decode(entry["data"]) if decode else entry["data"]
+        # Stale: the source was edited, so read it again now
+        try:
+            data = _parse(path, parse)
+        except Exception as e:
+            print(f"[DocCache] Re-reading {path} failed, using the cached copy: {e}")
+            return decode(entry["data"]) if decode else entry["data"]
+        _store(key, path, stat, data, encode)
+        return data
+
+    data = _parse(path, parse)
+    if stat is not None:
+        _store(key, path, stat, data, encode)
+    return data
+
+
+def invalidate(key=None):
+    """Drop one entry (or everything) so the next get() re-parses."""
+    with _lock:
+        keys = list(_cache) if key is None else [key]
+        if key is None and os.path.isdir(CACHE_DIR):
+            keys += [n[:-5] for n in os.listdir(CACHE_DIR) if n.endswith(".json")]
+        for k in set(keys):
+            _cache[k] = None
+            try:
+                os.remove(_entry_path(k))
+            except OSError:
+                pass
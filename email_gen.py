@@ -3,7 +3,6 @@ from __future__ import annotations
 import re
 from pathlib import Path
 from typing import Dict, List, Tuple
-import win32com.client as win32
 from PySide6.QtWidgets import QMessageBox
 
 from utilities import (
@@ -11,8 +10,12 @@ from utilities import (
     extract_numeric_part,
     rev_key,
     format_drawing_with_rev,
+    lazy_import,
 )
 
+# Outlook automation is only loaded when "Generate Email" is clicked
+win32 = lazy_import("win32com.client")
+
 ATTACH_ROOT = Path(r"P:\PDF Drawings")
 ALLOWED_EXTS = [".pdf", ".step", ".dwg", ".dxf", ".igs"]
 MAX_PAGE_IDX = 49  # supports _0.._49
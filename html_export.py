@@ -1,6 +1,7 @@
 import os
 import re
 from utilities import STRATASYS_ORDER
+from image_codec import mime_type
 
 def esc(txt):
     import html
@@ -238,7 +239,7 @@ def export_to_html(data, file_path):
             img_html = ""
             if len(row) > 2 and row[2]:
                 for img_b64 in row[2]:
-                    img_html += f'<img src="data:image/png;base64,{img_b64}">'
+                    img_html += f'<img src="data:{mime_type(img_b64)};base64,{img_b64}">'
             html.append(f'<pre style="white-space: pre-wrap; margin: 0 0 10px 0; font-family: inherit; font-size: 15px;">{esc(quote_text)}</pre>{img_html}')
             html.append('</div>')
 
@@ -0,0 +1,101 @@
+"""
+Adaptive encoding for vendor-quote screenshots.
+
+Tries palette PNG, RGB PNG and high-quality JPEG, and keeps the smallest one
+that still reads like the original (PSNR against the source pixels at or
+above MIN_PSNR_DB; lossless RGB PNG always passes). If the result doesn't fit
+the byte budget it was given, the image is scaled down in steps and tried
+again.
+
+Only QImage is used (plus NumPy for the PSNR), so this runs on worker threads.
+"""
+import math
+
+from PySide6.QtGui import QImage
+from PySide6.QtCore import Qt, QBuffer
+
+from utilities import lazy_import
+
+np = lazy_import("numpy")
+
+MIN_PSNR_DB = 36.0          # below this, small text starts to smear
+JPEG_QUALITIES = (92, 85)
+DOWNSCALE_STEP = 0.8
+MIN_DIM = 900               # never shrink the longest side below this for the budget
+
+
+def _encode(img, fmt, quality=-1):
+    buf = QBuffer()
+    buf.open(QBuffer.WriteOnly)
+    img.save(buf, fmt, quality)
+    return bytes(buf.data())
+
+
+def _pixels(img):
+    """H x W x 3 uint8 view of an image's RGB channels."""
+    img = img.convertToFormat(QImage.Format_RGB32)
+    w, h = img.width(), img.height()
+    arr = np.frombuffer(img.constBits(), dtype=np.uint8, count=img.bytesPerLine() * h)
+    return arr.reshape(h, img.bytesPerLine())[:, : w * 4].reshape(h, w, 4)[:, :, :3]
+
+
+def psnr(reference, candidate):
+    """Peak signal-to-noise ratio in dB between two same-size images (inf if identical)."""
+    a = _pixels(reference).astype(np.int16)
+    b = _pixels(candidate).astype(np.int16)
+    mse = float(np.mean((a - b) ** 2))
+    return math.inf if mse == 0 else 10.0 * math.log10(255.0 ** 2 / mse)
+
+
+def _candidates(img, min_psnr):
+    """Yield (data, fmt, psnr) for each encoding that passes the legibility check."""
+    rgb = img.convertToFormat(QImage.Format_RGB32)
+
+    palette = rgb.convertToFormat(QImage.Format_Indexed8, Qt.ThresholdDither | Qt.AvoidDither)
+    score = psnr(rgb, palette)
+    if score >= min_psnr:
+        yield _encode(palette, "PNG"), "png", score
+
+    yield _encode(rgb, "PNG"), "png", math.inf
+
+    for quality in JPEG_QUALITIES:
+        data = _encode(rgb, "JPG", quality)
+        decoded = QImage.fromData(data, "JPG")
+        score = psnr(rgb, decoded)
+        if score >= min_psnr:
+            yield data, "jpeg", score
+
+
+def encode_adaptive(img, budget=None, min_psnr=MIN_PSNR_DB):
+    """
+    Smallest legible encoding of `img`. Returns (data, info) where info has
+    "format", "psnr", "width", "height", "bytes" and "over_budget".
+    With a byte budget, the image is downscaled until it fits (down to MIN_DIM).
+    """
+    if img.hasAlphaChannel():
+        # Screenshots are opaque; flatten so every candidate sees the same pixels
+        img = img.convertToFormat(QImage.Format_RGB32)
+    while True:
+        best = None
+        for data, fmt, score in _candidates(img, min_psnr):
+            if best is None or len(data) < len(best[0]):
+                best = (data, fmt, score)
+        data, fmt, score = best
+        fits = budget is None or len(data) <= budget
+        longest = max(img.width(), img.height())
+        if fits or longest * DOWNSCALE_STEP < MIN_DIM:
+            return data, {
+                "format": fmt,
+                "psnr": score,
+                "width": img.width(),
+                "height": img.height(),
+                "bytes": len(data),
+                "over_budget": not fits,
+            }
+        target = int(longest * DOWNSCALE_STEP)
+        img = img.scaled(target, target, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def mime_type(b64):
+    """MIME type of a base64-encoded screenshot (PNG and JPEG are stored)."""
+    return "image/jpeg" if b64.startswith("/9j/") else "image/png"
@@ -0,0 +1,186 @@
+"""
+Duplicate detection for vendor-quote screenshots.
+
+Each screenshot gets two fingerprints:
+  - exact: SHA-1 of the stored base64 text (thumb_cache.image_key), and for a
+    fresh paste also the SHA-1 of its pixels, so pasting the same capture twice
+    is caught even though it is encoded again;
+  - perceptual: a 64-bit difference hash (dHash) of the image shrunk to 9x8
+    grey, which survives re-encoding, rescaling and small edits. Hashes at most
+    NEAR_DUPLICATE_BITS apart are treated as the same picture.
+
+The archive report hashes every screenshot in the checklist folder on a
+process pool and groups exact and near duplicates:
+
+    python image_dedupe.py --folder "P:\\ENGINEERING\\Design Checklist\\json_files"
+"""
+import os
+import json
+import base64
+import hashlib
+import argparse
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+from PySide6.QtGui import QImage
+from PySide6.QtCore import Qt
+
+import thumb_cache
+
+CHECKLISTS_DIR = r"P:\ENGINEERING\Design Checklist\json_files"
+NEAR_DUPLICATE_BITS = 6
+HASH_BANDS = 8      # 8-bit bands: hashes within 7 bits always share one, so only those are compared
+
+
+# ---------- Fingerprints ----------
+
+def pixel_hash(img):
+    """SHA-1 of an image's RGB pixels (and size)."""
+    img = img.convertToFormat(QImage.Format_RGB32)
+    h = hashlib.sha1(f"{img.width()}x{img.height()}".encode("ascii"))
+    h.update(bytes(img.constBits())[: img.bytesPerLine() * img.height()])
+    return h.hexdigest()
+
+
+def dhash(img):
+    """64-bit difference hash: is each pixel of a 9x8 grey copy brighter than its right neighbour."""
+    small = img.scaled(9, 8, Qt.IgnoreAspectRatio, Qt.SmoothTransformation).convertToFormat(QImage.Format_Grayscale8)
+    bits = bytes(small.constBits())
+    stride = small.bytesPerLine()
+    value = 0
+    for y in range(8):
+        row = bits[y * stride: y * stride + 9]
+        for x in range(8):
+            value = (value << 1) | (row[x] > row[x + 1])
+    return value
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+def is_near(a, b, max_bits=NEAR_DUPLICATE_BITS):
+    return a is not None and b is not None and hamming(a, b) <= max_bits
+
+
+# ---------- Archive report ----------
+
+def hash_checklist(path):
+    """
+    Fingerprints of every screenshot in one saved checklist (runs in a worker
+    process). Returns (filename, [(vendor, index, key, dhash, bytes)], error).
+    """
+    name = os.path.basename(path)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception as e:
+        return name, [], str(e)
+    found = []
+    for row in data.get("vendor_quotes") or []:
+        if not row or len(row) < 3 or not row[2]:
+            continue
+        vendor = row[0] or ""
+        for index, b64 in enumerate(row[2]):
+            raw = base64.b64decode(b64)
+            img = QImage.fromData(raw)
+            if img.isNull():
+                continue
+            found.append((vendor, index, thumb_cache.image_key(b64),
+                          dhash(thumb_cache.make_thumbnail(img)), len(raw)))
+    return name, found, None
+
+
+def scan_archive(folder=CHECKLISTS_DIR, workers=None):
+    """
+    Hash every checklist in `folder` on a process pool. Returns (entries, errors):
+    entries are (filename, vendor, index, key, dhash, bytes), errors (filename, message).
+    """
+    paths = [os.path.join(folder, n) for n in sorted(os.listdir(folder)) if n.lower().endswith(".json")]
+    entries, errors = [], []
+    if workers == 1:
+        results = map(hash_checklist, paths)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        results = pool.map(hash_checklist, paths, chunksize=8)
+    try:
+        for name, found, error in results:
+            if error:
+                errors.append((name, error))
+            entries.extend((name,) + item for item in found)
+    finally:
+        if workers != 1:
+            pool.shutdown()
+    return entries, errors
+
+
+def find_duplicates(entries, max_bits=NEAR_DUPLICATE_BITS):
+    """
+    Group scan entries. Returns (exact, near):
+      exact: [[entry, ...]] sharing one stored image (2+ copies)
+      near:  [[key, ...]] distinct images within max_bits of each other
+    """
+    by_key = {}
+    for entry in entries:
+        by_key.setdefault(entry[3], []).append(entry)
+    exact = [group for group in by_key.values() if len(group) > 1]
+
+    keys = list(by_key)
+    hashes = [by_key[k][0][4] for k in keys]
+    parent = list(range(len(keys)))
+
+    def root(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    buckets = {}
+    for i, value in enumerate(hashes):
+        for band in range(HASH_BANDS):
+            buckets.setdefault((band, (value >> (band * 8)) & 0xFF), []).append(i)
+    for members in buckets.values():
+        for a in range(len(members)):
+            for b in range(a + 1, len(members)):
+                i, j = members[a], members[b]
+                if root(i) != root(j) and hamming(hashes[i], hashes[j]) <= max_bits:
+                    parent[root(i)] = root(j)
+
+    clusters = {}
+    for i in range(len(keys)):
+        clusters.setdefault(root(i), []).append(keys[i])
+    near = [group for group in clusters.values() if len(group) > 1]
+    return exact, near
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report duplicate vendor screenshots across saved checklists")
+    parser.add_argument("--folder", default=CHECKLISTS_DIR)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--max-bits", type=int, default=NEAR_DUPLICATE_BITS, help="dHash distance for near duplicates")
+    args = parser.parse_args(argv)
+
+    started = datetime.now()
+    entries, errors = scan_archive(args.folder, args.workers)
+    exact, near = find_duplicates(entries, args.max_bits)
+    by_key = {e[3]: e for e in entries}
+
+    for name, error in errors:
+        print(f"SKIPPED {name}: {error}")
+    wasted = 0
+    for group in sorted(exact, key=lambda g: -len(g) * g[0][5]):
+        wasted += (len(group) - 1) * group[0][5]
+        print(f"EXACT x{len(group)} ({group[0][5] / 1024:.0f} KB each):")
+        for name, vendor, index, *_ in group:
+            print(f"    {name}  [{vendor or '(no vendor)'} #{index + 1}]")
+    for group in near:
+        print(f"NEAR x{len(group)}:")
+        for key in group:
+            name, vendor, index, *_ = by_key[key]
+            print(f"    {name}  [{vendor or '(no vendor)'} #{index + 1}]")
+    print(f"{len(entries)} screenshots, {len(exact)} exact groups ({wasted / 1024 / 1024:.1f} MB repeated), "
+          f"{len(near)} near groups in {(datetime.now() - started).total_seconds():.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Shared, memory-bounded storage for vendor-quote screenshots.
+
+Rows only hold a key (thumb_cache.image_key of the base64 text). Each image's
+encoded bytes are kept here once, whichever rows use it, with a reference
+count so they are dropped when the last row lets go. Decoded full-size
+pixmaps sit in an LRU with a byte budget; one that has been evicted is decoded
+again from the stored bytes the next time it is viewed.
+
+QPixmap is a GUI-thread object, so call this from the GUI thread only.
+"""
+import base64
+from collections import OrderedDict
+
+from PySide6.QtGui import QPixmap
+
+import thumb_cache
+
+PIXMAP_BUDGET_BYTES = 256 * 1024 * 1024
+
+_encoded = {}               # key -> encoded image bytes (PNG/JPEG)
+_refs = {}                  # key -> number of screenshot entries using it
+_pixmaps = OrderedDict()    # key -> QPixmap, least recently used first
+_pixmap_bytes = 0
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def set_budget_mb(value):
+    """Set the decoded-pixmap budget in MB (None or 0 keeps only the last one viewed)."""
+    global PIXMAP_BUDGET_BYTES
+    PIXMAP_BUDGET_BYTES = int(float(value) * 1024 * 1024) if value else 0
+    _evict()
+
+
+def pixmap_size(pixmap):
+    """Bytes a decoded pixmap occupies."""
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+# ---------- Encoded images ----------
+
+def add(b64):
+    """Store a base64 screenshot (once per distinct image) and return its key."""
+    key = thumb_cache.image_key(b64)
+    if key not in _encoded:
+        _encoded[key] = base64.b64decode(b64)
+    _refs[key] = _refs.get(key, 0) + 1
+    return key
+
+
+def release(key):
+    """Drop one reference; the image and its pixmap go when nothing uses it."""
+    if key not in _refs:
+        return
+    _refs[key] -= 1
+    if _refs[key] <= 0:
+        del _refs[key]
+        _encoded.pop(key, None)
+        _drop_pixmap(key)
+
+
+def data(key):
+    """Encoded bytes for a key (None if it has been released)."""
+    return _encoded.get(key)
+
+
+def b64(key):
+    """Base64 text for a key, as saved in the checklist."""
+    raw = _encoded.get(key)
+    return base64.b64encode(raw).decode("utf-8") if raw is not None else None
+
+
+def size(key):
+    """Encoded size in bytes (what the per-checklist screenshot budget counts)."""
+    raw = _encoded.get(key)
+    return len(raw) if raw is not None else 0
+
+
+# ---------- Decoded pixmaps ----------
+
+def _drop_pixmap(key):
+    global _pixmap_bytes
+    pixmap = _pixmaps.pop(key, None)
+    if pixmap is not None:
+        _pixmap_bytes -= pixmap_size(pixmap)
+
+
+def _evict():
+    """Drop least recently used pixmaps until within budget (the newest always stays)."""
+    global _pixmap_bytes
+    while _pixmap_bytes > PIXMAP_BUDGET_BYTES and len(_pixmaps) > 1:
+        _key, pixmap = _pixmaps.popitem(last=False)
+        _pixmap_bytes -= pixmap_size(pixmap)
+        _stats["evictions"] += 1
+
+
+def put_pixmap(key, pixmap):
+    """Cache an already-decoded pixmap (e.g. straight after a paste)."""
+    global _pixmap_bytes
+    if key not in _encoded or pixmap.isNull():
+        return
+    _drop_pixmap(key)
+    _pixmaps[key] = pixmap
+    _pixmap_bytes += pixmap_size(pixmap)
+    _evict()
+
+
+def pixmap(key):
+    """Full-size pixmap for a key, decoded again if it was evicted. Null if unknown."""
+    cached = _pixmaps.get(key)
+    if cached is not None:
+        _pixmaps.move_to_end(key)
+        _stats["hits"] += 1
+        return cached
+    _stats["misses"] += 1
+    decoded = QPixmap()
+    raw = _encoded.get(key)
+    if raw is not None and decoded.loadFromData(raw):
+        put_pixmap(key, decoded)
+    return decoded
+
+
+def usage():
+    """Current memory use, for tuning PIXMAP_BUDGET_BYTES."""
+    return {
+        "images": len(_encoded),
+        "encoded_bytes": sum(len(raw) for raw in _encoded.values()),
+        "pixmaps": len(_pixmaps),
+        "pixmap_bytes": _pixmap_bytes,
+        "budget_bytes": PIXMAP_BUDGET_BYTES,
+        **_stats,
+    }
+
+
+def describe_usage():
+    u = usage()
+    mb = 1024 * 1024
+    return (f"{u['images']} screenshots, {u['encoded_bytes'] / mb:.1f} MB encoded; "
+            f"{u['pixmaps']} decoded, {u['pixmap_bytes'] / mb:.1f} of {u['budget_bytes'] / mb:.0f} MB "
+            f"({u['hits']} hits, {u['misses']} misses, {u['evictions']} evictions)")
@@ -1,5 +1,10 @@
 import os
 import sys
+
+# Must come before the imports it times (see --profile-startup)
+import startup_profile
+startup_profile.enable_from_argv()
+
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -22,13 +27,14 @@ from PySide6.QtGui import (
     QCursor,
     QDesktopServices
 )
-from PySide6.QtCore import Qt, QUrl
+from PySide6.QtCore import Qt, QUrl, QTimer
 
 import user_settings
 import cl_tab
 import qi_tab
 import ref_tab
 import vq_tab
+import image_store
 import html_export
 import saved_tab
 import an_tab
@@ -65,6 +71,12 @@ class MainWindow(QMainWindow):
 
         self.current_lockfile = None
         self.settings = user_settings.load_user_settings()
+        vq_tab.set_max_screenshot_dim(self.settings.get("max_screenshot_dim", vq_tab.MAX_SCREENSHOT_DIM))
+        if "screenshot_budget_mb" in self.settings:
+            vq_tab.set_screenshot_budget_mb(self.settings["screenshot_budget_mb"])
+        if "pixmap_cache_mb" in self.settings:
+            image_store.set_budget_mb(self.settings["pixmap_cache_mb"])
+        vq_tab.set_context_provider(self.vendor_context)
         self.setWindowTitle(f"Engineering Checklist {APP_VERSION}")
 
         # --- Window geometry ---
@@ -97,52 +109,34 @@ class MainWindow(QMainWindow):
             "Saved Checklists"
         ]
         self.tab_widgets = {}
+        self._tab_hosts = {}
+        self._tab_placeholders = {}
         for name in self.tab_names:
             widget = QWidget()
+            page_layout = QVBoxLayout(widget)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            placeholder = QLabel("Loading…")
+            placeholder.setAlignment(Qt.AlignCenter)
+            placeholder.setStyleSheet("color: #888; font-size: 13px;")
+            page_layout.addWidget(placeholder)
             self.tabs.addTab(widget, name)
             self.tab_widgets[name] = widget
-
-        # Reference tab
-        ref_tab.create_reference_tab(self.tab_widgets["Reference"])
-
-        # Rotary Reference (Gap Calculator) tab
-        self.gap_calc_widget = cd_ref.GapCalculatorWidget()
-        gap_layout = QVBoxLayout(self.tab_widgets["Die Cut Reference"])
-        gap_layout.setContentsMargins(4, 4, 4, 4)
-        gap_layout.setSpacing(2)
-        gap_layout.addWidget(self.gap_calc_widget)
-
-        # Checklist tab
-        cl_tab.create_checklist_tab(
-            self.tab_widgets["Checklist"],
-            self.dirty_trackers["Checklist"]
-        )
-        self.checklist_tab = cl_tab._tab_instance
-
-        # Quote Info tab
-        qi_tab.create_quote_info_tab(
-            self.tab_widgets["Quote Info"],
-            self.dirty_trackers["Quote Info"]
-        )
-
-        # Vendor Quotes tab
-        vq_tab.create_vendor_quote_tab(
-            self.tab_widgets["Vendor Quotes"],
-            self.dirty_trackers["Vendor Quotes"]
-        )
-
-        # Additional Notes tab
-        an_tab.create_additional_notes_tab(
-            self.tab_widgets["Additional Notes"],
-            self.dirty_trackers["Additional Notes"]
-        )
-
-        # Saved Checklists tab
-        saved_tab.create_saved_checklists_tab(
-            self.tab_widgets["Saved Checklists"],
-            load_checklist_callback=lambda path: self.load_checklist_file(path),
-            notebook=self.tabs
-        )
+            self._tab_placeholders[name] = placeholder
+
+        # Tabs are built on first activation (or first use through their module API)
+        self._tab_factories = {
+            "Reference": self._create_reference_tab,
+            "Die Cut Reference": self._create_die_cut_tab,
+            "Checklist": self._create_checklist_tab,
+            "Quote Info": self._create_quote_info_tab,
+            "Vendor Quotes": self._create_vendor_quote_tab,
+            "Additional Notes": self._create_additional_notes_tab,
+            "Saved Checklists": self._create_saved_checklists_tab,
+        }
+        cl_tab.set_tab_builder(lambda: self.ensure_tab("Checklist"))
+        qi_tab.set_tab_builder(lambda: self.ensure_tab("Quote Info"))
+        vq_tab.set_tab_builder(lambda: self.ensure_tab("Vendor Quotes"))
+        an_tab.set_tab_builder(lambda: self.ensure_tab("Additional Notes"))
 
         # --- Footer buttons ---
         footer = QWidget()
@@ -204,18 +198,90 @@ class MainWindow(QMainWindow):
         btn_save.setShortcut(QKeySequence("Ctrl+S"))
         btn_export_html.setShortcut(QKeySequence("Ctrl+H"))
 
-        # Restore last tab
+        # Restore last tab (the only tab built before the window shows)
         last_tab = self.settings.get("last_tab_index", 1)
-        if 0 <= last_tab < len(self.tab_names):
-            self.tabs.setCurrentIndex(last_tab)
-        else:
-            self.tabs.setCurrentIndex(1)
+        if not (0 <= last_tab < len(self.tab_names)):
+            last_tab = 1
+        self.ensure_tab(self.tab_names[last_tab])
+        self.tabs.setCurrentIndex(last_tab)
+        self.tabs.currentChanged.connect(self.on_tab_changed)
 
         # Override closeEvent
         self._original_closeEvent = self.closeEvent
         self.closeEvent = self.on_close
 
 
+    # ─── Lazy tab construction ────────────────────────────────────────────────
+    @property
+    def checklist_tab(self):
+        return cl_tab.ensure_checklist_tab()
+
+    def on_tab_changed(self, index):
+        if 0 <= index < len(self.tab_names):
+            name = self.tab_names[index]
+            if name not in self._tab_hosts:
+                # Let the placeholder paint before the (possibly slow) build
+                QTimer.singleShot(0, lambda n=name: self.ensure_tab(n))
+
+    def ensure_tab(self, name):
+        """Build the named tab if it hasn't been built yet. Safe to call repeatedly."""
+        if name in self._tab_hosts:
+            return
+        self._tab_hosts[name] = None  # guards re-entry while building
+        page = self.tab_widgets[name]
+        host = QWidget()
+        try:
+            with startup_profile.span(self._tab_factories[name].__name__.lstrip("_"), "tab"):
+                self._tab_factories[name](host)
+        except Exception as e:
+            # Leave the placeholder up; the next activation tries again
+            self._tab_hosts.pop(name, None)
+            host.deleteLater()
+            print(f"[Tabs] Failed to build {name}: {e}")
+            QMessageBox.critical(self, "Tab Error", f"Could not build the {name} tab:\n{e}")
+            return
+        placeholder = self._tab_placeholders.pop(name, None)
+        if placeholder is not None:
+            page.layout().removeWidget(placeholder)
+            placeholder.deleteLater()
+        page.layout().addWidget(host)
+        self._tab_hosts[name] = host
+
+    def _create_reference_tab(self, host):
+        ref_tab.create_reference_tab(host)
+
+    def _create_die_cut_tab(self, host):
+        # Rotary Reference (Gap Calculator) tab
+        self.gap_calc_widget = cd_ref.GapCalculatorWidget()
+        gap_layout = QVBoxLayout(host)
+        gap_layout.setContentsMargins(4, 4, 4, 4)
+        gap_layout.setSpacing(2)
+        gap_layout.addWidget(self.gap_calc_widget)
+
+    def _create_checklist_tab(self, host):
+        cl_tab.create_checklist_tab(host, self.dirty_trackers["Checklist"])
+        cl_tab.ensure_checklist_tab().top_fields[1].textChanged.connect(vq_tab.schedule_vendor_rerank)
+
+    def _create_quote_info_tab(self, host):
+        qi_tab.create_quote_info_tab(host, self.dirty_trackers["Quote Info"])
+        # Vendor suggestions follow the drawings/materials as they're typed
+        qi_tab.ensure_quote_info_tab().model.edited.connect(vq_tab.schedule_vendor_rerank)
+
+    def _create_vendor_quote_tab(self, host):
+        vq_tab.create_vendor_quote_tab(host, self.dirty_trackers["Vendor Quotes"])
+
+    def _create_additional_notes_tab(self, host):
+        an_tab.create_additional_notes_tab(host, self.dirty_trackers["Additional Notes"])
+
+    def _create_saved_checklists_tab(self, host):
+        saved_tab.create_saved_checklists_tab(
+            host,
+            load_checklist_callback=lambda path: self.load_checklist_file(path),
+            notebook=self.tabs
+        )
+    # ─────────────────────────────────────────────────────────────────────────────
+
+
     def is_any_dirty(self):
         return any(dt.is_dirty() for dt in self.dirty_trackers.values())
 
@@ -460,6 +526,12 @@ class MainWindow(QMainWindow):
             return an_tab.get_notes_text()
         return ""
 
+    def vendor_context(self):
+        """The open quote as vendor_usage sees it: drawings, materials and customer."""
+        context = qi_tab.quote_context()
+        context["customer"] = cl_tab.get_customer_name()
+        return context
+
 
     def show_release_notes(self):
         notes_path = r"P:\ENGINEERING\Design Checklist\supporting_documents\release_notes.txt"
@@ -681,8 +753,15 @@ class MainWindow(QMainWindow):
 
 
 def main():
-    app = QApplication(sys.argv)
-    window = MainWindow()
+    with startup_profile.span("QApplication()", "window"):
+        app = QApplication(sys.argv)
+    with startup_profile.span("MainWindow()", "window"):
+        window = MainWindow()
+    if startup_profile.is_enabled():
+        def report():
+            path = startup_profile.finish()
+            startup_profile.show_summary_dialog(window, path)
+        startup_profile.watch_first_paint(window, report)
     window.show()
     sys.exit(app.exec())
 
@@ -0,0 +1,195 @@
+"""
+STL analysis for 3D quotes.
+
+Finds the STL for a drawing on the drawings share, loads it (binary or ASCII)
+into a triangles x 3 x 3 NumPy array and computes volume (sum of signed
+tetrahedron volumes), surface area and bounding box in one vectorized pass.
+
+Results are cached in %APPDATA%\\EngineeringChecklist\\mesh_cache.json by the
+SHA-1 of the file, so re-opening a quote (or the same model under another
+drawing) doesn't re-read the mesh. STL files carry no units; millimetres are
+assumed unless the caller says otherwise.
+"""
+import os
+import re
+import json
+import hashlib
+import threading
+
+from utilities import lazy_import, STRATASYS_ORDER, _normalize_root, rev_key
+
+np = lazy_import("numpy")
+
+DRAWINGS_FOLDER = "P:/PDF Drawings"
+APPDATA_DIR = os.environ.get("APPDATA") or os.path.expanduser("~")
+SETTINGS_DIR = os.path.join(APPDATA_DIR, "EngineeringChecklist")
+CACHE_PATH = os.path.join(SETTINGS_DIR, "mesh_cache.json")
+CACHE_VERSION = 1
+
+MM3_PER_IN3 = 16387.064
+MM3_PER_ML = 1000.0
+UNIT_SCALE = {"mm": 1.0, "in": 25.4}   # -> millimetres
+
+_STL_NAME = re.compile(r'^(?P<root>.+?)(?:_Rev(?P<rev>[0-9]+(?:\.[0-9]+)?))?\.stl$', re.IGNORECASE)
+
+_cache = None           # {sha1: stats}
+_hash_by_stat = {}      # (path, size, mtime) -> sha1, so unchanged files aren't re-hashed
+_lock = threading.RLock()
+
+
+# ---------- Finding the file ----------
+
+def find_stl_files(drawing, drawings_folder=DRAWINGS_FOLDER):
+    """STL files for a drawing, newest revision first."""
+    root = _normalize_root(drawing)
+    if not root:
+        return []
+    try:
+        names = os.listdir(drawings_folder)
+    except Exception:
+        return []
+    found = []
+    for name in names:
+        m = _STL_NAME.match(name)
+        if m and _normalize_root(m.group("root")) == root:
+            found.append((rev_key(m.group("rev") or ""), name))
+    found.sort(reverse=True)
+    return [os.path.join(drawings_folder, name) for _, name in found]
+
+
+# ---------- Loading ----------
+
+def _is_binary(data):
+    """Binary STL if the size matches the triangle count in the header."""
+    if len(data) < 84:
+        return False
+    count = int.from_bytes(data[80:84], "little")
+    if len(data) == 84 + count * 50:
+        return True
+    # Some exporters write "solid" into binary headers; ASCII always has "facet"
+    return not data[:5].lower() == b"solid" or b"facet" not in data[:1024]
+
+
+def parse_stl(data):
+    """Triangles as a float32 array of shape (n, 3, 3)."""
+    if _is_binary(data):
+        count = int.from_bytes(data[80:84], "little")
+        count = min(count, (len(data) - 84) // 50)
+        # 50-byte records: 12 normal bytes, 36 vertex bytes, 2 attribute bytes.
+        # Slice the vertex bytes out as raw uint8 (a fast contiguous copy) and reinterpret.
+        records = np.frombuffer(data, dtype=np.uint8, count=count * 50, offset=84).reshape(count, 50)
+        return np.ascontiguousarray(records[:, 12:48]).view("<f4").reshape(count, 3, 3)
+    coords = re.findall(rb"vertex\s+(\S+)\s+(\S+)\s+(\S+)", data)
+    if not coords:
+        return np.zeros((0, 3, 3), dtype=np.float32)
+    tris = np.array(coords, dtype=np.float32)
+    return tris[: len(tris) // 3 * 3].reshape(-1, 3, 3)
+
+
+# ---------- Geometry ----------
+
+def analyze(tris, units="mm"):
+    """
+    Volume, surface area and bounding box of a closed mesh, in millimetres.
+    Volume is |sum of signed tetrahedron volumes| so winding order doesn't matter.
+    """
+    scale = UNIT_SCALE.get(units, 1.0)
+    if len(tris) == 0:
+        return {"triangles": 0, "volume_mm3": 0.0, "area_mm2": 0.0, "bbox_mm": [0.0, 0.0, 0.0]}
+    # (vertex, axis, triangle) so every component below is a contiguous vector
+    c = np.ascontiguousarray(tris.transpose(1, 2, 0), dtype=np.float64)
+    (x0, y0, z0), (x1, y1, z1), (x2, y2, z2) = c[0], c[1], c[2]
+    ex, ey, ez = x1 - x0, y1 - y0, z1 - z0
+    fx, fy, fz = x2 - x0, y2 - y0, z2 - z0
+    nx = ey * fz - ez * fy
+    ny = ez * fx - ex * fz
+    nz = ex * fy - ey * fx
+    area = 0.5 * np.sqrt(nx * nx + ny * ny + nz * nz).sum()
+    # v0 . (v1 x v2) == v0 . ((v1 - v0) x (v2 - v0)), so the normal above is reused
+    volume = abs((x0 * nx + y0 * ny + z0 * nz).sum()) / 6.0
+    bbox = c.max(axis=(0, 2)) - c.min(axis=(0, 2))
+    return {
+        "triangles": int(len(tris)),
+        "volume_mm3": float(volume) * scale ** 3,
+        "area_mm2": float(area) * scale ** 2,
+        "bbox_mm": [float(x) * scale for x in bbox],
+    }
+
+
+# ---------- Cache ----------
+
+def _load_cache():
+    global _cache
+    with _lock:
+        if _cache is None:
+            try:
+                with open(CACHE_PATH, "r", encoding="utf-8") as f:
+                    obj = json.load(f)
+                if obj.get("version") != CACHE_VERSION:
+                    raise ValueError("old cache format")
+                _cache = obj.get("meshes") or {}
+            except Exception:
+                _cache = {}
+        return _cache
+
+
+def _save_cache():
+    with _lock:
+        try:
+            os.makedirs(SETTINGS_DIR, exist_ok=True)
+            tmp = CACHE_PATH + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": CACHE_VERSION, "meshes": _cache}, f, separators=(",", ":"))
+            os.replace(tmp, CACHE_PATH)
+        except Exception as e:
+            print(f"[MeshEngine] Failed to write {CACHE_PATH}: {e}")
+
+
+def analyze_file(path, units="mm"):
+    """
+    Stats for an STL file: {"sha1", "file", "triangles", "volume_mm3", "area_mm2", "bbox_mm"}.
+    Served from the hash cache when the same content was analyzed before.
+    """
+    st = os.stat(path)
+    stat_key = (path, st.st_size, st.st_mtime)
+    cache = _load_cache()
+    sha1 = _hash_by_stat.get(stat_key)
+    if sha1 and f"{sha1}:{units}" in cache:
+        return dict(cache[f"{sha1}:{units}"], file=os.path.basename(path))
+
+    with open(path, "rb") as f:
+        data = f.read()
+    sha1 = hashlib.sha1(data).hexdigest()
+    _hash_by_stat[stat_key] = sha1
+    key = f"{sha1}:{units}"
+    if key not in cache:
+        stats = analyze(parse_stl(data), units)
+        stats["sha1"] = sha1
+        with _lock:
+            cache[key] = stats
+            _save_cache()
+    return dict(cache[key], file=os.path.basename(path))
+
+
+# ---------- Quote inputs ----------
+
+def stratasys_material(line):
+    """The Stratasys material column to fill: the one already used on the line, else the first."""
+    s = line.get("stratasys") or {}
+    for mat in STRATASYS_ORDER:
+        if mat != "706 Sup" and str(s.get(mat, "")).strip():
+            return mat
+    return STRATASYS_ORDER[0]
+
+
+def quote_inputs(stats, line, quantity=1):
+    """
+    {(printer, key): text} for the 3D panel inputs: model volume for
+    `quantity` parts, in cubic inches for Stratasys and millilitres of RS-F2
+    for Formlabs.
+    """
+    volume = stats["volume_mm3"] * quantity
+    return {
+        ("stratasys", stratasys_material(line)): f"{volume / MM3_PER_IN3:.2f}",
+        ("formlabs", "RS-F2"): f"{volume / MM3_PER_ML:.1f}",
+    }
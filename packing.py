@@ -0,0 +1,110 @@
+"""
+Build-plate packing for 3D quotes.
+
+Given a part's bounding box and the quoted quantity, works out how many
+copies fit on a printer's build plate (shelf packing of the footprints),
+how many plates the job needs and roughly how many hours it prints.
+
+Printer build volumes and speeds default to PRINTERS below; the price table
+(cost_engine) can override any of them under a "printers" key:
+
+    "printers": {"stratasys": {"build_mm": [355, 254, 355], "cm3_per_hr": 18}}
+"""
+import math
+
+import cost_engine
+
+PRINTERS = {
+    # FDM: time is driven by deposited volume
+    "stratasys": {
+        "name": "Stratasys F370",
+        "build_mm": [355.0, 254.0, 355.0],
+        "spacing_mm": 5.0,
+        "setup_hrs": 0.5,
+        "cm3_per_hr": 16.0,
+        "mm_per_hr": 0.0,
+    },
+    # SLA: the whole plate prints layer by layer, so time follows the tallest part
+    "formlabs": {
+        "name": "Formlabs Form 3",
+        "build_mm": [145.0, 145.0, 185.0],
+        "spacing_mm": 3.0,
+        "setup_hrs": 0.25,
+        "cm3_per_hr": 0.0,
+        "mm_per_hr": 12.0,
+    },
+}
+
+
+def printer_profiles(table=None):
+    """PRINTERS with any overrides from the price table applied."""
+    table = table or cost_engine.load_price_table()
+    overrides = getattr(table, "printers", None) or {}
+    return {name: dict(profile, **(overrides.get(name) or {})) for name, profile in PRINTERS.items()}
+
+
+# ---------- Shelf packing ----------
+
+def _fits_per_axis(length, part, spacing):
+    return int((length + spacing) // (part + spacing)) if part > 0 else 0
+
+
+def parts_per_plate(footprint, plate, spacing):
+    """
+    Copies of one footprint (w, d) that fit on a plate (W, D) in rows (shelves),
+    trying both rotations. Identical parts make every shelf the same, so this is
+    the shelf heuristic in closed form.
+    """
+    (w, d), (pw, pd) = footprint, plate
+    best = 0
+    for a, b in ((w, d), (d, w)):
+        if a <= pw and b <= pd:
+            best = max(best, _fits_per_axis(pw, a, spacing) * _fits_per_axis(pd, b, spacing))
+    return best
+
+
+# ---------- Estimates ----------
+
+def _orientations(bbox):
+    """(footprint w, footprint d, height) for each axis standing up."""
+    x, y, z = bbox
+    return [(x, y, z), (x, z, y), (y, z, x)]
+
+
+def estimate(bbox_mm, volume_mm3, quantity, printer):
+    """
+    Plates and print hours for `quantity` copies of one part on one printer.
+    Picks the orientation that needs the fewest plates, then the fewest hours.
+    Returns {"plates", "per_plate", "hours", "height_mm"}, or None if the part
+    doesn't fit the build volume in any orientation.
+    """
+    quantity = max(int(quantity or 0), 1)
+    pw, pd, ph = printer["build_mm"]
+    spacing = printer.get("spacing_mm", 0.0)
+    volume_cm3 = (volume_mm3 or 0.0) / 1000.0
+
+    best = None
+    for w, d, h in _orientations(bbox_mm):
+        if h > ph:
+            continue
+        per_plate = parts_per_plate((w, d), (pw, pd), spacing)
+        if not per_plate:
+            continue
+        plates = math.ceil(quantity / per_plate)
+        hours = plates * printer.get("setup_hrs", 0.0)
+        if printer.get("cm3_per_hr"):
+            hours += quantity * volume_cm3 / printer["cm3_per_hr"]
+        if printer.get("mm_per_hr"):
+            hours += plates * h / printer["mm_per_hr"]
+        result = {"plates": plates, "per_plate": per_plate, "hours": hours, "height_mm": h}
+        if best is None or (plates, hours) < (best["plates"], best["hours"]):
+            best = result
+    return best
+
+
+def estimate_line(mesh, quantity, table=None):
+    """{printer: estimate or None} for a line's STL stats (see mesh_engine.analyze_file)."""
+    return {
+        name: estimate(mesh.get("bbox_mm") or (0, 0, 0), mesh.get("volume_mm3"), quantity, profile)
+        for name, profile in printer_profiles(table).items()
+    }
@@ -0,0 +1,231 @@
+"""
+Price breaks out of free-text vendor quotes.
+
+parse_quote(text) pulls quantity/price breaks, lead time and one-time charges
+(tooling, dies, setup, NRE) out of what engineers paste into a vendor card:
+
+    Qty 500 - $0.37 ea         1,000 pcs @ .29          5000 / $1,150.00 total
+    Lead time: 3-4 weeks ARO   Tooling $450             Die charge: $1,200
+
+A drawing number at the start of a line (CD1234, MT-5678: ..., or anything
+after "P/N:" / "Part #:" / "Dwg:") puts the breaks and charges that follow
+under that part; anything before the first one belongs to the whole quote
+(part ""). Reference numbers ("Quote #12345", "PO 4471"), revisions and dates
+are ignored so they aren't read as quantities, and a range such as "100-499:"
+is priced from its low end. Lines are parsed on their own and memoized, so
+re-parsing after an edit only looks at the lines that changed.
+
+compare() turns several vendors' tables into NumPy unit and total cost arrays
+(parts x vendors x quantities), priced at the break that applies ("step") or
+interpolated between breaks on log-log scales ("interp").
+"""
+import re
+
+from utilities import lazy_import, clean_drawing_number, _normalize_root, DRAWING_PREFIXES
+
+np = lazy_import("numpy")
+
+NUM = r"(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?|\.\d+"
+
+_PART = re.compile(
+    r"^\s*(?:(?:p/?n|part(?:\s*(?:no\.?|number|#))?|dwg|drawing)\s*[:#]?\s*(?P<labeled>[A-Z0-9][A-Z0-9_.-]*\d[A-Z0-9_.-]*)"
+    rf"|(?P<part>(?:{'|'.join(DRAWING_PREFIXES)})[-_ ]?\d{{3,}}[A-Z0-9_.-]*(?:\s+rev\.?\s*[A-Z0-9.]+)?))\s*(?:[:\-–]|$)", re.I)
+_REF = re.compile(r"(?<!qty)(?<!qty )#\s*\d[\w-]*"
+                  r"|\b(?:po|p\.o\.|ref|quote|rfq|invoice)\s*(?:no\.?|number)?\s*[:#]?\s*\d[\w-]*", re.I)
+_REV = re.compile(r"\brev(?:ision)?\.?\s*[A-Z0-9]+\b", re.I)
+_DATE = re.compile(r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b|\b\d{4}-\d{1,2}-\d{1,2}\b")
+_LEAD_CONTEXT = re.compile(r"\b(?:lead|deliver\w*|ship\w*|aro|turn\w*|ready)\b", re.I)
+_LEAD = re.compile(rf"(?P<a>{NUM})\s*(?:-|–|to)?\s*(?P<b>{NUM})?\s*(?P<unit>business days|days?|wks?|weeks?)\b", re.I)
+_CHARGE = re.compile(rf"\b(?:tooling|tool|die(?:\s*charge)?|set-?up|nre|plates?|fixtures?|first article)\b"
+                     rf"[^$\d\n]*\$?\s*(?P<amount>{NUM})", re.I)
+# "1-99 pcs", "100-499:": a quantity range, priced from its low end
+_RANGE = re.compile(rf"(?P<low>{NUM})\s*(?:-|–|to)\s*(?:{NUM})(?=\s*(?:pcs?\b|pieces\b|units\b|parts\b|ea\b|:))", re.I)
+# "$500 for 100 pcs": a lot price ahead of its quantity
+_LOT = re.compile(rf"\$\s*(?P<price>{NUM})\s*(?:for|/)\s*(?P<qty>{NUM})\s*(?P<k>k\b)?\s*(?:pcs?|pieces|units|parts|ea)\b", re.I)
+_BREAK = re.compile(
+    rf"(?P<label>\bqty\.?|\bquantity)?\s*[:#]?\s*(?P<qty>{NUM})\s*(?P<k>k\b|m\b)?\s*(?P<units>pcs?\b|pieces\b|units\b|parts\b|ea\b)?\s*"
+    rf"(?P<sep>@|\bat\b|-|–|:|=|/|\bfor\b|(?:\bunit\s+)?\bprice\b\s*[:=]?|\bcost\b\s*[:=]?)?\s*"
+    rf"(?P<dollar>\$)?\s*(?P<price>{NUM})\s*"
+    rf"(?P<per>/\s*(?:ea|pc|each)\b|ea\b|each\b|/\s*m\b|per\s*m\b|per\s*(?:piece|part|unit)\b|total\b|lot\b)?",
+    re.I)
+
+_line_cache = {}    # line -> parsed items
+LINE_CACHE_MAX = 20000
+
+
+def _number(text):
+    return float(text.replace(",", ""))
+
+
+def parse_line(line):
+    """
+    Items found on one line: ("part", name), ("lead", days), ("charge", amount)
+    and ("break", qty, unit_price). Memoized by line text.
+    """
+    items = _line_cache.get(line)
+    if items is not None:
+        return items
+    items = []
+    rest = line
+
+    m = _PART.match(rest)
+    if m:
+        items.append(("part", _normalize_root(clean_drawing_number(m.group("labeled") or m.group("part")))))
+        rest = rest[m.end():]
+    rest = _DATE.sub(" ", _REV.sub(" ", _REF.sub(" ", rest)))
+
+    m = _LEAD.search(rest) if _LEAD_CONTEXT.search(rest) else None
+    if m:
+        days = _number(m.group("b") or m.group("a"))
+        unit = m.group("unit").lower()
+        if unit.startswith("w"):
+            days *= 7
+        elif unit.startswith("business"):
+            days *= 7 / 5
+        items.append(("lead", int(round(days))))
+        rest = rest[:m.start()] + " " + rest[m.end():]
+
+    for m in _CHARGE.finditer(rest):
+        items.append(("charge", _number(m.group("amount"))))
+    rest = _CHARGE.sub(" ", rest)
+    rest = _RANGE.sub(lambda m: m.group("low"), rest)
+
+    for m in _LOT.finditer(rest):
+        qty = _number(m.group("qty")) * (1000 if m.group("k") else 1)
+        if qty >= 1:
+            items.append(("break", qty, _number(m.group("price")) / qty))
+    rest = _LOT.sub(" ", rest)
+
+    for m in _BREAK.finditer(rest):
+        qty = _number(m.group("qty"))
+        price = _number(m.group("price"))
+        k = (m.group("k") or "").lower()
+        if k:
+            qty *= 1000
+        per = re.sub(r"\s+", "", (m.group("per") or "").lower())
+        sep = (m.group("sep") or "").lower()
+        if sep:
+            # "3-4" or "10/12" with no $, @ or unit is more likely a range than a price
+            priced = (m.group("dollar") or per or sep in ("@", "at", "for")
+                      or sep.startswith(("price", "unit", "cost")) or "qty" in line.lower())
+        else:
+            # "100 pcs $1.25", "Qty 100 $1.50 each", "250 $2.10 ea": a $ price needs a unit either side
+            priced = m.group("dollar") and (m.group("units") or per or m.group("label"))
+        if qty < 1 or price <= 0 or not priced:
+            continue
+        if per in ("total", "lot"):
+            price /= qty
+        elif per in ("/m", "perm"):
+            price /= 1000
+        items.append(("break", qty, price))
+
+    if len(_line_cache) >= LINE_CACHE_MAX:
+        _line_cache.clear()
+    _line_cache[line] = items
+    return items
+
+
+def parse_quote(text):
+    """
+    Structured table for a vendor's quote text (JSON-friendly):
+      {"breaks": [[part, qty, unit_price], ...] sorted by part then qty,
+       "lead_days": longest lead time mentioned or None,
+       "charges": {part: one-time charges}}
+    """
+    part = ""
+    breaks = {}
+    charges = {}
+    lead = None
+    for line in (text or "").splitlines():
+        for item in parse_line(line):
+            kind = item[0]
+            if kind == "part":
+                part = item[1]
+            elif kind == "lead":
+                lead = item[1] if lead is None else max(lead, item[1])
+            elif kind == "charge":
+                charges[part] = charges.get(part, 0.0) + item[1]
+            else:
+                breaks[(part, item[1])] = item[2]   # a repeated quantity keeps the later price
+    return {
+        "breaks": [[p, q, price] for (p, q), price in sorted(breaks.items())],
+        "lead_days": lead,
+        "charges": charges,
+    }
+
+
+def summarize(table):
+    """Short description of a parsed table for the vendor card ("" if nothing was found)."""
+    if not table:
+        return ""
+    bits = []
+    if table["breaks"]:
+        parts = {p for p, _, _ in table["breaks"]}
+        bits.append(f"{len(table['breaks'])} price break{'s' if len(table['breaks']) != 1 else ''}"
+                    + (f" on {len(parts)} parts" if len(parts) > 1 else ""))
+    if table["lead_days"] is not None:
+        bits.append(f"lead {table['lead_days']} days")
+    charges = sum(table["charges"].values())
+    if charges:
+        bits.append(f"one-time ${charges:,.2f}")
+    return " · ".join(bits)
+
+
+# ---------- Comparison ----------
+
+def default_quantities(tables):
+    """Every break quantity quoted by any vendor, ascending."""
+    return sorted({q for table in tables if table for _, q, _ in table["breaks"]})
+
+
+def compare(vendors, tables, quantities, mode="step"):
+    """
+    Cost matrix for `vendors` (names) with parsed `tables` at `quantities`.
+
+    Returns {"parts", "vendors", "quantities", "unit", "total", "below_moq", "best"}:
+    unit/total are float arrays shaped (parts, vendors, quantities), NaN where a
+    vendor didn't quote that part; total adds the vendor's one-time charges for
+    the part (plus whole-quote charges). below_moq marks quantities under a
+    vendor's smallest break (priced at that break). best is the cheapest vendor
+    index per part and quantity by total, -1 if nobody quoted it.
+    """
+    q = np.asarray(quantities, dtype=float)
+    parts = sorted({p for table in tables if table for p, _, _ in table["breaks"]})
+    shape = (len(parts), len(vendors), len(q))
+    unit = np.full(shape, np.nan)
+    below = np.zeros(shape, dtype=bool)
+    charges = np.zeros(shape[:2])
+
+    for v, table in enumerate(tables):
+        if not table:
+            continue
+        rows = {}
+        for p, qty, price in table["breaks"]:
+            rows.setdefault(p, []).append((qty, price))
+        for i, p in enumerate(parts):
+            pts = rows.get(p)
+            if not pts:
+                continue
+            qs = np.array([a for a, _ in pts])
+            ps = np.array([b for _, b in pts])
+            if mode == "interp" and len(qs) > 1 and len(q):
+                unit[i, v] = np.exp(np.interp(np.log(np.maximum(q, 1e-9)), np.log(qs), np.log(ps)))
+            else:
+                idx = np.searchsorted(qs, q, side="right") - 1
+                unit[i, v] = ps[np.clip(idx, 0, None)]
+            below[i, v] = q < qs[0]
+            charges[i, v] = table["charges"].get(p, 0.0) + (table["charges"].get("", 0.0) if p else 0.0)
+
+    total = unit * q[None, None, :] + charges[:, :, None]
+    masked = np.where(np.isnan(total), np.inf, total)
+    best = np.where(np.isinf(masked.min(axis=1)), -1, masked.argmin(axis=1)) if len(vendors) else \
+        np.full((len(parts), len(q)), -1)
+    return {
+        "parts": parts,
+        "vendors": list(vendors),
+        "quantities": q,
+        "unit": unit,
+        "total": total,
+        "below_moq": below,
+        "best": best,
+    }
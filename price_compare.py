@@ -0,0 +1,161 @@
+"""
+Cross-vendor price comparison for the Vendor Quotes tab.
+
+Shows, for one part at a time, each vendor's unit and total cost at a list of
+quantities, from the price breaks price_breaks parsed out of the cards. The
+whole parts x vendors x quantities matrix is computed in one compare() call;
+the dialog stays open beside the tab and recomputes whenever a card's text or
+name changes, the quantities are edited, or interpolation is toggled.
+"""
+import re
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QComboBox,
+    QCheckBox, QTableWidget, QTableWidgetItem, QHeaderView
+)
+from PySide6.QtGui import QColor, QFont
+from PySide6.QtCore import Qt
+
+import price_breaks
+
+BEST_COLOR = QColor("#d7f5d7")
+WHOLE_QUOTE = "(whole quote)"
+
+
+def _money(value):
+    if price_breaks.np.isnan(value):   # not quoted
+        return "—"
+    return f"${value:,.4f}" if value < 1 else f"${value:,.2f}"
+
+
+def parse_quantities(text):
+    """ "100, 500 1k 2,500" -> [100.0, 500.0, 1000.0, 2500.0] (sorted, unique)."""
+    found = set()
+    for num, k in re.findall(r"(\d[\d,]*(?:\.\d+)?)\s*(k\b)?", text or "", re.I):
+        value = float(num.replace(",", "")) * (1000 if k else 1)
+        if value > 0:
+            found.add(value)
+    return sorted(found)
+
+
+class PriceComparisonDialog(QDialog):
+    def __init__(self, tab, parent=None):
+        super().__init__(parent or tab)
+        self.tab = tab
+        self.setWindowTitle("Compare Vendor Prices")
+        self.setModal(False)
+        self.result = None
+        self.lead_days = []
+
+        layout = QVBoxLayout(self)
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Part:"))
+        self.part_combo = QComboBox()
+        self.part_combo.setMinimumWidth(140)
+        self.part_combo.currentIndexChanged.connect(self.render)
+        controls.addWidget(self.part_combo)
+        controls.addSpacing(12)
+        controls.addWidget(QLabel("Quantities:"))
+        self.qty_edit = QLineEdit()
+        self.qty_edit.setPlaceholderText("all quoted breaks (e.g. 100, 500, 1k)")
+        self.qty_edit.textChanged.connect(self.recompute)
+        controls.addWidget(self.qty_edit, 1)
+        self.interp_check = QCheckBox("Interpolate between breaks")
+        self.interp_check.toggled.connect(self.recompute)
+        controls.addWidget(self.interp_check)
+        layout.addLayout(controls)
+
+        self.table = QTableWidget()
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionMode(QTableWidget.NoSelection)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        layout.addWidget(self.table, 1)
+
+        self.note = QLabel()
+        self.note.setStyleSheet("color:#666; font-style: italic;")
+        self.note.setWordWrap(True)
+        layout.addWidget(self.note)
+
+        tab.prices_changed.connect(self.recompute)
+        self.resize(760, 420)
+        self.recompute()
+
+    # ---------- Data ----------
+    def recompute(self, *_):
+        """Re-run the comparison for every part (called on any card or control change)."""
+        entries = self.tab.price_tables()
+        vendors = [name or f"Vendor {i + 1}" for i, (name, _) in enumerate(entries)]
+        tables = [table for _, table in entries]
+        quantities = parse_quantities(self.qty_edit.text()) or price_breaks.default_quantities(tables)
+        mode = "interp" if self.interp_check.isChecked() else "step"
+        self.result = price_breaks.compare(vendors, tables, quantities, mode)
+        self.lead_days = [table["lead_days"] if table else None for table in tables]
+
+        current = self.part_combo.currentData()
+        self.part_combo.blockSignals(True)
+        self.part_combo.clear()
+        for part in self.result["parts"]:
+            self.part_combo.addItem(part or WHOLE_QUOTE, part)
+        index = self.part_combo.findData(current)
+        self.part_combo.setCurrentIndex(index if index >= 0 else 0)
+        self.part_combo.blockSignals(False)
+        self.render()
+
+    # ---------- Table ----------
+    def render(self, *_):
+        result = self.result
+        self.table.clear()
+        if not result or not result["parts"] or not len(result["quantities"]):
+            self.table.setRowCount(0)
+            self.table.setColumnCount(0)
+            self.note.setText("No price breaks found. Quote lines like \"500 @ $0.37 ea\" or "
+                              "\"Qty 1,000 - $290.00 total\" are picked up as they are typed.")
+            return
+        p = max(self.part_combo.currentIndex(), 0)
+        vendors = result["vendors"]
+        quoted = [v for v in range(len(vendors)) if not price_breaks.np.isnan(result["unit"][p, v]).all()]
+        unit, total = result["unit"][p], result["total"][p]
+        below, best = result["below_moq"][p], result["best"][p]
+
+        headers = ["Qty"]
+        for v in quoted:
+            lead = self.lead_days[v]
+            headers += [f"{vendors[v]}\nunit", f"{vendors[v]}\ntotal" + (f" ({lead} d)" if lead is not None else "")]
+        headers.append("Best")
+        self.table.setColumnCount(len(headers))
+        self.table.setHorizontalHeaderLabels(headers)
+        self.table.setRowCount(len(result["quantities"]))
+        bold = QFont()
+        bold.setBold(True)
+
+        for r, qty in enumerate(result["quantities"]):
+            self.table.setItem(r, 0, QTableWidgetItem(f"{qty:,.0f}"))
+            for c, v in enumerate(quoted):
+                cells = (QTableWidgetItem(_money(unit[v, r])), QTableWidgetItem(_money(total[v, r])))
+                for offset, item in enumerate(cells):
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                    if best[r] == v:
+                        item.setBackground(BEST_COLOR)
+                    if below[v, r]:
+                        item.setForeground(QColor("#999"))
+                        item.setToolTip("Below this vendor's smallest quoted quantity")
+                    self.table.setItem(r, 1 + c * 2 + offset, item)
+            winner = QTableWidgetItem(vendors[best[r]] if best[r] >= 0 else "")
+            winner.setFont(bold)
+            self.table.setItem(r, len(headers) - 1, winner)
+
+        mode = "interpolated between breaks" if self.interp_check.isChecked() else "at the break that applies"
+        self.note.setText(f"Unit prices {mode}; totals include tooling/setup charges. "
+                          f"Grey: below the vendor's minimum quoted quantity.")
+
+
+def show_comparison(tab):
+    """Open (or raise) the comparison window for the Vendor Quotes tab."""
+    dialog = tab._price_dialog
+    if dialog is None:
+        dialog = tab._price_dialog = PriceComparisonDialog(tab)
+    dialog.show()
+    dialog.raise_()
+    dialog.activateWindow()
+    return dialog
@@ -1,249 +1,347 @@
 import os
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QCheckBox, QLineEdit,
-    QLabel, QMessageBox, QDoubleSpinBox, QFrame, QSizePolicy, QScrollArea, QGridLayout
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit, QLabel,
+    QMessageBox, QSizePolicy, QGridLayout, QTableView, QHeaderView,
+    QAbstractItemView, QStyledItemDelegate, QStyle, QStyleOptionButton,
+    QApplication, QDialog, QDialogButtonBox, QFormLayout, QComboBox, QFileDialog
+)
+from PySide6.QtCore import (
+    Qt, QEvent, QRect, QAbstractTableModel, QModelIndex, Signal, QTimer
 )
-from PySide6.QtGui import QFontMetrics
-from PySide6.QtCore import Qt
 
 from utilities import (
     STRATASYS_ORDER, FORMLABS_HEADERS,
-    calculate_stratasys_cost, calculate_stratasys_3d_cost,
-    calculate_formlabs_cost, calculate_formlabs_3d_cost
+    find_latest_pdf_with_rev
 )
 import email_gen
+import cost_engine
+import bom_import
+import mesh_engine
+import packing
 
 EXCEL_PATH = r"P:\ENGINEERING\Design Checklist\supporting_documents\checklist_questions.xlsx"
 
-def auto_resize_lineedit(lineedit, min_width=110, max_width=250):
-    fm = lineedit.fontMetrics()
-    text = lineedit.text() or lineedit.placeholderText()
-    width = fm.horizontalAdvance(text) + 18
-    lineedit.setFixedWidth(min(max(width, min_width), max_width))
+# ---------- Line-item data (same shape as get_quote_info_data rows) ----------
+FIELD_PLACEHOLDERS = ["Drawing Number", "Material", "Quantity", "Customer Part Number"]
+S_EXTRA = ["Time (hrs)", "Material $", "3D Cost"]
+
+COL_INCLUDE, COL_DRAWING, COL_MATERIAL, COL_QTY, COL_CUST_PN, COL_3D, COL_ACTIONS = range(7)
+HEADERS = ["Email", "Drawing Number", "Material", "Quantity", "Customer Part Number", "3D", ""]
+FIELD_COLS = {COL_DRAWING: 0, COL_MATERIAL: 1, COL_QTY: 2, COL_CUST_PN: 3}
+
+LINE_ROW_HEIGHT = 26
+RECOMPUTE_DELAY_MS = 150  # coalesce bursts of typing in the 3D panel
+DETAIL_ROW_HEIGHT = 120  # estimate until the first 3D panel has been measured
+ACTION_LABELS = ["Open", "Remove"]
+MAX_LINE_QUANTITY = 1_000_000  # cap for plate/print-hour estimates ("1e400" would overflow)
+
+
+def new_line(initial_data=None):
+    """
+    Normalize a saved row (or None for a blank one) into a line dict:
+      {"include", "fields": [4], "enable_3d", "stratasys": {...}, "formlabs": {...}}
+    """
+    d = initial_data if isinstance(initial_data, dict) else {}
+    fields = [str(v) for v in (d.get("fields") or [])][:4]
+    fields += [""] * (4 - len(fields))
+    s_in = d.get("stratasys") or {}
+    f_in = d.get("formlabs") or {}
+    cost_default = "$0.00" if d else ""
+    stratasys = {k: s_in.get(k, "") for k in STRATASYS_ORDER}
+    stratasys["Time (hrs)"] = s_in.get("Time (hrs)", "")
+    stratasys["Material $"] = s_in.get("Material $", cost_default)
+    stratasys["3D Cost"] = s_in.get("3D Cost", cost_default)
+    line = {
+        "include": bool(d.get("include", True)),
+        "fields": fields,
+        "enable_3d": bool(d.get("enable_3d", False)),
+        "stratasys": stratasys,
+        "formlabs": {k: f_in.get(k, "") for k in FORMLABS_HEADERS},
+    }
+    if isinstance(d.get("mesh"), dict):
+        line["mesh"] = dict(d["mesh"])
+    return line
+
+
+def update_line_costs(line):
+    """Recompute the read-only Material $ / 3D Cost entries of a line dict."""
+    cost_engine.apply_costs([line])
+
+
+def line_quantity(line):
+    """Quoted quantity as a whole number (1 if blank or not a number, capped at MAX_LINE_QUANTITY)."""
+    try:
+        return int(min(max(float(line["fields"][2].replace(",", "")), 1), MAX_LINE_QUANTITY))
+    except (ValueError, OverflowError):  # not a number, or NaN
+        return 1
+
+
+def auto_fill_3d(line):
+    """
+    Refill a line's 3D inputs from its STL stats for the current quantity:
+    material for every copy, print time from the build-plate estimate.
+    Only lines filled by "From STL" and not edited by hand since are touched.
+    """
+    mesh = line.get("mesh")
+    if not mesh or not mesh.get("auto"):
+        return False
+    qty = line_quantity(line)
+    for (printer, key), text in mesh_engine.quote_inputs(mesh, line, qty).items():
+        line[printer][key] = text
+    plates = {}
+    for printer, est in packing.estimate_line(mesh, qty).items():
+        if est:
+            line[printer]["Time (hrs)"] = f"{est['hours']:.1f}"
+            plates[printer] = est["plates"]
+    mesh["plates"] = plates
+    update_line_costs(line)
+    return True
+
+
+def export_line(line):
+    """Copy of a line in the saved/exported shape (fields stripped, placeholders dropped)."""
+    fields = []
+    for i, value in enumerate(line["fields"]):
+        value = (value or "").strip()
+        fields.append("" if value == FIELD_PLACEHOLDERS[i] else value)
+    row = {
+        "include": line["include"],
+        "fields": fields,
+        "enable_3d": line["enable_3d"],
+        "stratasys": dict(line["stratasys"]),
+        "formlabs": dict(line["formlabs"]),
+    }
+    if "mesh" in line:
+        row["mesh"] = dict(line["mesh"])  # optional: STL stats behind the 3D inputs
+    return row
+
+
+def _is_checked(value):
+    return value in (Qt.Checked, getattr(Qt.Checked, "value", 2), 2)
+
+
+class QuoteLineModel(QAbstractTableModel):
+    """
+    Plain list of line dicts. Each line is one table row; lines with 3D
+    enabled get a detail row right below them that hosts the 3D cost panel.
+    """
+    edited = Signal()  # any user change (drives the dirty tracker)
+    detailChanged = Signal(int)  # line index whose 3D inputs were rewritten
 
-class ActionBar(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
-        row = QHBoxLayout(self)
-        row.setContentsMargins(6, 2, 6, 2)
-        row.setSpacing(10)
-
-        self.btn_remove = QPushButton("Remove")
-        self.btn_remove.setStyleSheet("""
-            QPushButton {
-                background: #ffeaea;
-                color: #a10000;
-                border: 1.2px solid #e0a4a4;
-                border-radius: 7px;
-                font-weight: 600;
-                padding: 3px 15px;
-            }
-            QPushButton:hover {
-                background: #fff0f0;
-            }
-        """)
-        row.addWidget(self.btn_remove)
-
-        self.btn_open = QPushButton("Open Drawing")
-        row.addWidget(self.btn_open)
-
-        self.btn_3d = QPushButton("3D Quote")
-        self.btn_3d.setCheckable(True)
-        self.btn_3d.setChecked(False)
-        row.addWidget(self.btn_3d)
-
-        self.btn_include = QPushButton("Include in Email")
-        self.btn_include.setCheckable(True)
-        self.btn_include.setChecked(True)
-        row.addWidget(self.btn_include)
-
-        row.addStretch()
-
-class QuoteInfoTab(QWidget):
-    def __init__(self, dirty_tracker=None, parent=None):
+        self.lines = []
+        self._rows = []       # view row -> (line index, is_detail)
+        self._line_row = []   # line index -> view row
+
+    # ---- row bookkeeping ----
+    def _rebuild_rows(self):
+        rows, line_row = [], []
+        for i, line in enumerate(self.lines):
+            line_row.append(len(rows))
+            rows.append((i, False))
+            if line["enable_3d"]:
+                rows.append((i, True))
+        self._rows, self._line_row = rows, line_row
+
+    def line_at(self, row):
+        return self._rows[row][0]
+
+    def is_detail(self, row):
+        return self._rows[row][1]
+
+    def row_of_line(self, line_idx):
+        return self._line_row[line_idx]
+
+    def detail_rows(self):
+        return [r for r, (_, detail) in enumerate(self._rows) if detail]
+
+    # ---- Qt model API ----
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if self.is_detail(index.row()):
+            return Qt.ItemIsEnabled | Qt.ItemIsEditable
+        col = index.column()
+        if col in FIELD_COLS:
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+        if col in (COL_INCLUDE, COL_3D):
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or self.is_detail(index.row()):
+            return None
+        line = self.lines[self.line_at(index.row())]
+        col = index.column()
+        if col in FIELD_COLS and role in (Qt.DisplayRole, Qt.EditRole):
+            return line["fields"][FIELD_COLS[col]]
+        if col == COL_INCLUDE and role == Qt.CheckStateRole:
+            return Qt.Checked if line["include"] else Qt.Unchecked
+        if col == COL_3D and role == Qt.CheckStateRole:
+            return Qt.Checked if line["enable_3d"] else Qt.Unchecked
+        if col == COL_INCLUDE and role == Qt.ToolTipRole:
+            return "Include in Email"
+        if col == COL_3D and role == Qt.ToolTipRole:
+            return "3D Quote"
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or self.is_detail(index.row()):
+            return False
+        line_idx = self.line_at(index.row())
+        line = self.lines[line_idx]
+        col = index.column()
+        if col in FIELD_COLS and role == Qt.EditRole:
+            value = "" if value is None else str(value)
+            if line["fields"][FIELD_COLS[col]] == value:
+                return False
+            line["fields"][FIELD_COLS[col]] = value
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+            if col == COL_QTY and auto_fill_3d(line) and line["enable_3d"]:
+                self.detailChanged.emit(self.line_at(index.row()))
+            self.edited.emit()
+            return True
+        if col == COL_INCLUDE and role == Qt.CheckStateRole:
+            line["include"] = _is_checked(value)
+            self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+            self.edited.emit()
+            return True
+        if col == COL_3D and role == Qt.CheckStateRole:
+            self.set_enable_3d(line_idx, _is_checked(value))
+            self.edited.emit()
+            return True
+        return False
+
+    # ---- structural changes (one model update each) ----
+    def set_lines(self, lines):
+        self.beginResetModel()
+        self.lines = list(lines)
+        cost_engine.apply_costs([l for l in self.lines if l["enable_3d"]])
+        self._rebuild_rows()
+        self.endResetModel()
+
+    def append_lines(self, lines):
+        lines = list(lines)
+        if not lines:
+            return
+        first = len(self._rows)
+        count = sum(2 if l["enable_3d"] else 1 for l in lines)
+        cost_engine.apply_costs([l for l in lines if l["enable_3d"]])
+        self.beginInsertRows(QModelIndex(), first, first + count - 1)
+        self.lines.extend(lines)
+        self._rebuild_rows()
+        self.endInsertRows()
+
+    def remove_line(self, line_idx):
+        row = self.row_of_line(line_idx)
+        last = row + (1 if self.lines[line_idx]["enable_3d"] else 0)
+        self.beginRemoveRows(QModelIndex(), row, last)
+        del self.lines[line_idx]
+        self._rebuild_rows()
+        self.endRemoveRows()
+
+    def set_enable_3d(self, line_idx, enabled):
+        line = self.lines[line_idx]
+        if line["enable_3d"] == enabled:
+            return
+        detail_row = self.row_of_line(line_idx) + 1
+        if enabled:
+            self.beginInsertRows(QModelIndex(), detail_row, detail_row)
+            line["enable_3d"] = True
+            update_line_costs(line)
+            self._rebuild_rows()
+            self.endInsertRows()
+        else:
+            self.beginRemoveRows(QModelIndex(), detail_row, detail_row)
+            line["enable_3d"] = False
+            self._rebuild_rows()
+            self.endRemoveRows()
+        idx = self.index(detail_row - 1, COL_3D)
+        self.dataChanged.emit(idx, idx, [Qt.CheckStateRole])
+
+
+def mesh_summary(mesh):
+    """One-line description of the STL stats stored on a line."""
+    if not mesh:
+        return ""
+    x, y, z = mesh.get("bbox_mm") or (0, 0, 0)
+    text = (f"{mesh.get('file', 'STL')}: {mesh.get('volume_mm3', 0) / 1000:.1f} cm³, "
+            f"{x:.1f} x {y:.1f} x {z:.1f} mm")
+    plates = mesh.get("plates") or {}
+    if plates:
+        text += "  |  plates: " + ", ".join(f"{p.capitalize()} {n}" for p, n in sorted(plates.items()))
+    return text
+
+
+class ThreeDPanel(QWidget):
+    """Stratasys + Formlabs cost grids for one line; edits go straight into the line dict."""
+    def __init__(self, model, line, parent=None):
         super().__init__(parent)
-        self.dirty_tracker = dirty_tracker
-        self._loading = False
-        self.rows = []
-        self.init_ui()
-
-    def init_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(8, 8, 8, 8)
-        layout.setSpacing(5)
-
-        header = QWidget()
-        header_layout = QHBoxLayout(header)
-        header_layout.setContentsMargins(0, 0, 0, 0)
-        header_layout.setSpacing(6)
-        btn_add = QPushButton("Add Line")
-        btn_add.setFixedHeight(22)
-        btn_add.setStyleSheet("font-weight: bold;")
-        btn_add.clicked.connect(self.add_row)
-        btn_email = QPushButton("Generate Email")
-        btn_email.setFixedHeight(22)
-        btn_email.setStyleSheet("font-weight: bold;")
-        btn_email.clicked.connect(self.handle_generate_email)
-        header_layout.addWidget(btn_add)
-        header_layout.addWidget(btn_email)
-        header_layout.addStretch()
-        header.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Fixed)
-        layout.addWidget(header)
-
-        note_lbl = QLabel(
-            "Do not need to include rev level in drawing number\n"
-            "Only drawings that are marked will generate emails"
-        )
-        note_lbl.setStyleSheet("font-size: 11px; color: #555; margin: 2px 0 0 0;")
-        note_lbl.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Fixed)
-        layout.addWidget(note_lbl)
-
-        self.scroll = QScrollArea()
-        self.scroll.setWidgetResizable(True)
-        self.scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.row_container = QWidget()
-        self.row_container_layout = QVBoxLayout(self.row_container)
-        self.row_container_layout.setContentsMargins(0, 0, 0, 0)
-        self.row_container_layout.setSpacing(1)
-        self.row_container.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Maximum)
-        self.scroll.setWidget(self.row_container)
-        layout.addWidget(self.scroll)
-
-        self.add_row()
-
-    def add_row(self, initial_data=None):
-        row = QuoteInfoRow(self, self.dirty_tracker, self, initial_data)
-        self.rows.append(row)
-        self.row_container_layout.addWidget(row)
-        scroll = self.scroll.verticalScrollBar()
-        scroll.setValue(scroll.maximum())
-
-    def remove_row(self, row_widget):
-        self.rows.remove(row_widget)
-        row_widget.setParent(None)
-        row_widget.deleteLater()
-        if self.dirty_tracker and not self._loading:
-            self.dirty_tracker.mark_dirty()
-
-    def handle_generate_email(self):
-        quote_data = self.get_quote_info_data()
-        email_gen.generate_emails(quote_data, parent=self)
-
-    def get_quote_info_data(self, include_all=False):
-        result = []
-        for row in self.rows:
-            data = row.get_row_data()
-            if include_all or data.get("include", True):
-                result.append(data)
-        return result
-
-    def load_quote_info_data(self, data):
-        self._loading = True
-        self.clear_quote_info_tab(skip_add=True)
-        for rowdata in data:
-            self.add_row(initial_data=rowdata)
-        self._loading = False
-
-    def clear_quote_info_tab(self, skip_add=False):
+        self.model = model
+        self.line = line
         self._loading = True
-        for row in self.rows:
-            row.setParent(None)
-            row.deleteLater()
-        self.rows.clear()
-        if not skip_add:
-            self.add_row()
-        self._loading = False
-
-class QuoteInfoRow(QWidget):
-    def __init__(self, tab: QWidget, dirty_tracker=None, parent=None, initial_data=None):
-        super().__init__(parent)
-        self.tab = tab
-        self.dirty_tracker = dirty_tracker
-        self._loading = False
-
-        self.outer_frame = QFrame(self)
-        self.outer_frame.setFrameShape(QFrame.StyledPanel)
-        self.outer_frame.setStyleSheet("""
-            QFrame {
-                border: 2px solid #c4c4c4;
-                border-radius: 8px;
-                background: #fcfcfc;
-            }
-        """)
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(4, 4, 4, 12)
-        layout.addWidget(self.outer_frame)
-        frame_layout = QVBoxLayout(self.outer_frame)
-        frame_layout.setContentsMargins(8, 8, 8, 8)
-        frame_layout.setSpacing(4)
-        self.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Fixed)
-
-        self.action_bar = ActionBar()
-        frame_layout.addWidget(self.action_bar)
-        self.action_bar.btn_remove.clicked.connect(lambda: self.tab.remove_row(self))
-        self.action_bar.btn_open.clicked.connect(self.open_drawing)
-        self.action_bar.btn_3d.toggled.connect(lambda checked: self._on_3d_toggled(checked))
-        self.action_bar.btn_include.toggled.connect(lambda checked: self._on_include_toggled(checked))
-
-        field_row = QWidget()
-        field_row_layout = QHBoxLayout(field_row)
-        field_row_layout.setContentsMargins(0, 0, 0, 0)
-        field_row_layout.setSpacing(6)
-        placeholders = ["Drawing Number", "Material", "Quantity", "Customer Part Number"]
-        self.fields = []
-        for ph in placeholders:
-            field = QLineEdit()
-            field.setPlaceholderText(ph)
-            auto_resize_lineedit(field)
-            field.textChanged.connect(lambda _, f=field: self.on_field_changed(f))
-            field.setStyleSheet("font-size: 12px;")
-            field_row_layout.addWidget(field)
-            self.fields.append(field)
-        frame_layout.addWidget(field_row)
-
-        self.table_frame = QWidget()
-        self.table_frame.setVisible(self.action_bar.btn_3d.isChecked())
-        frame_layout.addWidget(self.table_frame)
-        table_layout = QVBoxLayout(self.table_frame)
-        table_layout.setContentsMargins(2, 2, 2, 2)
+        self.setAutoFillBackground(True)
+        self.calc = cost_engine.LineCostCalc(line)
+        self.text_updates = 0  # cost fields rewritten (benchmarks read this)
+        self._recompute_timer = QTimer(self)
+        self._recompute_timer.setSingleShot(True)
+        self._recompute_timer.setInterval(RECOMPUTE_DELAY_MS)
+        self._recompute_timer.timeout.connect(self.flush)
+
+        table_layout = QVBoxLayout(self)
+        table_layout.setContentsMargins(24, 2, 2, 4)
         table_layout.setSpacing(4)
 
+        s_header_row = QHBoxLayout()
+        s_header_row.setSpacing(6)
         s_header = QLabel("Stratasys")
         s_header.setStyleSheet("font-weight: bold; font-size: 12px; border: none; background: transparent;")
-        table_layout.addWidget(s_header)
+        btn_stl = QPushButton("From STL")
+        btn_stl.setFixedHeight(20)
+        btn_stl.setToolTip("Fill the material inputs from the drawing's STL model")
+        btn_stl.clicked.connect(self.fill_from_stl)
+        self.mesh_lbl = QLabel(mesh_summary(line.get("mesh")))
+        self.mesh_lbl.setStyleSheet("font-size: 11px; color: #555; border: none; background: transparent;")
+        s_header_row.addWidget(s_header)
+        s_header_row.addWidget(btn_stl)
+        s_header_row.addWidget(self.mesh_lbl)
+        s_header_row.addStretch()
+        table_layout.addLayout(s_header_row)
         stratasys_grid = QGridLayout()
         stratasys_grid.setHorizontalSpacing(4)
         stratasys_grid.setVerticalSpacing(2)
         table_layout.addLayout(stratasys_grid)
 
-        s_headers = list(STRATASYS_ORDER) + ["Time (hrs)", "Material $", "3D Cost"]
+        s_headers = list(STRATASYS_ORDER) + S_EXTRA
         self.s_vars = {}
         for col, label in enumerate(s_headers):
             header_lbl = QLabel(label)
             header_lbl.setAlignment(Qt.AlignCenter)
             header_lbl.setStyleSheet("font-size: 11px; border: none; background: transparent;")
             stratasys_grid.addWidget(header_lbl, 0, col)
-        for col, mat in enumerate(STRATASYS_ORDER):
-            le = QLineEdit()
-            le.setFixedWidth(48)
+        for col, mat in enumerate(s_headers):
+            le = QLineEdit(line["stratasys"].get(mat, ""))
             le.setStyleSheet("font-size: 12px;")
-            le.textChanged.connect(lambda _, m=mat: self.on_s_var_changed())
+            if mat in ("Material $", "3D Cost"):
+                le.setReadOnly(True)
+                le.setFixedWidth(70)
+            else:
+                le.setFixedWidth(48)
+                le.textChanged.connect(lambda text, m=mat: self.on_input_changed("stratasys", m, text))
             self.s_vars[mat] = le
             stratasys_grid.addWidget(le, 1, col)
-        self.s_time = QLineEdit()
-        self.s_time.setFixedWidth(48)
-        self.s_time.setStyleSheet("font-size: 12px;")
-        self.s_time.textChanged.connect(self.on_s_var_changed)
-        stratasys_grid.addWidget(self.s_time, 1, len(STRATASYS_ORDER))
-        self.s_material = QLineEdit()
-        self.s_material.setReadOnly(True)
-        self.s_material.setFixedWidth(70)
-        stratasys_grid.addWidget(self.s_material, 1, len(STRATASYS_ORDER) + 1)
-        self.s_3dcost = QLineEdit()
-        self.s_3dcost.setReadOnly(True)
-        self.s_3dcost.setFixedWidth(70)
-        stratasys_grid.addWidget(self.s_3dcost, 1, len(STRATASYS_ORDER) + 2)
 
         f_header = QLabel("Formlabs")
         f_header.setStyleSheet("font-weight: bold; font-size: 12px; border: none; background: transparent;")
@@ -252,146 +350,478 @@ class QuoteInfoRow(QWidget):
         formlabs_grid.setHorizontalSpacing(4)
         formlabs_grid.setVerticalSpacing(2)
         table_layout.addLayout(formlabs_grid)
-        f_headers = list(FORMLABS_HEADERS)
         self.f_vars = {}
-        for col, label in enumerate(f_headers):
+        for col, label in enumerate(FORMLABS_HEADERS):
             header_lbl = QLabel(label)
             header_lbl.setAlignment(Qt.AlignCenter)
             header_lbl.setStyleSheet("font-size: 11px; border: none; background: transparent;")
             formlabs_grid.addWidget(header_lbl, 0, col)
-        for col, h in enumerate(f_headers):
-            le = QLineEdit()
+        for col, h in enumerate(FORMLABS_HEADERS):
+            le = QLineEdit(line["formlabs"].get(h, ""))
+            le.setStyleSheet("font-size: 12px;")
             if h in ("Material $", "3D Cost"):
                 le.setReadOnly(True)
                 le.setFixedWidth(70)
             else:
                 le.setFixedWidth(48)
-                le.textChanged.connect(self.on_f_var_changed)
-            le.setStyleSheet("font-size: 12px;")
+                le.textChanged.connect(lambda text, k=h: self.on_input_changed("formlabs", k, text))
             self.f_vars[h] = le
             formlabs_grid.addWidget(le, 1, col)
+        stratasys_grid.setColumnStretch(len(s_headers), 1)
+        formlabs_grid.setColumnStretch(len(FORMLABS_HEADERS), 1)
+
+        self._loading = False
 
-        if initial_data:
-            self._loading = True
-            for i, value in enumerate(initial_data.get("fields", [])):
-                self.fields[i].setText(value)
-            self.action_bar.btn_3d.setChecked(initial_data.get("enable_3d", False))
-            self.action_bar.btn_include.setChecked(initial_data.get("include", True))
-            for mat, val in initial_data.get("stratasys", {}).items():
-                if mat in self.s_vars:
-                    self.s_vars[mat].setText(val)
-            self.s_time.setText(initial_data.get("stratasys", {}).get("Time (hrs)", ""))
-            self.s_material.setText(initial_data.get("stratasys", {}).get("Material $", "$0.00"))
-            self.s_3dcost.setText(initial_data.get("stratasys", {}).get("3D Cost", "$0.00"))
-            for mat, val in initial_data.get("formlabs", {}).items():
-                if mat in self.f_vars:
-                    self.f_vars[mat].setText(val)
-            self.update_costs()
-            self._loading = False
-
-    def on_field_changed(self, field):
-        if self._loading or not self.dirty_tracker:
+    def on_input_changed(self, printer, key, text):
+        if self._loading:
+            return
+        if self.line.get("mesh"):
+            self.line["mesh"]["auto"] = False  # hand edits win over quantity refills
+        if self.calc.set_input(printer, key, text):
+            self._recompute_timer.start()
+        self.model.edited.emit()
+
+    def reload(self):
+        """Show inputs that were rewritten in the line dict (quantity refill, From STL)."""
+        self._recompute_timer.stop()
+        self._loading = True
+        for widgets, printer in ((self.s_vars, "stratasys"), (self.f_vars, "formlabs")):
+            for key, le in widgets.items():
+                value = self.line[printer].get(key, "")
+                if key not in ("Material $", "3D Cost") and le.text() != value:
+                    le.setText(value)
+        self._loading = False
+        self.calc = cost_engine.LineCostCalc(self.line)
+        self.refresh_costs()
+        self.mesh_lbl.setText(mesh_summary(self.line.get("mesh")))
+
+    def fill_from_stl(self):
+        """Analyze the drawing's STL (or one the user picks) and fill material and time inputs."""
+        drawing = self.line["fields"][0].strip()
+        candidates = mesh_engine.find_stl_files(drawing) if drawing else []
+        if candidates:
+            path = candidates[0]
+        else:
+            path, _ = QFileDialog.getOpenFileName(
+                self, f"STL for {drawing or 'this line'}", mesh_engine.DRAWINGS_FOLDER, "STL files (*.stl)"
+            )
+            if not path:
+                return
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            stats = mesh_engine.analyze_file(path)
+        except Exception as e:
+            QApplication.restoreOverrideCursor()
+            QMessageBox.warning(self, "From STL", f"Could not read {os.path.basename(path)}:\n{e}")
             return
-        auto_resize_lineedit(field)
-        self.dirty_tracker.mark_dirty()
+        QApplication.restoreOverrideCursor()
+
+        self.line["mesh"] = {k: stats[k] for k in ("file", "sha1", "volume_mm3", "area_mm2", "bbox_mm")}
+        self.line["mesh"]["auto"] = True
+        auto_fill_3d(self.line)
+        self.reload()
+        self.model.edited.emit()
+
+    def flush(self):
+        """Apply any pending recompute now; only the cost fields that changed are rewritten."""
+        self._recompute_timer.stop()
+        for (printer, key), text in self.calc.recompute().items():
+            (self.s_vars if printer == "stratasys" else self.f_vars)[key].setText(text)
+            self.text_updates += 1
+
+    def refresh_costs(self):
+        for k in ("Material $", "3D Cost"):
+            for widgets, printer in ((self.s_vars, "stratasys"), (self.f_vars, "formlabs")):
+                if widgets[k].text() != self.line[printer][k]:
+                    widgets[k].setText(self.line[printer][k])
+                    self.text_updates += 1
+
+
+class QuoteLineDelegate(QStyledItemDelegate):
+    """Paints the Open/Remove actions and hosts the 3D panel on detail rows."""
+    openRequested = Signal(int)    # line index
+    removeRequested = Signal(int)  # line index
 
-    def on_s_var_changed(self):
+    BTN_W = 58
+    BTN_SPACING = 4
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.detail_height = 0
+
+    def _action_rects(self, rect):
+        h = min(rect.height() - 4, 22)
+        y = rect.y() + (rect.height() - h) // 2
+        return [QRect(rect.x() + 4 + i * (self.BTN_W + self.BTN_SPACING), y, self.BTN_W, h)
+                for i in range(len(ACTION_LABELS))]
+
+    def paint(self, painter, option, index):
+        model = index.model()
+        if model.is_detail(index.row()):
+            return  # covered by the 3D panel once it has been built
+        if index.column() != COL_ACTIONS:
+            super().paint(painter, option, index)
+            return
+        style = option.widget.style() if option.widget else QApplication.style()
+        for label, rect in zip(ACTION_LABELS, self._action_rects(option.rect)):
+            btn = QStyleOptionButton()
+            btn.rect = rect
+            btn.text = label
+            btn.palette = option.palette
+            btn.state = QStyle.State_Enabled | QStyle.State_Raised
+            style.drawControl(QStyle.CE_PushButton, btn, painter, option.widget)
+
+    def editorEvent(self, event, model, option, index):
+        if (index.column() == COL_ACTIONS and not model.is_detail(index.row())
+                and event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton):
+            pos = event.position().toPoint()
+            open_rect, remove_rect = self._action_rects(option.rect)
+            line_idx = model.line_at(index.row())
+            if open_rect.contains(pos):
+                self.openRequested.emit(line_idx)
+                return True
+            if remove_rect.contains(pos):
+                self.removeRequested.emit(line_idx)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def createEditor(self, parent, option, index):
+        model = index.model()
+        if model.is_detail(index.row()):
+            panel = ThreeDPanel(model, model.lines[model.line_at(index.row())], parent)
+            self.detail_height = max(self.detail_height, panel.sizeHint().height())
+            return panel
+        editor = super().createEditor(parent, option, index)
+        if isinstance(editor, QLineEdit):
+            editor.setPlaceholderText(FIELD_PLACEHOLDERS[FIELD_COLS.get(index.column(), 0)])
+        return editor
+
+    def setEditorData(self, editor, index):
+        if isinstance(editor, ThreeDPanel):
+            return  # the panel reads its line dict directly
+        super().setEditorData(editor, index)
+
+    def setModelData(self, editor, model, index):
+        if isinstance(editor, ThreeDPanel):
+            return  # the panel writes its line dict directly
+        super().setModelData(editor, model, index)
+
+
+class QuoteLineView(QTableView):
+    """Line-item grid: cell editors only while editing; 3D panels only on detail rows."""
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.setModel(model)
+        self.line_delegate = QuoteLineDelegate(self)
+        self.setItemDelegate(self.line_delegate)
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.setEditTriggers(
+            QAbstractItemView.DoubleClicked | QAbstractItemView.SelectedClicked |
+            QAbstractItemView.EditKeyPressed | QAbstractItemView.AnyKeyPressed
+        )
+        self.setAlternatingRowColors(False)
+        self.setWordWrap(False)
+
+        vh = self.verticalHeader()
+        vh.setVisible(False)
+        vh.setSectionResizeMode(QHeaderView.Fixed)
+        vh.setDefaultSectionSize(LINE_ROW_HEIGHT)
+
+        hh = self.horizontalHeader()
+        hh.setStretchLastSection(False)
+        hh.setSectionResizeMode(QHeaderView.Interactive)
+        for col, width in ((COL_INCLUDE, 46), (COL_DRAWING, 150), (COL_MATERIAL, 170),
+                           (COL_QTY, 80), (COL_CUST_PN, 170), (COL_3D, 36),
+                           (COL_ACTIONS, 2 * (QuoteLineDelegate.BTN_W + QuoteLineDelegate.BTN_SPACING) + 8)):
+            self.setColumnWidth(col, width)
+        hh.setSectionResizeMode(COL_MATERIAL, QHeaderView.Stretch)
+        hh.setSectionResizeMode(COL_ACTIONS, QHeaderView.Fixed)
+
+        model.modelReset.connect(self.sync_detail_rows)
+        model.rowsInserted.connect(self.sync_detail_rows)
+        model.rowsRemoved.connect(self.sync_detail_rows)
+        self.verticalScrollBar().valueChanged.connect(self.open_visible_panels)
+        model.detailChanged.connect(self.reload_panel)
+
+    def reload_panel(self, line_idx):
+        model = self.model()
+        panel = self.indexWidget(model.index(model.row_of_line(line_idx) + 1, 0))
+        if isinstance(panel, ThreeDPanel):
+            panel.reload()
+
+    def open_panels(self):
+        """The 3D panels that have been built so far."""
+        model = self.model()
+        panels = []
+        for row in model.detail_rows():
+            panel = self.indexWidget(model.index(row, 0))
+            if isinstance(panel, ThreeDPanel):
+                panels.append(panel)
+        return panels
+
+    def flush_panels(self):
+        for panel in self.open_panels():
+            panel.flush()
+
+    def _detail_row_height(self):
+        return max(self.line_delegate.detail_height or DETAIL_ROW_HEIGHT, LINE_ROW_HEIGHT)
+
+    def sync_detail_rows(self, *_):
+        """Span detail rows across the grid; their 3D panels are built once scrolled into view."""
+        model = self.model()
+        self.clearSpans()
+        height = self._detail_row_height()
+        for row in model.detail_rows():
+            self.setSpan(row, 0, 1, model.columnCount())
+            self.setRowHeight(row, height)
+        self.open_visible_panels()
+
+    def open_visible_panels(self, *_):
+        """Build the 3D panel of every detail row that intersects the viewport."""
+        model = self.model()
+        viewport_h = self.viewport().height()
+        first = self.rowAt(0)
+        first = 0 if first < 0 else first
+        last = self.rowAt(viewport_h - 1)
+        last = model.rowCount() - 1 if last < 0 else last
+        before = self.line_delegate.detail_height
+        for row in range(first, last + 1):
+            if model.is_detail(row):
+                index = model.index(row, 0)
+                if not self.isPersistentEditorOpen(index):
+                    self.openPersistentEditor(index)
+        if self.line_delegate.detail_height != before:
+            # First real panel measured: fix up the estimated heights
+            height = self._detail_row_height()
+            for row in model.detail_rows():
+                self.setRowHeight(row, height)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.open_visible_panels()
+
+
+class BomMappingDialog(QDialog):
+    """Pick which BOM column feeds each Quote Info field (pre-filled from the header)."""
+    def __init__(self, header, mapping, sample=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Import BOM - Columns")
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+        layout.addLayout(form)
+
+        sample = sample or []
+        choices = ["(none)"]
+        for i, name in enumerate(header):
+            example = sample[i] if i < len(sample) and sample[i] else ""
+            label = name or f"Column {i + 1}"
+            choices.append(f"{label}  (e.g. {example})" if example else label)
+
+        self.combos = {}
+        for field in bom_import.FIELDS:
+            combo = QComboBox()
+            combo.addItems(choices)
+            col = mapping.get(field)
+            combo.setCurrentIndex(0 if col is None else col + 1)
+            form.addRow(bom_import.FIELD_LABELS[field], combo)
+            self.combos[field] = combo
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    def mapping(self):
+        return {field: (combo.currentIndex() - 1 if combo.currentIndex() > 0 else None)
+                for field, combo in self.combos.items()}
+
+
+class QuoteInfoTab(QWidget):
+    def __init__(self, dirty_tracker=None, parent=None):
+        super().__init__(parent)
+        self.dirty_tracker = dirty_tracker
+        self._loading = False
+        self.model = QuoteLineModel(self)
+        self.model.edited.connect(self._on_model_edited)
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(8, 8, 8, 8)
+        layout.setSpacing(5)
+
+        header = QWidget()
+        header_layout = QHBoxLayout(header)
+        header_layout.setContentsMargins(0, 0, 0, 0)
+        header_layout.setSpacing(6)
+        btn_add = QPushButton("Add Line")
+        btn_add.setFixedHeight(22)
+        btn_add.setStyleSheet("font-weight: bold;")
+        btn_add.clicked.connect(lambda: self.add_row(edit=True))
+        btn_email = QPushButton("Generate Email")
+        btn_email.setFixedHeight(22)
+        btn_email.setStyleSheet("font-weight: bold;")
+        btn_email.clicked.connect(self.handle_generate_email)
+        btn_reprice = QPushButton("Re-price 3D")
+        btn_reprice.setFixedHeight(22)
+        btn_reprice.setToolTip("Recalculate every 3D line with the current price table")
+        btn_reprice.clicked.connect(self.reprice_quote)
+        btn_bom = QPushButton("Import BOM")
+        btn_bom.setFixedHeight(22)
+        btn_bom.setToolTip("Add line items from a CSV or Excel BOM")
+        btn_bom.clicked.connect(self.import_bom)
+        header_layout.addWidget(btn_add)
+        header_layout.addWidget(btn_bom)
+        header_layout.addWidget(btn_email)
+        header_layout.addWidget(btn_reprice)
+        header_layout.addStretch()
+        header.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Fixed)
+        layout.addWidget(header)
+
+        note_lbl = QLabel(
+            "Do not need to include rev level in drawing number\n"
+            "Only drawings that are marked will generate emails"
+        )
+        note_lbl.setStyleSheet("font-size: 11px; color: #555; margin: 2px 0 0 0;")
+        note_lbl.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Fixed)
+        layout.addWidget(note_lbl)
+
+        self.view = QuoteLineView(self.model)
+        self.view.line_delegate.openRequested.connect(self.open_drawing)
+        self.view.line_delegate.removeRequested.connect(self.remove_row)
+        layout.addWidget(self.view)
+
+        self.add_row()
+
+    def _on_model_edited(self):
         if self._loading:
             return
-        self.update_costs()
         if self.dirty_tracker:
             self.dirty_tracker.mark_dirty()
 
-    def on_f_var_changed(self):
-        if self._loading:
+    def add_row(self, initial_data=None, edit=False):
+        self.model.append_lines([new_line(initial_data)])
+        self.view.scrollToBottom()
+        if edit:
+            row = self.model.row_of_line(len(self.model.lines) - 1)
+            idx = self.model.index(row, COL_DRAWING)
+            self.view.setCurrentIndex(idx)
+            self.view.edit(idx)
+
+    def add_lines(self, rows):
+        """Append many saved-shape rows in one model update (replaces a lone blank line)."""
+        lines = [new_line(rowdata) for rowdata in rows]
+        if not lines:
             return
-        self.update_costs()
-        if self.dirty_tracker:
+        blank = len(self.model.lines) == 1 and not any(f.strip() for f in self.model.lines[0]["fields"])
+        if blank:
+            self.model.set_lines(lines)
+        else:
+            self.model.append_lines(lines)
+        self.view.scrollToBottom()
+        if self.dirty_tracker and not self._loading:
             self.dirty_tracker.mark_dirty()
 
-    def _on_3d_toggled(self, checked):
-        if self._loading:
-            self.toggle_3d_tables(checked)
+    def import_bom(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Import BOM", "", "BOM files (*.csv *.xlsx *.xlsm);;All files (*)"
+        )
+        if not path:
             return
-        self.toggle_3d_tables(checked)
-        if self.dirty_tracker:
+        try:
+            rows = bom_import.read_table(path)
+        except Exception as e:
+            QMessageBox.warning(self, "Import BOM", f"Could not read the BOM:\n{e}")
+            return
+        if not rows:
+            QMessageBox.information(self, "Import BOM", "The file has no rows.")
+            return
+        header_row = bom_import.find_header(rows)
+        header = rows[header_row]
+        sample = rows[header_row + 1] if header_row + 1 < len(rows) else []
+        dialog = BomMappingDialog(header, bom_import.guess_mapping(header), sample, self)
+        if dialog.exec() != QDialog.Accepted:
+            return
+        mapping = dialog.mapping()
+        if mapping["drawing"] is None:
+            QMessageBox.warning(self, "Import BOM", "Choose the column that holds the drawing number.")
+            return
+
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            lines, stats = bom_import.build_lines(rows[header_row + 1:], mapping)
+            self.add_lines(lines)
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        msg = f"Imported {len(lines)} line(s) from {stats['rows']} BOM row(s)."
+        if stats["merged"]:
+            msg += f"\n{stats['merged']} duplicate row(s) merged (quantities added)."
+        if stats["blank"]:
+            msg += f"\n{stats['blank']} row(s) without a drawing number skipped."
+        if stats["unresolved"]:
+            msg += f"\n{len(stats['unresolved'])} drawing(s) not found in PDF Drawings."
+        if stats["unsummed"]:
+            msg += (f"\nQuantities not added for {len(stats['unsummed'])} merged drawing(s) "
+                    f"with non-numeric quantities - check: {', '.join(stats['unsummed'])}")
+        QMessageBox.information(self, "Import BOM", msg)
+
+    def remove_row(self, line_idx):
+        self.model.remove_line(line_idx)
+        if self.dirty_tracker and not self._loading:
             self.dirty_tracker.mark_dirty()
 
-    def open_drawing(self):
-        drawing_num = self.fields[0].text().strip()
+    def open_drawing(self, line_idx):
+        drawing_num = self.model.lines[line_idx]["fields"][0].strip()
         if not drawing_num or drawing_num == "Drawing Number":
             QMessageBox.warning(self, "No Drawing Number", "Please enter a drawing number first.")
             return
-        try:
-            from utilities import find_latest_pdf_with_rev
-        except ImportError:
-            def find_latest_pdf_with_rev(x): return (None, None)
         pdf_path, _ = find_latest_pdf_with_rev(drawing_num)
-        import os
         if pdf_path and os.path.exists(pdf_path):
             os.startfile(pdf_path)
         else:
             QMessageBox.warning(self, "Drawing Not Found", f"No drawing found for: {drawing_num}")
 
-    def toggle_3d_tables(self, checked):
-        self.table_frame.setVisible(checked)
-
-    def update_costs(self):
-        if not self.action_bar.btn_3d.isChecked():
-            return
-        s = {}
-        for k in STRATASYS_ORDER:
-            val = self.s_vars[k].text()
-            try:
-                s[k] = float(val)
-            except Exception:
-                s[k] = 0.0
-        try:
-            t_val = float(self.s_time.text())
-        except Exception:
-            t_val = 0.0
-        total = calculate_stratasys_cost(s)
-        self.s_material.setText(f"${total:.2f}")
-        self.s_3dcost.setText(f"${calculate_stratasys_3d_cost(total, t_val):.2f}")
-        f = {}
-        for k, v in self.f_vars.items():
-            if isinstance(v, QLineEdit) and k not in ("Material $", "3D Cost"):
-                try:
-                    f[k] = float(v.text())
-                except Exception:
-                    f[k] = 0.0
-        try:
-            t_f = float(self.f_vars["Time (hrs)"].text())
-        except Exception:
-            t_f = 0.0
-        mat = calculate_formlabs_cost(f)
-        if "Material $" in self.f_vars:
-            self.f_vars["Material $"].setText(f"${mat:.2f}")
-        if "3D Cost" in self.f_vars:
-            self.f_vars["3D Cost"].setText(f"${calculate_formlabs_3d_cost(mat, t_f):.2f}")
-
-    def get_row_data(self):
-        placeholders = ["Drawing Number", "Material", "Quantity", "Customer Part Number"]
-        fields = [self.fields[i].text().strip() if self.fields[i].text().strip() != placeholders[i] else "" for i in range(4)]
-        return {
-            "include": self.action_bar.btn_include.isChecked(),
-            "fields": fields,
-            "enable_3d": self.action_bar.btn_3d.isChecked(),
-            "stratasys": {k: self.s_vars[k].text() for k in STRATASYS_ORDER} | {
-                "Time (hrs)": self.s_time.text(),
-                "Material $": self.s_material.text(),
-                "3D Cost": self.s_3dcost.text()
-            },
-            "formlabs": {k: self.f_vars[k].text() for k in FORMLABS_HEADERS}
-        }
-        
-    def _on_include_toggled(self, checked):
-        if self._loading:
-            return
-        if self.dirty_tracker:
+    def reprice_quote(self):
+        self.view.flush_panels()
+        table = cost_engine.load_price_table(refresh=True)
+        changed, old_total, new_total = cost_engine.reprice_quote(self.model.lines, table)
+        for panel in self.view.open_panels():
+            panel.refresh_costs()
+        if changed and self.dirty_tracker:
             self.dirty_tracker.mark_dirty()
+        QMessageBox.information(
+            self, "Re-price 3D",
+            f"Price table: {table.version}\n"
+            f"{changed} line(s) changed\n"
+            f"3D total: ${old_total:,.2f} -> ${new_total:,.2f}"
+        )
+
+    def handle_generate_email(self):
+        quote_data = self.get_quote_info_data()
+        email_gen.generate_emails(quote_data, parent=self)
+
+    def get_quote_info_data(self, include_all=False):
+        self.view.flush_panels()  # don't export costs still waiting on the debounce timer
+        return [
+            export_line(line) for line in self.model.lines
+            if include_all or line["include"]
+        ]
+
+    def load_quote_info_data(self, data):
+        self._loading = True
+        self.model.set_lines(new_line(rowdata) for rowdata in data)
+        self._loading = False
+
+    def clear_quote_info_tab(self, skip_add=False):
+        self._loading = True
+        self.model.set_lines([] if skip_add else [new_line()])
+        self._loading = False
+
 
 _tab_instance = None
+_tab_builder = None
 
 def create_quote_info_tab(tab_widget: QWidget, dirty_tracker=None):
     global _tab_instance
@@ -400,13 +830,34 @@ def create_quote_info_tab(tab_widget: QWidget, dirty_tracker=None):
     layout.setContentsMargins(0, 0, 0, 0)
     layout.addWidget(_tab_instance)
 
+def set_tab_builder(builder):
+    """Register the callable launch.py uses to build this tab on first use."""
+    global _tab_builder
+    _tab_builder = builder
+
+def ensure_quote_info_tab():
+    """Return the tab instance, building it now if construction was deferred."""
+    if _tab_instance is None and _tab_builder is not None:
+        _tab_builder()
+    return _tab_instance
+
 def get_quote_info_data(include_all=False):
-    return _tab_instance.get_quote_info_data(include_all=include_all) if _tab_instance else []
+    tab = ensure_quote_info_tab()
+    return tab.get_quote_info_data(include_all=include_all) if tab else []
 
 def load_quote_info_data(data):
-    if _tab_instance:
-        _tab_instance.load_quote_info_data(data)
+    tab = ensure_quote_info_tab()
+    if tab:
+        tab.load_quote_info_data(data)
 
 def clear_quote_info_tab(skip_add=False):
     if _tab_instance:
         _tab_instance.clear_quote_info_tab(skip_add=skip_add)
+
+def quote_context():
+    """Drawing numbers and materials on the tab, for ranking vendors (empty until the tab is built)."""
+    lines = _tab_instance.model.lines if _tab_instance else []
+    return {
+        "drawings": [line["fields"][0] for line in lines],
+        "materials": [line["fields"][1] for line in lines],
+    }
@@ -0,0 +1,118 @@
+"""
+Question bank for the Checklist tab.
+
+checklist_questions.xlsx is read with openpyxl's streaming read-only mode and
+compiled into a compact form that the warm-start cache stores, keyed by the
+workbook's size and mtime, so a normal launch neither opens the workbook nor
+re-groups anything.
+
+Columns on the first sheet: Category | Question | Note | ID
+  - ID is a stable integer per question. Checklists store answers as
+    {ID: code}, so rewording a question doesn't touch saved files.
+  - Rows without an ID get one derived from "Category::Question"; that value
+    is also kept as an alias, so adding real IDs later doesn't orphan answers.
+
+Optional "Aliases" sheet: ID | Alias
+  - Alias is an old "Category::Question" key or an old ID. Use it when a
+    question is reworded or renumbered so answers saved under the old
+    wording/ID still land on the question.
+"""
+import os
+import zlib
+
+from utilities import lazy_import
+import doc_cache
+
+openpyxl = lazy_import("openpyxl")
+
+CACHE_KEY = "question_bank_v2"
+ALIAS_SHEET = "Aliases"
+
+
+def question_key(category, question):
+    """Legacy string key used by older checklist files."""
+    return f"{category}::{question}"
+
+
+def fallback_id(category, question):
+    """Deterministic ID for rows that don't have one in the workbook."""
+    return zlib.crc32(question_key(category, question).encode("utf-8")) & 0x7FFFFFFF
+
+
+def _as_int(value):
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def compile_question_bank(path):
+    """
+    Stream the workbook once. Returns
+      {"categories": {category: [[question, note, id], ...]}, "aliases": {alias: id}}
+    """
+    # If the Excel file with questions is missing, the tab just shows no questions.
+    if not os.path.exists(path):
+        return {"categories": {}, "aliases": {}}
+
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        grouped = {}
+        aliases = {}
+        for row in ws.iter_rows(min_row=2, max_col=4, values_only=True):
+            if not row or not any(row):
+                continue
+            category, question, note, qid = (tuple(row) + (None,) * 4)[:4]
+            if not category or not question:
+                continue
+            category, question = str(category).strip(), str(question).strip()
+            derived = fallback_id(category, question)
+            qid = _as_int(qid)
+            if qid is None:
+                qid = derived
+            else:
+                aliases[str(derived)] = qid
+            aliases[question_key(category, question)] = qid
+            grouped.setdefault(category, []).append([question, str(note or "").strip(), qid])
+
+        if ALIAS_SHEET in wb.sheetnames:
+            for row in wb[ALIAS_SHEET].iter_rows(min_row=2, max_col=2, values_only=True):
+                if not row or row[0] is None or not row[1]:
+                    continue
+                qid = _as_int(row[0])
+                if qid is not None:
+                    aliases.setdefault(str(row[1]).strip(), qid)
+    finally:
+        wb.close()  # read-only workbooks keep the file handle open until closed
+    return {"categories": grouped, "aliases": aliases}
+
+
+class QuestionBank:
+    """Compiled questions: grouped by category, plus the alias table for old answers."""
+    def __init__(self, compiled):
+        compiled = compiled or {}
+        self.grouped = {
+            cat: [(q, n, int(qid)) for q, n, qid in rows]
+            for cat, rows in (compiled.get("categories") or {}).items()
+        }
+        self.aliases = dict(compiled.get("aliases") or {})
+        self.ids = {qid for rows in self.grouped.values() for _, _, qid in rows}
+
+    def get(self, category, default=None):
+        return self.grouped.get(category, default)
+
+    def __contains__(self, category):
+        return category in self.grouped
+
+    def resolve(self, key):
+        """Map a saved answer key (ID, old ID or "Category::Question") to a current ID."""
+        qid = _as_int(key)
+        if qid in self.ids:
+            return qid
+        return self.aliases.get(str(key))
+
+
+def load_question_bank(path):
+    """Return the QuestionBank, served from the local cache unless the workbook changed."""
+    return QuestionBank(doc_cache.get(CACHE_KEY, path, compile_question_bank))
@@ -5,11 +5,15 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QPixmap, QCursor, QDoubleValidator
 from PySide6.QtCore import Qt
 
-from docx import Document
-from PIL import Image
 import io
+import base64
 
-from utilities import require_file
+from utilities import require_file, lazy_import
+import doc_cache
+
+# Only needed when the reference DOCX is actually parsed
+docx = lazy_import("docx")
+Image = lazy_import("PIL.Image")
 
 
 DOCX_PATH = r"P:\ENGINEERING\Design Checklist\supporting_documents\reference_tab_info.docx"
@@ -29,13 +33,18 @@ def get_reference_blocks(docx_path=DOCX_PATH):
     """
     Return parsed 'blocks' for the reference_tab_info.docx,
     reusing a cached parse unless the file changed on disk.
+    The parsed blocks (images included) also live in the local warm-start
+    cache, so a normal launch doesn't open the DOCX on the share at all.
     """
     mtime = _get_docx_mtime(docx_path)
     if (_DOCX_CACHE["path"] != docx_path or
         _DOCX_CACHE["mtime"] != mtime or
         _DOCX_CACHE["blocks"] is None):
         # IMPORTANT: parse the file here (do NOT call get_reference_blocks again)
-        blocks = parse_docx_blocks(docx_path)
+        blocks = doc_cache.get(
+            "reference_blocks", docx_path, parse_docx_blocks,
+            encode=_encode_blocks, decode=_decode_blocks
+        ) or []
         _DOCX_CACHE.update({"path": docx_path, "mtime": mtime, "blocks": blocks})
     return _DOCX_CACHE["blocks"]
 
@@ -43,6 +52,24 @@ def get_reference_blocks(docx_path=DOCX_PATH):
 def invalidate_reference_blocks_cache():
     """Call this if you need to force a rebuild (e.g., a manual 'Refresh')."""
     _DOCX_CACHE["blocks"] = None
+    doc_cache.invalidate("reference_blocks")
+
+
+def _encode_blocks(blocks):
+    """JSON-safe form of parsed blocks: image bytes become base64 text."""
+    return [
+        [header, [[t, base64.b64encode(item).decode("ascii") if t == "image" else item]
+                  for t, item in content]]
+        for header, content in blocks
+    ]
+
+
+def _decode_blocks(encoded):
+    return [
+        (header, [(t, base64.b64decode(item) if t == "image" else item)
+                  for t, item in content])
+        for header, content in encoded
+    ]
 
 
 class ScaledImageLabel(QLabel):
@@ -149,6 +176,11 @@ def open_roto_die_list():
         QMessageBox.critical(None, "File Not Found", f"Could not find file:\n{ROTO_DIE_PATH}")
 
 def parse_docx_blocks(path):
+    """
+    Parse the reference DOCX into plain data (no Qt, no docx objects kept):
+      [(header, [("text", str) | ("table", [[cell, ...], ...]) | ("image", bytes), ...]), ...]
+    Runs off the GUI thread when the warm-start cache refreshes it.
+    """
     from docx.text.paragraph import Paragraph
     from docx.table import Table
 
@@ -157,11 +189,11 @@ def parse_docx_blocks(path):
     if not os.path.exists(path):
         return []
 
-    doc = Document(path)
+    doc = docx.Document(path)
     blocks = []
     current_header = None
     current_content = []
-    rels = doc.part._rels
+    related = doc.part.related_parts
     for element in doc.element.body.iterchildren():
         tag = element.tag.lower()
         if tag.endswith("}p"):
@@ -174,10 +206,16 @@ def parse_docx_blocks(path):
                 current_header = text
                 current_content = []
             else:
-                current_content.append(para)
+                if text:
+                    current_content.append(("text", text))
+                for rid in element.xpath(".//a:blip/@r:embed"):
+                    part = related.get(rid)
+                    if part is not None:
+                        current_content.append(("image", part.blob))
         elif tag.endswith("}tbl"):
             tbl = Table(element, doc)
-            current_content.append(tbl)
+            rows = [[cell.text.strip() for cell in row.cells] for row in tbl.rows]
+            current_content.append(("table", rows))
     if current_header is not None:
         blocks.append((current_header, current_content))
     return blocks
@@ -243,7 +281,7 @@ def build_collapsibles(parent_layout, blocks):
 
         parent_layout.addWidget(container)
 
-def render_table(parent_layout, table):
+def render_table(parent_layout, rows):
     from PySide6.QtWidgets import QGridLayout, QSizePolicy
 
     frame = QFrame()
@@ -255,7 +293,9 @@ def render_table(parent_layout, table):
     frame.setLayout(grid)
     frame.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Maximum)
 
-    col_count = max(len(r.cells) for r in table.rows)
+    if not rows:
+        return
+    col_count = max(len(r) for r in rows)
     font_metrics_normal = frame.fontMetrics()
 
     # Bold font metrics for header sizing
@@ -266,18 +306,18 @@ def render_table(parent_layout, table):
     # First pass: measure max width for each column
     col_widths = [0] * col_count
     PAD = 14  # a little padding so text isn't flush
-    for r, row in enumerate(table.rows):
-        for c in range(len(row.cells)):
-            text = row.cells[c].text.strip()
+    for r, row in enumerate(rows):
+        for c in range(len(row)):
+            text = row[c]
             fm = font_metrics_bold if r == 0 else font_metrics_normal
             width = fm.horizontalAdvance(text) + PAD
             if width > col_widths[c]:
                 col_widths[c] = width
 
     # Apply widths and add labels
-    for r, row in enumerate(table.rows):
-        for c in range(len(row.cells)):
-            text = row.cells[c].text.strip()
+    for r, row in enumerate(rows):
+        for c in range(len(row)):
+            text = row[c]
             lbl = QLabel(text)
             lbl.setWordWrap(False)  # don't wrap; rely on auto width
             if r == 0:
@@ -2,20 +2,26 @@ import os
 import json
 import re
 from datetime import datetime
+from html import escape
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
     QPushButton, QLineEdit, QLabel, QSizePolicy, QMessageBox,
-    QAbstractItemView, QHeaderView
+    QAbstractItemView, QHeaderView, QSplitter, QTextBrowser
 )
 from PySide6.QtCore import Qt, QTimer
 
+import startup_profile
+
 # --------- paths ---------
 # Match launch.py
 CHECKLISTS_DIR = r"P:\ENGINEERING\Design Checklist\json_files"
 
 HEADERS = ["ID #", "Customer", "Filename", "Date", "Last Edited By"]
 
+# Preview pane: how much of each vendor's quote text to show
+PREVIEW_SNIPPET_CHARS = 160
+
 # Per-user settings file (width persistence)
 APPDATA_DIR = os.environ.get("APPDATA") or os.path.expanduser("~")
 SETTINGS_DIR = os.path.join(APPDATA_DIR, "EngineeringChecklist")
@@ -65,6 +71,102 @@ def _extract_id_from_top_fields(top_fields):
     return ""
 
 
+def _summarize_checklist(data):
+    """
+    Boil a loaded checklist JSON down to the few things the preview pane shows.
+    Kept small on purpose: one of these is cached per file in the scan index.
+    """
+    checklist = data.get("checklist") or {}
+    top = list(checklist.get("top_fields") or [])
+    # Same legacy remap as launch.load_checklist_file: [Customer, Opp, ID, Sales]
+    if len(top) == 3:
+        top = [top[0], top[1], "", top[2]]
+    top = [(v if isinstance(v, str) else "") for v in top] + [""] * (4 - len(top))
+
+    drawings = []
+    for row in data.get("quote_info") or []:
+        fields = row.get("fields") if isinstance(row, dict) else None
+        if not fields or not isinstance(fields[0], str) or not fields[0].strip():
+            continue
+        drawings.append((
+            fields[0].strip(),
+            (fields[1] if len(fields) > 1 else "") or "",
+            (fields[2] if len(fields) > 2 else "") or "",
+        ))
+
+    vendors = []
+    for row in data.get("vendor_quotes") or []:
+        if not row:
+            continue
+        name = (row[0] if len(row) > 0 else "") or ""
+        text = ((row[1] if len(row) > 1 else "") or "").strip()
+        if len(text) > PREVIEW_SNIPPET_CHARS:
+            text = text[:PREVIEW_SNIPPET_CHARS].rstrip() + "…"
+        shots = len(row[2]) if len(row) > 2 and row[2] else 0
+        vendors.append((name, text, shots))
+
+    return {
+        "top_fields": top[:4],
+        "drawings": drawings,
+        "vendors": vendors,
+        "notes": bool((data.get("notes") or "").strip()),
+    }
+
+
+def _revisions_from_filename(display_name):
+    """
+    Auto-saved names look like "MT29941_Rev1 CD27001_Rev0.2"; pull the revision
+    that was current when the quote was saved, keyed by upper-cased drawing.
+    """
+    revs = {}
+    for m in re.finditer(r"(\S+?)_Rev([0-9]+(?:\.[0-9]+)?)", display_name or "", re.IGNORECASE):
+        revs[m.group(1).upper()] = m.group(2)
+    return revs
+
+
+def render_preview_html(display_name, summary):
+    """Build the read-only preview HTML for one checklist summary."""
+    if not summary:
+        return f"<p><b>{escape(display_name)}</b></p><p><i>Could not read this checklist.</i></p>"
+
+    cust, opp, id_val, sales = summary["top_fields"]
+    parts = [f"<h3 style='margin:0 0 6px 0;'>{escape(display_name)}</h3>"]
+    parts.append("<table cellspacing='0' cellpadding='1'>")
+    for label, value in (("ID #", id_val), ("Customer", cust), ("Opp Name", opp), ("Sales/CSR", sales)):
+        parts.append(f"<tr><td><b>{label}:</b>&nbsp;</td><td>{escape(value) or '—'}</td></tr>")
+    parts.append("</table>")
+
+    revs = _revisions_from_filename(display_name)
+    parts.append("<p style='margin:8px 0 2px 0;'><b><u>Drawings</u></b></p>")
+    if summary["drawings"]:
+        parts.append("<ul style='margin:0;'>")
+        for drawing, material, qty in summary["drawings"]:
+            rev = revs.get(drawing.upper())
+            line = escape(drawing) + (f" <b>Rev{escape(rev)}</b>" if rev else "")
+            extra = ", ".join(x for x in (escape(material), f"Qty {escape(qty)}" if qty else "") if x)
+            if extra:
+                line += f" <span style='color:#555;'>({extra})</span>"
+            parts.append(f"<li>{line}</li>")
+        parts.append("</ul>")
+    else:
+        parts.append("<p style='margin:0;'><i>None</i></p>")
+
+    parts.append("<p style='margin:8px 0 2px 0;'><b><u>Vendor Quotes</u></b></p>")
+    if summary["vendors"]:
+        for name, snippet, shots in summary["vendors"]:
+            shot_txt = f" <span style='color:#555;'>[{shots} screenshot{'s' if shots != 1 else ''}]</span>" if shots else ""
+            parts.append(f"<p style='margin:4px 0 0 0;'><b>{escape(name) or 'Unnamed vendor'}</b>{shot_txt}</p>")
+            if snippet:
+                body = escape(snippet).replace("\n", "<br>")
+                parts.append(f"<p style='margin:0 0 0 10px; color:#333;'>{body}</p>")
+    else:
+        parts.append("<p style='margin:0;'><i>None</i></p>")
+
+    if summary.get("notes"):
+        parts.append("<p style='margin:8px 0 0 0; color:#555;'><i>Has additional notes</i></p>")
+    return "".join(parts)
+
+
 class SavedChecklistsTab(QWidget):
     def __init__(self, load_checklist_callback=None, parent=None):
         super().__init__(parent)
@@ -119,10 +221,21 @@ class SavedChecklistsTab(QWidget):
         # Sorting enabled (we'll default to Date ↓ after populate)
         self.table.setSortingEnabled(True)
 
-        layout.addWidget(self.table, 1)
+        # Read-only preview of the selected file (no tab widgets are touched)
+        self.preview = QTextBrowser()
+        self.preview.setOpenLinks(False)
+        self.preview.setPlaceholderText("Select a checklist to preview it.")
+
+        splitter = QSplitter(Qt.Horizontal)
+        splitter.addWidget(self.table)
+        splitter.addWidget(self.preview)
+        splitter.setStretchFactor(0, 3)
+        splitter.setStretchFactor(1, 2)
+        layout.addWidget(splitter, 1)
 
         # --------- cache + debounce ---------
         self._entries = []  # cached (customer, filename, mtime, user, id_val)
+        self._meta = {}     # filename -> preview summary, filled by the same scan
 
         self._search_timer = QTimer(self)
         self._search_timer.setSingleShot(True)
@@ -131,6 +244,7 @@ class SavedChecklistsTab(QWidget):
         self.search.textChanged.connect(self._on_search_changed)
         self.btn_refresh.clicked.connect(lambda: self.update_table(rescan=True))
         self.btn_open.clicked.connect(self.open_selected)
+        self.table.itemSelectionChanged.connect(self.update_preview)
 
         # Width persistence flags
         self._has_saved_widths = False
@@ -198,6 +312,8 @@ class SavedChecklistsTab(QWidget):
         Scans the directory with os.scandir() and parses each JSON once.
         """
         entries = []
+        meta = {}
+        self._meta = meta
 
         # If the directory doesn't exist (e.g., P:\ is gone), return empty list
         if not os.path.isdir(CHECKLISTS_DIR):
@@ -237,6 +353,9 @@ class SavedChecklistsTab(QWidget):
                         # ID detection (numeric only)
                         id_val = _extract_id_from_top_fields(top)
 
+                        # Preview summary comes from the same parse
+                        meta[name] = _summarize_checklist(data)
+
                     except Exception:
                         pass  # keep defaults
 
@@ -263,7 +382,8 @@ class SavedChecklistsTab(QWidget):
         """
         # Rebuild cache only when asked (first load / Refresh)
         if rescan or not self._entries:
-            self._entries = self.list_files()
+            with startup_profile.span("scan json_files archive", "file"):
+                self._entries = self.list_files()
 
         q = (self.search.text() or "").strip().lower()
 
@@ -317,6 +437,25 @@ class SavedChecklistsTab(QWidget):
         self.table.setSortingEnabled(True)
         self.table.sortItems(3, Qt.SortOrder.DescendingOrder)
 
+    def update_preview(self):
+        """Render the selected file's summary from the scan index (file read only as fallback)."""
+        sel = self.table.currentRow()
+        item = self.table.item(sel, 2) if sel >= 0 else None
+        if item is None:
+            self.preview.clear()
+            return
+        display_name = item.text()
+        fname = f"{display_name}.json"
+        summary = self._meta.get(fname)
+        if summary is None:
+            try:
+                with open(os.path.join(CHECKLISTS_DIR, fname), "r", encoding="utf-8") as f:
+                    summary = _summarize_checklist(json.load(f))
+                self._meta[fname] = summary
+            except Exception:
+                summary = None
+        self.preview.setHtml(render_preview_html(display_name, summary))
+
     def open_selected(self):
         sel = self.table.currentRow()
         if sel < 0:
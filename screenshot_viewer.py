@@ -0,0 +1,221 @@
+"""
+Full-size viewer for vendor-quote screenshots.
+
+The image is drawn in a QGraphicsView by a tiled level-of-detail item: at any
+zoom only the TILE x TILE tiles on screen are painted, each taken from the
+pyramid level closest to screen resolution (level n = 1/2**n scale). The
+viewer keeps only the encoded bytes: each tile is decoded on demand with
+QImageReader (clip rect + scaled size for its level) and kept in a small LRU,
+so no full-size pixmap is ever held and memory follows the viewport rather
+than the image. JPEG decodes just the clipped, downscaled region; formats
+without native clipping (PNG) decode the whole image briefly per tile miss.
+
+Wheel zooms around the cursor, drag pans, a click (without dragging) closes;
+0 fits the window, 1 shows actual size.
+"""
+import math
+from collections import OrderedDict
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QLabel, QGraphicsView, QGraphicsScene,
+    QGraphicsItem, QStyleOptionGraphicsItem
+)
+from PySide6.QtGui import QGuiApplication, QPainter, QPixmap, QImageReader
+from PySide6.QtCore import Qt, QRect, QRectF, QSize, QBuffer, QByteArray
+
+TILE = 512
+TILE_CACHE_BYTES = 64 * 1024 * 1024   # a few screens' worth of tiles
+ZOOM_STEP = 1.25
+MAX_ZOOM = 8.0
+
+
+class TiledImageItem(QGraphicsItem):
+    """Draws encoded image bytes tile by tile from the pyramid level that matches the zoom."""
+    def __init__(self, data):
+        super().__init__()
+        self.data = QByteArray(data)
+        size = self._reader()[0].size()   # from the header, nothing decoded yet
+        self.width, self.height = max(size.width(), 0), max(size.height(), 0)
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)  # fills exposedRect
+        longest = max(self.width, self.height, 1)
+        self.max_level = max(0, math.ceil(math.log2(longest / TILE)))
+        self._tiles = OrderedDict()   # (level, col, row) -> QPixmap
+        self._tile_bytes = 0
+
+    def _reader(self):
+        """A fresh reader over the bytes, with its buffer (which the caller keeps alive)."""
+        buf = QBuffer(self.data)
+        buf.open(QBuffer.ReadOnly)
+        return QImageReader(buf), buf
+
+    def is_null(self):
+        return not (self.width and self.height)
+
+    def boundingRect(self):
+        return QRectF(0, 0, self.width, self.height)
+
+    def level_for(self, scale):
+        """Coarsest level that still has at least one source pixel per screen pixel."""
+        if scale <= 0:
+            return self.max_level
+        return min(self.max_level, max(0, int(math.floor(math.log2(1.0 / scale)))))
+
+    def _tile(self, level, col, row):
+        key = (level, col, row)
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+            return tile
+        span = TILE << level   # source pixels covered by one tile at this level
+        x, y = col * span, row * span
+        w = min(span, self.width - x)
+        h = min(span, self.height - y)
+        reader, _buf = self._reader()
+        reader.setClipRect(QRect(x, y, w, h))
+        if level:
+            reader.setScaledSize(QSize(max(1, math.ceil(w / (1 << level))), max(1, math.ceil(h / (1 << level)))))
+        tile = QPixmap.fromImage(reader.read())
+        if tile.isNull():
+            return None
+        self._tiles[key] = tile
+        self._tile_bytes += tile.width() * tile.height() * 4
+        while self._tile_bytes > TILE_CACHE_BYTES and len(self._tiles) > 1:
+            _key, old = self._tiles.popitem(last=False)
+            self._tile_bytes -= old.width() * old.height() * 4
+        return tile
+
+    def paint(self, painter, option, widget=None):
+        scale = QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+        level = self.level_for(scale)
+        span = TILE << level
+        exposed = option.exposedRect.intersected(self.boundingRect())
+        if exposed.isEmpty():
+            return
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, scale * (1 << level) < 1.0)
+        first_col, last_col = int(exposed.left()) // span, int(math.ceil(exposed.right())) // span
+        first_row, last_row = int(exposed.top()) // span, int(math.ceil(exposed.bottom())) // span
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                x, y = col * span, row * span
+                if x >= self.width or y >= self.height:
+                    continue
+                tile = self._tile(level, col, row)
+                if tile is None:
+                    continue
+                w = min(span, self.width - x)
+                h = min(span, self.height - y)
+                painter.drawPixmap(QRectF(x, y, w, h), tile, QRectF(tile.rect()))
+
+    def tile_usage(self):
+        return len(self._tiles), self._tile_bytes
+
+
+class ScreenshotView(QGraphicsView):
+    def __init__(self, data, on_click=None, parent=None):
+        super().__init__(parent)
+        self.on_click = on_click
+        self.item = TiledImageItem(data)
+        scene = QGraphicsScene(self)
+        scene.addItem(self.item)
+        scene.setSceneRect(self.item.boundingRect())
+        self.setScene(scene)
+        self.setDragMode(QGraphicsView.ScrollHandDrag)
+        self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
+        self.setResizeAnchor(QGraphicsView.AnchorViewCenter)
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        self.setBackgroundBrush(Qt.darkGray)
+        self._fitted = True
+        self._press_pos = None
+
+    def scale_factor(self):
+        return self.transform().m11()
+
+    def fit(self):
+        self._fitted = True
+        self.resetTransform()
+        rect = self.item.boundingRect()
+        view = self.viewport().rect()
+        factor = min(view.width() / max(rect.width(), 1), view.height() / max(rect.height(), 1), 1.0)
+        self.scale(factor, factor)
+
+    def actual_size(self):
+        self._fitted = False
+        self.resetTransform()
+
+    def zoom(self, factor):
+        current = self.scale_factor()
+        fit = min(self.viewport().width() / max(self.item.boundingRect().width(), 1),
+                  self.viewport().height() / max(self.item.boundingRect().height(), 1), 1.0)
+        target = min(max(current * factor, fit), MAX_ZOOM)
+        if target != current:
+            self._fitted = False
+            self.scale(target / current, target / current)
+
+    def wheelEvent(self, event):
+        steps = event.angleDelta().y() / 120.0
+        if steps:
+            self.zoom(ZOOM_STEP ** steps)
+        event.accept()
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key_0:
+            self.fit()
+        elif event.key() == Qt.Key_1:
+            self.actual_size()
+        elif event.key() in (Qt.Key_Plus, Qt.Key_Equal):
+            self.zoom(ZOOM_STEP)
+        elif event.key() == Qt.Key_Minus:
+            self.zoom(1 / ZOOM_STEP)
+        else:
+            super().keyPressEvent(event)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self._fitted:
+            self.fit()
+
+    def mousePressEvent(self, event):
+        self._press_pos = event.position()
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        super().mouseReleaseEvent(event)
+        pressed, self._press_pos = self._press_pos, None
+        if pressed is not None and callable(self.on_click):
+            moved = event.position() - pressed
+            if abs(moved.x()) + abs(moved.y()) < QGuiApplication.styleHints().startDragDistance():
+                self.on_click()
+
+
+class ScreenshotViewer(QDialog):
+    def __init__(self, data, parent=None, title="Screenshot (Full Size)"):
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        self.setModal(True)
+
+        layout = QVBoxLayout(self)
+        self.view = ScreenshotView(data, on_click=self.accept, parent=self)
+        layout.addWidget(self.view)
+
+        hint = QLabel("<span style='font-size:15px; font-weight:bold; text-decoration:underline;'>Click image to close</span>"
+                      "<span style='color:#666;'> &nbsp; Scroll to zoom, drag to pan, 0 = fit, 1 = actual size</span>")
+        hint.setAlignment(Qt.AlignCenter)
+        layout.addWidget(hint)
+
+        screen = QGuiApplication.primaryScreen().availableGeometry()
+        self.resize(min(self.view.item.width + 40, int(screen.width() * 0.9)),
+                    min(self.view.item.height + 60, int(screen.height() * 0.9)))
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.view.fit()
+
+
+def show_screenshot(data, parent=None):
+    """Open the viewer modally for an image's encoded bytes (PNG/JPEG)."""
+    if not data:
+        return
+    viewer = ScreenshotViewer(data, parent)
+    if viewer.view.item.is_null():
+        return
+    viewer.exec()
@@ -0,0 +1,216 @@
+"""
+Wall-clock timeline of app startup, enabled with `launch.py --profile-startup`.
+
+Spans are recorded for first-time module imports, each tab factory, each
+supporting-file read on the P: share and the first paint of the main window.
+The timeline is written to JSON under %APPDATA%\\EngineeringChecklist and
+summarized in a dialog. When profiling is off, span() is a no-op.
+
+Only the standard library is imported at module level so this can be loaded
+before everything it measures.
+"""
+import os
+import sys
+import json
+import time
+import builtins
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+APPDATA_DIR = os.environ.get("APPDATA") or os.path.expanduser("~")
+SETTINGS_DIR = os.path.join(APPDATA_DIR, "EngineeringChecklist")
+
+FLAG = "--profile-startup"
+
+_T0 = time.perf_counter()  # ~process start: this module is imported first
+_enabled = False
+_spans = []       # {"name", "category", "start_ms", "end_ms", "depth", "nested", "thread"}
+_local = threading.local()   # per-thread stack of open span categories (imports also run on workers)
+_real_import = None
+
+
+def _now_ms():
+    return (time.perf_counter() - _T0) * 1000.0
+
+
+def _stack():
+    """Categories of the spans currently open on this thread."""
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def enable_from_argv(argv=None):
+    """Turn profiling on if --profile-startup is on the command line."""
+    argv = sys.argv if argv is None else argv
+    if FLAG in argv:
+        enable()
+    return _enabled
+
+
+def enable():
+    global _enabled
+    _enabled = True
+    _install_import_timer()
+
+
+def is_enabled():
+    return _enabled
+
+
+@contextmanager
+def span(name, category="misc"):
+    """Record a wall-clock span (no-op unless profiling is enabled)."""
+    if not _enabled:
+        yield
+        return
+    stack = _stack()
+    entry = {
+        "name": name,
+        "category": category,
+        "start_ms": _now_ms(),
+        "end_ms": None,
+        "depth": len(stack),
+        "nested": category in stack,  # inside a span of the same kind on this thread
+        "thread": threading.current_thread().name,
+    }
+    _spans.append(entry)
+    stack.append(category)
+    try:
+        yield
+    finally:
+        stack.pop()
+        entry["end_ms"] = _now_ms()
+
+
+def mark(name, category="event"):
+    """Record an instant (zero-length) event."""
+    if _enabled:
+        t = _now_ms()
+        _spans.append({"name": name, "category": category, "start_ms": t, "end_ms": t,
+                       "depth": len(_stack()), "nested": False, "thread": threading.current_thread().name})
+
+
+# ---------- Import timing ----------
+
+def _install_import_timer():
+    global _real_import
+    if _real_import is not None:
+        return
+    _real_import = builtins.__import__
+
+    def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules:
+            return _real_import(name, globals, locals, fromlist, level)
+        with span(f"import {name}", "import"):
+            return _real_import(name, globals, locals, fromlist, level)
+
+    builtins.__import__ = timed_import
+
+
+def _uninstall_import_timer():
+    global _real_import
+    if _real_import is not None:
+        builtins.__import__ = _real_import
+        _real_import = None
+
+
+# ---------- First paint + report ----------
+
+def watch_first_paint(widget, on_painted):
+    """Call on_painted() once, right after the widget's first paint event."""
+    from PySide6.QtCore import QObject, QEvent, QTimer
+
+    class _FirstPaintFilter(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint:
+                mark("first paint", "window")
+                obj.removeEventFilter(self)
+                QTimer.singleShot(0, on_painted)
+            return False
+
+    widget._first_paint_filter = _FirstPaintFilter(widget)
+    widget.installEventFilter(widget._first_paint_filter)
+
+
+def finish(path=None):
+    """Stop recording and write the timeline JSON. Returns the path (or None)."""
+    global _enabled
+    _enabled = False
+    _uninstall_import_timer()
+
+    if path is None:
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(SETTINGS_DIR, f"startup_profile_{stamp}.json")
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "total_ms": round(_now_ms(), 1),
+        "spans": [
+            dict(s, start_ms=round(s["start_ms"], 2),
+                 end_ms=round(s["end_ms"] if s["end_ms"] is not None else s["start_ms"], 2))
+            for s in _spans
+        ],
+    }
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    except Exception as e:
+        print(f"[StartupProfile] Failed to write {path}: {e}")
+        return None
+    return path
+
+
+def summarize(spans=None, top=15):
+    """
+    Return (category_totals, slowest) for the recorded spans.
+    Category totals skip spans nested inside another span of the same category
+    so nested imports aren't counted twice.
+    """
+    spans = _spans if spans is None else spans
+    totals = {}
+    for s in spans:
+        if s["nested"] or s["end_ms"] is None:
+            continue
+        totals[s["category"]] = totals.get(s["category"], 0.0) + (s["end_ms"] - s["start_ms"])
+    timed = [s for s in spans if s["end_ms"] is not None and s["end_ms"] > s["start_ms"]]
+    slowest = sorted(timed, key=lambda s: s["end_ms"] - s["start_ms"], reverse=True)[:top]
+    return totals, slowest
+
+
+def show_summary_dialog(parent, path):
+    from html import escape
+    from PySide6.QtWidgets import QDialog, QVBoxLayout, QTextEdit
+
+    totals, slowest = summarize()
+    first_paint = next((s["start_ms"] for s in _spans if s["name"] == "first paint"), None)
+
+    lines = ["<h3 style='margin:0;'>Startup profile</h3>"]
+    if first_paint is not None:
+        lines.append(f"<p><b>First paint:</b> {first_paint:.0f} ms after start</p>")
+    lines.append("<p><b>By category</b></p><table cellpadding='2'>")
+    for cat, ms in sorted(totals.items(), key=lambda kv: kv[1], reverse=True):
+        lines.append(f"<tr><td>{escape(cat)}</td><td align='right'>{ms:.0f} ms</td></tr>")
+    lines.append("</table><p><b>Slowest spans</b></p><table cellpadding='2'>")
+    lines.append("<tr><th align='left'>Span</th><th>Category</th><th>Start</th><th>Duration</th></tr>")
+    for s in slowest:
+        lines.append(
+            f"<tr><td>{escape(s['name'])}</td><td>{escape(s['category'])}</td>"
+            f"<td align='right'>{s['start_ms']:.0f} ms</td>"
+            f"<td align='right'><b>{s['end_ms'] - s['start_ms']:.0f} ms</b></td></tr>"
+        )
+    lines.append("</table>")
+    if path:
+        lines.append(f"<p style='color:#555;'>Full timeline: {escape(path)}</p>")
+
+    dialog = QDialog(parent)
+    dialog.setWindowTitle("Startup Profile")
+    dialog.resize(700, 520)
+    layout = QVBoxLayout(dialog)
+    text_box = QTextEdit()
+    text_box.setReadOnly(True)
+    text_box.setHtml("".join(lines))
+    layout.addWidget(text_box)
+    dialog.exec()
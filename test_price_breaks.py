@@ -0,0 +1,94 @@
+"""Tests for the quote-text price-break parser and the comparison matrix (python -m pytest)."""
+import math
+
+import pytest
+
+import price_breaks
+
+
+@pytest.mark.parametrize("line, expected", [
+    ("Qty 500 - $0.37 ea", [("break", 500.0, 0.37)]),
+    ("1,000 pcs @ .29", [("break", 1000.0, 0.29)]),
+    ("100 @ .50, 500 @ .40", [("break", 100.0, 0.5), ("break", 500.0, 0.4)]),
+    ("5000 / $1,150.00 total", [("break", 5000.0, 0.23)]),
+    ("10K @ $12/M", [("break", 10000.0, 0.012)]),
+    ("100 pcs $1.25 ea", [("break", 100.0, 1.25)]),
+    ("Qty: 100  Price: $1.25", [("break", 100.0, 1.25)]),
+    ("Quote #12345 - $500 for 100 pcs", [("break", 100.0, 5.0)]),
+    ("PO 4471 - 500 @ $1.10", [("break", 500.0, 1.1)]),
+    ("Qty 100 $1.50 each", [("break", 100.0, 1.5)]),
+    ("Qty 250 $2.10/ea", [("break", 250.0, 2.1)]),
+    ("250 $2.10 ea", [("break", 250.0, 2.1)]),
+    ("QTY 1000  $0.45 EA", [("break", 1000.0, 0.45)]),
+    ("Rev 3 - 100 @ $1", [("break", 100.0, 1.0)]),
+    ("1-99 pcs $3.00 ea", [("break", 1.0, 3.0)]),
+    ("100-499: $2.50", [("break", 100.0, 2.5)]),
+])
+def test_breaks(line, expected):
+    assert price_breaks.parse_line(line) == expected
+
+
+@pytest.mark.parametrize("line", [
+    "Ref #88213 @ $2",
+    "Dated 10/12/2025 - $1 ea",
+    "Call 555-1234",
+    "Quote valid 30 days",
+    "qty 2500 .19",
+])
+def test_not_breaks(line):
+    assert price_breaks.parse_line(line) == []
+
+
+def test_lead_time_and_charges():
+    assert price_breaks.parse_line("Lead time: 3-4 weeks ARO") == [("lead", 28)]
+    assert price_breaks.parse_line("Ships 10 business days ARO") == [("lead", 14)]
+    assert price_breaks.parse_line("Tooling $450") == [("charge", 450.0)]
+    assert price_breaks.parse_line("Qty 100: $37.00 ea, lead time 4 weeks") == [("lead", 28), ("break", 100.0, 37.0)]
+
+
+@pytest.mark.parametrize("line, part", [
+    ("CD1234:", "CD1234"),
+    ("MT-5678 - 250 @ $1.10", "MT_5678"),
+    ("mis-2001 rev B:", "MIS_2001"),
+    ("Part #: AB-1234", "AB_1234"),
+])
+def test_part_headers(line, part):
+    assert price_breaks.parse_line(line)[0] == ("part", part)
+
+
+def test_po_number_is_not_a_part():
+    table = price_breaks.parse_quote("CD1000:\n100 @ $1\nPO 4471 - thanks\n500 @ $0.80")
+    assert table["breaks"] == [["CD1000", 100.0, 1.0], ["CD1000", 500.0, 0.8]]
+
+
+def test_parse_quote():
+    table = price_breaks.parse_quote(
+        "Lead time: 2 weeks\nDie charge: $1,200\n"
+        "CD1234:\n  Qty 100 - $1.50 ea\n  Qty 1,000 - $1.00 ea\n  Setup $75\n"
+        "MT-5678 - 250 @ $1.10\n")
+    assert table["breaks"] == [["CD1234", 100.0, 1.5], ["CD1234", 1000.0, 1.0], ["MT_5678", 250.0, 1.1]]
+    assert table["lead_days"] == 14
+    assert table["charges"] == {"": 1200.0, "CD1234": 75.0}
+
+
+def test_compare_step_and_interp():
+    a = price_breaks.parse_quote("100 @ $1.00\n1000 @ $0.50\nTooling $100")
+    b = price_breaks.parse_quote("100 @ $0.80\n1000 @ $0.61")
+    result = price_breaks.compare(["A", "B"], [a, b], [50, 100, 500, 1000], mode="step")
+    assert result["parts"] == [""]
+    assert result["unit"][0, 0].tolist() == [1.0, 1.0, 1.0, 0.5]
+    assert result["total"][0, 0].tolist() == [150.0, 200.0, 600.0, 600.0]
+    assert result["below_moq"][0, 0].tolist() == [True, False, False, False]
+    assert result["best"][0].tolist() == [1, 1, 1, 0]   # A's tooling pays off at 1,000
+
+    interp = price_breaks.compare(["A", "B"], [a, b], [316.2278], mode="interp")
+    assert math.isclose(interp["unit"][0, 0, 0], math.sqrt(0.5), rel_tol=1e-4)
+
+
+def test_compare_vendor_missing_a_part():
+    a = price_breaks.parse_quote("CD1000:\n100 @ $1")
+    b = price_breaks.parse_quote("MT2000:\n100 @ $2")
+    result = price_breaks.compare(["A", "B"], [a, b], [100])
+    assert result["parts"] == ["CD1000", "MT2000"]
+    assert math.isnan(result["unit"][0, 1, 0]) and math.isnan(result["unit"][1, 0, 0])
+    assert result["best"].tolist() == [[0], [1]]
@@ -0,0 +1,141 @@
+"""
+Disk cache of vendor-screenshot thumbnails.
+
+Thumbnails live in %APPDATA%\\EngineeringChecklist\\thumbs\\<sha1>.png, keyed
+by the hash of the stored (base64) image, so the same screenshot shares one
+thumbnail across checklists. Missing thumbnails are made on a small
+background pool (decode + scale off the GUI thread) and written for next
+time; the cache is trimmed to THUMB_CACHE_MAX_FILES by last use.
+"""
+import os
+import hashlib
+import threading
+
+from PySide6.QtGui import QImage
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal
+
+APPDATA_DIR = os.environ.get("APPDATA") or os.path.expanduser("~")
+SETTINGS_DIR = os.path.join(APPDATA_DIR, "EngineeringChecklist")
+THUMB_DIR = os.path.join(SETTINGS_DIR, "thumbs")
+THUMB_SIZE = (120, 90)
+THUMB_CACHE_MAX_FILES = 4000
+POOL_THREADS = 2
+
+_pool = None
+_inflight = {}      # key -> ThumbnailTask, so a screenshot on two cards is decoded once
+_lock = threading.Lock()
+_pruned = False
+
+
+def image_key(b64):
+    """Stable key for a stored screenshot (SHA-1 of its base64 text)."""
+    return hashlib.sha1(b64.encode("ascii")).hexdigest()
+
+
+def thumb_path(key):
+    return os.path.join(THUMB_DIR, f"{key}.png")
+
+
+def load_cached(key):
+    """The cached thumbnail as a QImage, or None if it hasn't been made yet."""
+    path = thumb_path(key)
+    if not os.path.exists(path):
+        return None
+    img = QImage(path)
+    if img.isNull():
+        return None
+    try:
+        os.utime(path)  # last use, for pruning
+    except OSError:
+        pass
+    return img
+
+
+def make_thumbnail(img):
+    return img.scaled(THUMB_SIZE[0], THUMB_SIZE[1], Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def store(key, thumb):
+    """Write a thumbnail to the cache (atomic; safe from worker threads)."""
+    try:
+        os.makedirs(THUMB_DIR, exist_ok=True)
+        tmp = thumb_path(key) + f".{os.getpid()}.tmp"
+        if thumb.save(tmp, "PNG"):
+            os.replace(tmp, thumb_path(key))
+    except Exception as e:
+        print(f"[ThumbCache] Failed to store {key}: {e}")
+
+
+def prune(max_files=THUMB_CACHE_MAX_FILES):
+    """Delete the least recently used thumbnails beyond max_files."""
+    try:
+        entries = [e for e in os.scandir(THUMB_DIR) if e.name.endswith(".png")]
+    except OSError:
+        return
+    if len(entries) <= max_files:
+        return
+    entries.sort(key=lambda e: e.stat().st_mtime)
+    for e in entries[: len(entries) - max_files]:
+        try:
+            os.remove(e.path)
+        except OSError:
+            pass
+
+
+class _ThumbSignals(QObject):
+    done = Signal(str, QImage)  # key, thumbnail (null image if the decode failed)
+
+
+class ThumbnailTask(QRunnable):
+    def __init__(self, key, data):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.key = key
+        self.data = data  # encoded image bytes
+        self.signals = _ThumbSignals()
+
+    def run(self):
+        global _pruned
+        thumb = QImage()
+        try:
+            img = QImage.fromData(self.data)
+            if not img.isNull():
+                thumb = make_thumbnail(img)
+                store(self.key, thumb)
+        except Exception as e:
+            print(f"[ThumbCache] Thumbnail failed for {self.key}: {e}")
+        finally:
+            self.data = None
+            if not _pruned:
+                _pruned = True
+                prune()
+            # Leave _inflight before emitting: anyone who connected by now gets the signal
+            with _lock:
+                _inflight.pop(self.key, None)
+            self.signals.done.emit(self.key, thumb)
+
+
+def _thread_pool():
+    global _pool
+    if _pool is None:
+        _pool = QThreadPool()
+        _pool.setMaxThreadCount(POOL_THREADS)
+    return _pool
+
+
+def request(key, data, on_done):
+    """
+    Make the thumbnail for `key` from its encoded bytes in the background; on_done(key, QImage) is
+    called on the GUI thread. Pass a bound method of a QObject so the call is
+    dropped if the receiver has been deleted.
+    """
+    with _lock:
+        task = _inflight.get(key)
+        start = task is None
+        if start:
+            task = ThumbnailTask(key, data)
+            _inflight[key] = task
+        task.signals.done.connect(on_done)
+    if start:
+        _thread_pool().start(task)
+    return task
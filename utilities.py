@@ -1,9 +1,44 @@
 import os
 import re
+import sys
 import time
 import getpass
+import importlib
 from PySide6.QtWidgets import QMessageBox
 
+import startup_profile
+
+
+# ----------- Deferred imports -----------
+
+class LazyModule:
+    """
+    Stand-in for a module that is only imported on first attribute access.
+    Keeps heavy libraries (openpyxl, docx, PIL, win32com) out of startup;
+    each one loads the first time the action that needs it runs.
+    """
+    def __init__(self, name):
+        self._lazy_name = name
+        self._lazy_module = None
+
+    def _load(self):
+        if self._lazy_module is None:
+            self._lazy_module = importlib.import_module(self._lazy_name)
+        return self._lazy_module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self._lazy_module is not None else "not loaded"
+        return f"<lazy module {self._lazy_name!r} ({state})>"
+
+
+def lazy_import(name):
+    """Return the module if it's already imported, otherwise a LazyModule for it."""
+    return sys.modules.get(name) or LazyModule(name)
+
+
 def require_file(path, parent=None, description="file"):
     """
     Ensure a file/folder exists before using it.
@@ -59,7 +94,8 @@ def _build_drawings_index(drawings_folder="P:/PDF Drawings"):
     if not require_file(drawings_folder, description="PDF drawings folder"):
         return {}
     try:
-        files = os.listdir(drawings_folder)
+        with startup_profile.span("list PDF Drawings folder", "file"):
+            files = os.listdir(drawings_folder)
     except Exception:
         # If something goes wrong listing the folder, treat as empty
         return {}
@@ -136,6 +172,31 @@ def find_latest_revision_files(drawing, drawings_folder="P:/PDF Drawings"):
     # Keep the same return shape you already depend on: {rev: filename}
     return {rev: filename for (rev, filename) in pairs}
 
+DRAWING_PREFIXES = ("CD", "MT", "MIS")   # drawing families on the P: share (Checklist categories)
+
+_REV_SUFFIX = re.compile(r'[\s_\-]+REV\.?\s*(?:[0-9]+(?:\.[0-9]+)?|[A-Z])\s*$', re.IGNORECASE)
+
+def clean_drawing_number(text):
+    """Drawing number as typed in Quote Info: trimmed, upper case, no trailing rev."""
+    text = " ".join(str(text or "").split()).upper()
+    return _REV_SUFFIX.sub("", text).strip()
+
+def resolve_drawings_batch(drawings, drawings_folder="P:/PDF Drawings"):
+    """
+    Resolve many drawing numbers against the drawings index in one pass.
+    Returns {input: (cleaned, root, latest_rev or None)}; the folder is listed at most once.
+    """
+    idx = _get_drawings_index(drawings_folder)
+    resolved = {}
+    for drawing in drawings:
+        if drawing in resolved:
+            continue
+        cleaned = clean_drawing_number(drawing)
+        root = _normalize_root(cleaned)
+        revs = [rev for rev, _ in idx.get(root, [])]
+        resolved[drawing] = (cleaned, root, max(revs, key=rev_key) if revs else None)
+    return resolved
+
 def find_latest_pdf_with_rev(part_number, drawings_folder="P:/PDF Drawings"):
     """Returns (path, display_name) of the latest PDF for the part_number."""
     files = [
@@ -177,41 +238,6 @@ def get_all_part_numbers_and_revs(quote_info_rows):
     found = sorted(set(found), key=lambda x: [int(s) if s.isdigit() else s for s in x.replace("_Rev", " ").split()])
     return found
 
-# ----------- 3D Quote Calculation Helpers -----------
-
-def calculate_stratasys_cost(s_vars):
-    total = 0
-    for m, price in STRATASYS_PRICES.items():
-        try:
-            qty = float(s_vars.get(m, "0"))
-            total += qty * price
-        except Exception:
-            continue
-    total *= 1.3
-    return total
-
-def calculate_stratasys_3d_cost(material_total, time_hrs):
-    try:
-        t = float(time_hrs)
-    except Exception:
-        t = 0
-    return material_total + t * 20
-
-def calculate_formlabs_cost(f_vars):
-    try:
-        qty = float(f_vars.get("RS-F2", "0"))
-    except Exception:
-        qty = 0
-    mat = qty * FORMLABS_PRICE * 1.3
-    return mat
-
-def calculate_formlabs_3d_cost(mat, t_f):
-    try:
-        t_f = float(t_f)
-    except Exception:
-        t_f = 0
-    return mat + t_f * 20
-
 class DirtyTracker:
     def __init__(self):
         self._dirty = False
@@ -0,0 +1,203 @@
+"""
+Archive index of which vendors were quoted for what.
+
+For each saved checklist the index records the vendors on its Vendor Quotes
+tab against that quote's drawing prefixes (CD, MT, MIS, ...), materials and
+customer. It is kept in %APPDATA%\\EngineeringChecklist\\vendor_usage.json,
+keyed by filename with size and mtime, so a refresh only reads checklists
+that are new or changed since the last one.
+
+The counts live in memory as plain dicts, so ranking the vendor directory for
+the quote being edited is a handful of dictionary lookups per vendor and can
+run on every edit in Quote Info.
+"""
+import os
+import re
+import json
+import threading
+
+from utilities import _normalize_root
+
+CHECKLISTS_DIR = r"P:\ENGINEERING\Design Checklist\json_files"
+APPDATA_DIR = os.environ.get("APPDATA") or os.path.expanduser("~")
+SETTINGS_DIR = os.path.join(APPDATA_DIR, "EngineeringChecklist")
+INDEX_PATH = os.path.join(SETTINGS_DIR, "vendor_usage.json")
+INDEX_VERSION = 1
+
+# How much one past quote counts toward a vendor's score, by what it shared with this one
+WEIGHTS = {"prefix": 1.0, "material": 2.0, "customer": 3.0}
+POPULARITY_WEIGHT = 0.05   # overall use, so frequent vendors lead when nothing matches
+
+_PREFIX = re.compile(r"[A-Z]+")
+
+_files = None       # filename -> {"stamp": [size, mtime], "features": [[kind, value]], "vendors": [name]}
+_counts = {}        # (kind, value) -> {vendor key: quotes}
+_totals = {}        # vendor key -> quotes
+_lock = threading.RLock()
+
+
+# ---------- Features ----------
+
+def drawing_prefix(drawing):
+    """Leading letters of a drawing number: "cd-1234" -> "CD"."""
+    m = _PREFIX.match(_normalize_root(drawing))
+    return m.group(0) if m else ""
+
+
+def _material_key(material):
+    return " ".join(str(material or "").upper().split())
+
+
+def _customer_key(customer):
+    return " ".join(str(customer or "").casefold().split())
+
+
+def quote_features(drawings=(), materials=(), customer=""):
+    """{(kind, value)} describing a quote, as stored in the index and used for ranking."""
+    features = {("prefix", p) for p in map(drawing_prefix, drawings) if p}
+    features |= {("material", m) for m in map(_material_key, materials) if m}
+    if _customer_key(customer):
+        features.add(("customer", _customer_key(customer)))
+    return features
+
+
+def checklist_features(data):
+    drawings, materials = [], []
+    for row in data.get("quote_info") or []:
+        fields = row.get("fields") if isinstance(row, dict) else None
+        if fields:
+            drawings.append(fields[0] if isinstance(fields[0], str) else "")
+            materials.append(fields[1] if len(fields) > 1 and isinstance(fields[1], str) else "")
+    top = (data.get("checklist") or {}).get("top_fields") or []
+    customer = top[0] if top and isinstance(top[0], str) else ""   # stored order: [Customer, Opp, ID, Sales]
+    return quote_features(drawings, materials, customer)
+
+
+def checklist_vendors(data):
+    names, seen = [], set()
+    for row in data.get("vendor_quotes") or []:
+        name = (row[0] if row and isinstance(row[0], str) else "").strip()
+        if name and name.casefold() not in seen:
+            seen.add(name.casefold())
+            names.append(name)
+    return names
+
+
+# ---------- Index ----------
+
+def _apply(record, sign):
+    for name in record["vendors"]:
+        key = name.casefold()
+        _totals[key] = _totals.get(key, 0) + sign
+        for kind, value in record["features"]:
+            bucket = _counts.setdefault((kind, value), {})
+            bucket[key] = bucket.get(key, 0) + sign
+
+
+def _rebuild_counts():
+    _counts.clear()
+    _totals.clear()
+    for record in _files.values():
+        _apply(record, 1)
+
+
+def load_index():
+    """Read the persisted index (once); returns the number of checklists in it."""
+    global _files
+    with _lock:
+        if _files is None:
+            try:
+                with open(INDEX_PATH, "r", encoding="utf-8") as f:
+                    obj = json.load(f)
+                if obj.get("version") != INDEX_VERSION:
+                    raise ValueError("old index format")
+                _files = obj.get("files") or {}
+            except Exception:
+                _files = {}
+            _rebuild_counts()
+        return len(_files)
+
+
+def _save_index():
+    try:
+        os.makedirs(SETTINGS_DIR, exist_ok=True)
+        tmp = INDEX_PATH + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "files": _files}, f, separators=(",", ":"))
+        os.replace(tmp, INDEX_PATH)
+    except Exception as e:
+        print(f"[VendorUsage] Failed to write {INDEX_PATH}: {e}")
+
+
+def _set_record(name, record):
+    old = _files.pop(name, None)
+    if old is not None:
+        _apply(old, -1)
+    if record is not None:
+        _files[name] = record
+        _apply(record, 1)
+
+
+def refresh(folder=CHECKLISTS_DIR):
+    """
+    Bring the index up to date with the checklist folder: read new or changed
+    files, drop deleted ones, save if anything changed. Returns (updated, removed).
+    Safe to run on a worker thread.
+    """
+    load_index()
+    try:
+        with os.scandir(folder) as it:
+            stamps = {}
+            for de in it:
+                if de.is_file() and de.name.lower().endswith(".json"):
+                    st = de.stat()
+                    stamps[de.name] = [st.st_size, st.st_mtime]
+    except OSError:
+        return 0, 0
+
+    with _lock:
+        stale = [n for n, s in stamps.items() if (_files.get(n) or {}).get("stamp") != s]
+        gone = [n for n in _files if n not in stamps]
+
+    updates = {}
+    for name in stale:
+        try:
+            with open(os.path.join(folder, name), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            continue
+        updates[name] = {
+            "stamp": stamps[name],
+            "features": sorted(list(fv) for fv in checklist_features(data)),
+            "vendors": checklist_vendors(data),
+        }
+
+    if updates or gone:
+        with _lock:
+            for name in gone:
+                _set_record(name, None)
+            for name, record in updates.items():
+                _set_record(name, record)
+            _save_index()
+    return len(updates), len(gone)
+
+
+# ---------- Ranking ----------
+
+def score(vendor, features):
+    key = vendor.casefold()
+    total = POPULARITY_WEIGHT * _totals.get(key, 0)
+    for kind, value in features:
+        total += WEIGHTS.get(kind, 0.0) * _counts.get((kind, value), {}).get(key, 0)
+    return total
+
+
+def rank(vendors, features):
+    """
+    `vendors` ordered by how often they were quoted alongside `features`
+    (see quote_features); ties, and vendors never used, stay alphabetical.
+    Returns [(name, score)].
+    """
+    with _lock:
+        scored = [(name, score(name, features)) for name in vendors]
+    return sorted(scored, key=lambda ns: (-ns[1], ns[0].casefold()))
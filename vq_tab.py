@@ -1,16 +1,43 @@
 import os
+import re
 import base64
+import threading
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit,
-    QTextEdit, QLabel, QFrame, QSizePolicy, QDialog, QScrollArea,
-    QGridLayout
+    QTextEdit, QLabel, QFrame, QSizePolicy, QScrollArea,
+    QListView
+)
+from PySide6.QtGui import QPixmap, QGuiApplication, QColor, QPainter, QFont
+from PySide6.QtCore import (
+    Qt, QTimer, QEvent, QObject, QRunnable, QThreadPool, Signal,
+    QAbstractListModel, QModelIndex, QSize
 )
-from PySide6.QtGui import QPixmap, QImage, QGuiApplication, QPalette, QColor
-from PySide6.QtCore import Qt, QBuffer, QTimer, QEvent
 
-THUMB_SIZE = (120, 90)  # thumbnail size (w,h)
+import doc_cache
+import image_codec
+import image_dedupe
+import image_store
+import price_breaks
+import price_compare
+import screenshot_viewer
+import thumb_cache
+import vendor_usage
+
+THUMB_SIZE = thumb_cache.THUMB_SIZE  # thumbnail size (w,h)
 LINK_COLS = 3
 LINK_PANEL_MAX_HEIGHT = 92
+MATERIALIZE_MARGIN = 400   # px above/below the viewport where cards are built ahead of scrolling
+SUGGESTED_VENDORS = 3      # top-ranked vendors shown in bold
+RERANK_DELAY_MS = 200
+
+# Longest side a pasted screenshot is stored at (None = keep full resolution).
+# launch.py applies the "max_screenshot_dim" user setting through set_max_screenshot_dim.
+MAX_SCREENSHOT_DIM = 2560
+
+# Encoded screenshot bytes allowed per checklist (all vendor cards together, loaded
+# ones included). A paste is downscaled to fit what's left; one that still doesn't
+# fit is attached only if the user confirms. "screenshot_budget_mb" user setting.
+SCREENSHOT_BUDGET_BYTES = 12 * 1024 * 1024
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 SUPPORT_DIR = os.path.join(BASE_DIR, "supporting_documents")
@@ -18,6 +45,129 @@ VENDOR_LIST_PATH = os.path.join(SUPPORT_DIR, "vendor_list.txt")
 
 
 
+def read_vendor_names(path):
+    """One vendor per line; blank lines and # comments are skipped."""
+    names = []
+    with open(path, "r", encoding="utf-8-sig") as f:
+        for line in f:
+            s = line.strip()
+            if not s or s.startswith("#"):
+                continue
+            names.append(s)
+    return names
+
+
+def set_max_screenshot_dim(value):
+    """Set the stored-resolution cap for pasted screenshots (None or 0 disables it)."""
+    global MAX_SCREENSHOT_DIM
+    MAX_SCREENSHOT_DIM = int(value) if value else None
+
+
+def set_screenshot_budget_mb(value):
+    """Set the per-checklist screenshot byte budget in MB (None or 0 disables it)."""
+    global SCREENSHOT_BUDGET_BYTES
+    SCREENSHOT_BUDGET_BYTES = int(float(value) * 1024 * 1024) if value else None
+
+
+# --------- Screenshot encoding (off the GUI thread) ---------
+def prepare_screenshot(img, max_dim=None, budget=None):
+    """
+    Downscale to max_dim (longest side) and encode with the smallest legible
+    format that fits `budget` bytes. Returns (b64, image, thumbnail, info);
+    info also carries the paste's "pixel_hash" and "dhash" for duplicate checks.
+    """
+    original_hash = image_dedupe.pixel_hash(img)
+    if max_dim and max(img.width(), img.height()) > max_dim:
+        img = img.scaled(max_dim, max_dim, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    data, info = image_codec.encode_adaptive(img, budget=budget)
+    if (info["width"], info["height"]) != (img.width(), img.height()):
+        img = img.scaled(info["width"], info["height"], Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    b64 = base64.b64encode(data).decode("utf-8")
+    thumb = thumb_cache.make_thumbnail(img)
+    thumb_cache.store(thumb_cache.image_key(b64), thumb)  # ready when the checklist is reopened
+    info["pixel_hash"] = original_hash
+    info["dhash"] = image_dedupe.dhash(thumb)
+    return b64, img, thumb, info
+
+
+_context_provider = None   # () -> {"drawings", "materials", "customer"} for the open quote; set by launch.py
+
+
+def set_context_provider(provider):
+    """Register the callable that describes the open quote, for ranking vendors."""
+    global _context_provider
+    _context_provider = provider
+
+
+def quote_features():
+    try:
+        context = _context_provider() if _context_provider else {}
+    except Exception as e:
+        print(f"[VendorQuotes] Quote context failed: {e}")
+        context = {}
+    return vendor_usage.quote_features(**context)
+
+
+class _UsageSignals(QObject):
+    done = Signal()
+
+
+class VendorUsageTask(QRunnable):
+    """Loads and refreshes the vendor usage index off the GUI thread."""
+    def __init__(self):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = _UsageSignals()
+
+    def run(self):
+        try:
+            vendor_usage.refresh()
+        except Exception as e:
+            print(f"[VendorQuotes] Vendor usage refresh failed: {e}")
+        self.signals.done.emit()
+
+
+class _EncodeSignals(QObject):
+    done = Signal(object)  # the finished ScreenshotEncodeTask
+
+
+class ScreenshotEncodeTask(QRunnable):
+    """
+    Encodes one pasted screenshot on the global thread pool. QImage work is
+    safe off the GUI thread; the row turns the results into pixmaps when
+    `signals.done` arrives. `wait()` blocks until the result is ready (used
+    when the checklist is saved while a paste is still encoding).
+    """
+    def __init__(self, img, max_dim=None, budget=None):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.img = img
+        self.max_dim = max_dim
+        self.budget = budget
+        self.result = None  # (b64, image, thumbnail, info)
+        self.signals = _EncodeSignals()
+        self._finished = threading.Event()
+
+    def run(self):
+        try:
+            self.result = prepare_screenshot(self.img, self.max_dim, self.budget)
+        except Exception as e:
+            print(f"[VendorQuotes] Screenshot encode failed: {e}")
+        finally:
+            self.img = None
+            self._finished.set()
+            self.signals.done.emit(self)
+
+    def wait(self):
+        self._finished.wait()
+        return self.result
+
+
+PLACEHOLDER_CSS = "color:#888; background:#f0f0f0; border:1px dashed #ccc;"
+
+_dhash_by_key = {}   # image_store key -> dHash, so cards not built yet still take part in near-duplicate checks
+
+
 # --------- Small helpers ---------
 class ClickableLabel(QLabel):
     def __init__(self, text="", on_click=None, parent=None):
@@ -31,25 +181,124 @@ class ClickableLabel(QLabel):
         super().mousePressEvent(event)
 
 
-class LinkLabel(ClickableLabel):
-    """Blue link-looking label, underline on hover."""
-    def __init__(self, text="", on_click=None, parent=None):
-        super().__init__(text, on_click, parent)
-        self._base_css = "color:#0a61d0; text-decoration:none; font-weight:500;"
-        self._hover_css = "color:#0a61d0; text-decoration:underline; font-weight:500;"
-        self.setStyleSheet(self._base_css)
+# --------- Vendor directory ---------
+def _tokens(text):
+    return [t for t in re.split(r"[^0-9a-z]+", text.casefold()) if t]
+
+
+class VendorDirectoryModel(QAbstractListModel):
+    """
+    Vendor names for the quick-add list, with type-to-filter. Each name's
+    casefolded text and word tokens are computed once; a name matches when
+    every typed word starts one of its words, or the whole query appears in
+    it. Typing more only re-checks the names that matched before.
+    """
+    def __init__(self, names=(), parent=None):
+        super().__init__(parent)
+        self._names = []
+        self._index = []      # (casefolded name, tokens) per name
+        self._visible = []    # indexes into _names
+        self._query = ""
+        self._suggested = 0   # leading names shown as suggestions
+        self._terms = {}      # name -> (casefolded, tokens), kept across re-orders
+        self.set_names(names)
+
+    def set_names(self, names, suggested=0):
+        self.beginResetModel()
+        self._names = list(names)
+        for n in self._names:
+            if n not in self._terms:
+                self._terms[n] = (n.casefold(), _tokens(n))
+        self._index = [self._terms[n] for n in self._names]
+        self._query = ""
+        self._visible = list(range(len(self._names)))
+        self._suggested = suggested
+        self.endResetModel()
+
+    def names(self):
+        return self._names
+
+    def suggested(self):
+        return self._suggested
+
+    def _matches(self, i, query, words):
+        folded, tokens = self._index[i]
+        if query in folded:
+            return True
+        return bool(words) and all(any(t.startswith(w) for t in tokens) for w in words)
+
+    def set_filter(self, text):
+        query = text.strip().casefold()
+        if query == self._query:
+            return
+        candidates = self._visible if query.startswith(self._query) else range(len(self._names))
+        words = _tokens(query)
+        visible = [i for i in candidates if self._matches(i, query, words)]
+        self.beginResetModel()
+        self._query = query
+        self._visible = visible
+        self.endResetModel()
+
+    def name_at(self, row):
+        return self._names[self._visible[row]] if 0 <= row < len(self._visible) else None
+
+    def total(self):
+        return len(self._names)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._visible)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        name = self._names[self._visible[index.row()]]
+        if role == Qt.DisplayRole:
+            return name
+        if role == Qt.ToolTipRole:
+            if self._visible[index.row()] < self._suggested:
+                return f"Add a card for {name}\nOften quoted for work like this"
+            return f"Add a card for {name}"
+        if role == Qt.ForegroundRole:
+            return QColor("#0a61d0")
+        if role == Qt.FontRole and self._visible[index.row()] < self._suggested:
+            font = QFont()
+            font.setBold(True)
+            return font
+        return None
+
+
+class VendorDirectoryView(QListView):
+    """Wrapping list laid out in LINK_COLS columns, styled like the old link labels."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFlow(QListView.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.Adjust)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QListView.NoSelection)
+        self.setEditTriggers(QListView.NoEditTriggers)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setMouseTracking(True)
+        self.viewport().setCursor(Qt.PointingHandCursor)
+        self.setStyleSheet(
+            "QListView { background: white; font-weight: 500; }"
+            "QListView::item { padding: 1px 0; }"
+            "QListView::item:hover { background: #eef4ff; }"
+        )
 
-    def enterEvent(self, e):
-        self.setStyleSheet(self._hover_css)
-        super().enterEvent(e)
+    def row_height(self):
+        return self.fontMetrics().height() + 6
 
-    def leaveEvent(self, e):
-        self.setStyleSheet(self._base_css)
-        super().leaveEvent(e)
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        width = max(self.viewport().width() // LINK_COLS, 40)
+        self.setGridSize(QSize(width, self.row_height()))
 
 
 # --------- Main Tab ---------
 class VendorQuoteTab(QWidget):
+    prices_changed = Signal()   # a card's parsed price table or name changed, or cards came/went
+
     def __init__(self, dirty_tracker=None, parent=None):
         super().__init__(parent)
         self.dirty_tracker = dirty_tracker
@@ -57,11 +306,29 @@ class VendorQuoteTab(QWidget):
 
         self.vendor_list_path = VENDOR_LIST_PATH
         self._vendor_names = []
-        self._vendor_labels = []
+        self._rows_by_name = {}   # casefolded vendor name -> card, for O(1) duplicate checks
+        self._price_dialog = None
         self._ensure_vendor_file_exists()
+        self._rerank_timer = QTimer(self)
+        self._rerank_timer.setSingleShot(True)
+        self._rerank_timer.setInterval(RERANK_DELAY_MS)
+        self._rerank_timer.timeout.connect(self._rebuild_vendor_links)
 
         self.init_ui()
 
+        # Rank the directory by past use once the archive index is loaded/refreshed
+        self._usage_task = VendorUsageTask()
+        self._usage_task.signals.done.connect(self.schedule_rerank)
+        QThreadPool.globalInstance().start(self._usage_task)
+
+    def schedule_rerank(self, *_):
+        """Re-rank the vendor directory shortly (coalesces bursts of Quote Info edits)."""
+        self._rerank_timer.start()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.schedule_rerank()
+
     # ---------- UI ----------
     def init_ui(self):
         layout = QVBoxLayout(self)
@@ -84,46 +351,36 @@ class VendorQuoteTab(QWidget):
         hint.setStyleSheet("color:#666; font-style: italic;")
         hint.setAlignment(Qt.AlignVCenter | Qt.AlignLeft)
 
+        self.vendor_filter = QLineEdit()
+        self.vendor_filter.setPlaceholderText("Filter vendors…")
+        self.vendor_filter.setClearButtonEnabled(True)
+        self.vendor_filter.setFixedWidth(200)
+        self.vendor_filter.textChanged.connect(self._on_vendor_filter)
+        self.vendor_filter.returnPressed.connect(self._add_first_match)
+
+        btn_compare = QPushButton("Compare Prices")
+        btn_compare.setFixedHeight(26)
+        btn_compare.setToolTip("Unit and total cost by quantity across vendors, from the price breaks in each quote")
+        btn_compare.clicked.connect(lambda: price_compare.show_comparison(self))
+
         header_layout.addWidget(btn_add_blank)
         header_layout.addWidget(hint)
         header_layout.addStretch()
+        header_layout.addWidget(btn_compare)
+        header_layout.addWidget(self.vendor_filter)
         layout.addWidget(header)
         layout.addSpacing(2)
 
-        # ---- Vendor "links" panel (scrollable) ----
-        quick_panel = QWidget()
-        quick_panel.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
-        qp_layout = QVBoxLayout(quick_panel)
-        qp_layout.setContentsMargins(0, 0, 0, 0)
-        qp_layout.setSpacing(0)
-
-        self.link_container = QWidget()
-        self.link_container.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
-        pal = self.link_container.palette()
-        pal.setColor(QPalette.ColorRole.Window, QColor("white"))
-        self.link_container.setAutoFillBackground(True)
-        self.link_container.setPalette(pal)
-
-        self.link_grid = QGridLayout(self.link_container)
-        self.link_grid.setContentsMargins(0, 0, 0, 0)
-        self.link_grid.setHorizontalSpacing(18)
-        self.link_grid.setVerticalSpacing(4)
-
-        link_scroll = QScrollArea()
-        link_scroll.setWidget(self.link_container)
-        link_scroll.setWidgetResizable(True)
-        link_scroll.setFrameShape(QFrame.NoFrame)
-        link_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        link_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        link_scroll.setFixedHeight(LINK_PANEL_MAX_HEIGHT)
-        self.link_scroll = link_scroll
-
-        qp_layout.addWidget(link_scroll)
-        layout.addWidget(quick_panel)
-
-        # Build vendor link labels
+        # ---- Vendor directory (filterable list) ----
+        self.vendor_model = VendorDirectoryModel(parent=self)
+        self.vendor_view = VendorDirectoryView()
+        self.vendor_view.setModel(self.vendor_model)
+        self.vendor_view.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        self.vendor_view.clicked.connect(self._on_vendor_clicked)
+        layout.addWidget(self.vendor_view)
+
         self._load_vendor_list()
-        self._rebuild_vendor_links()
+        self.schedule_rerank()
 
         # ---- Rows scroll area (gets remainder) ----
         self.scroll = QScrollArea()
@@ -144,6 +401,13 @@ class VendorQuoteTab(QWidget):
         self.scroll.setWidget(self.row_container)
         layout.addWidget(self.scroll, 1)
 
+        # Loaded cards start as placeholders and are built when scrolled near
+        self._materialize_timer = QTimer(self)
+        self._materialize_timer.setSingleShot(True)
+        self._materialize_timer.timeout.connect(self._materialize_visible)
+        self.scroll.verticalScrollBar().valueChanged.connect(self._schedule_materialize)
+        self.scroll.viewport().installEventFilter(self)
+
         # NOTE: No default blank row on launch.
 
     # ---------- Vendor list helpers ----------
@@ -158,14 +422,8 @@ class VendorQuoteTab(QWidget):
                     "Acme Die\nBeta Converting\nCutRight Tooling\n")
 
     def _load_vendor_list(self):
-        names = []
         try:
-            with open(self.vendor_list_path, "r", encoding="utf-8-sig") as f:
-                for line in f:
-                    s = line.strip()
-                    if not s or s.startswith("#"):
-                        continue
-                    names.append(s)
+            names = doc_cache.get("vendor_list", self.vendor_list_path, read_vendor_names) or []
         except Exception:
             names = []
 
@@ -180,47 +438,56 @@ class VendorQuoteTab(QWidget):
         self._vendor_names = ordered
 
     def _rebuild_vendor_links(self):
-        # clear old
-        while self.link_grid.count():
-            item = self.link_grid.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
-        self._vendor_labels.clear()
-
-        r = c = 0
-        for name in self._vendor_names:
-            lbl = LinkLabel(name, on_click=lambda n=name: self.add_vendor_by_name(n))
-            self._vendor_labels.append(lbl)
-            self.link_grid.addWidget(lbl, r, c, Qt.AlignLeft)
-            c += 1
-            if c >= LINK_COLS:
-                c = 0
-                r += 1
-        self.link_container.adjustSize()
-
-        # auto-size panel height up to the cap
-        count = len(self._vendor_labels)
-        rows = (count + LINK_COLS - 1) // LINK_COLS
-        needed_h = 0
-        if rows > 0:
-            row_h = self._vendor_labels[0].sizeHint().height()
-            vspace = self.link_grid.verticalSpacing() or 0
-            needed_h = rows * row_h + max(0, rows - 1) * vspace + 2
-        self.link_scroll.setFixedHeight(min(LINK_PANEL_MAX_HEIGHT, max(0, needed_h)))
+        # Most likely vendors for the open quote first (vendor_usage), then A-Z
+        ranked = vendor_usage.rank(self._vendor_names, quote_features())
+        names = [name for name, _ in ranked]
+        suggested = sum(1 for _, s in ranked[:SUGGESTED_VENDORS] if s > 0)
+        if names == self.vendor_model.names() and suggested == self.vendor_model.suggested():
+            return
+        self.vendor_model.set_names(names, suggested)
+        self.vendor_model.set_filter(self.vendor_filter.text())
+        # height for the full list, up to the cap, so filtering doesn't shift the cards
+        rows = (self.vendor_model.total() + LINK_COLS - 1) // LINK_COLS
+        needed_h = rows * self.vendor_view.row_height() + 2 if rows else 0
+        self.vendor_view.setFixedHeight(min(LINK_PANEL_MAX_HEIGHT, needed_h))
+
+    def _on_vendor_filter(self, text):
+        self.vendor_model.set_filter(text)
+
+    def _on_vendor_clicked(self, index):
+        name = self.vendor_model.name_at(index.row())
+        if name:
+            self.add_vendor_by_name(name)
+
+    def _add_first_match(self):
+        name = self.vendor_model.name_at(0)
+        if name and self.vendor_filter.text().strip():
+            self.add_vendor_by_name(name)
+            self.vendor_filter.clear()
+
+    # ---------- Name -> card map ----------
+    def _index_row_name(self, row, removed=False):
+        """Keep _rows_by_name in step with a card's vendor name (the first card with a name wins)."""
+        old = getattr(row, "_name_key", "")
+        new = "" if removed else row.vendor_name().casefold()
+        if old == new:
+            return
+        row._name_key = new
+        if old and self._rows_by_name.get(old) is row:
+            del self._rows_by_name[old]
+            twin = next((r for r in self.vendor_rows
+                         if r is not row and getattr(r, "_name_key", "") == old), None)
+            if twin is not None:
+                self._rows_by_name[old] = twin
+        if new:
+            self._rows_by_name.setdefault(new, row)
 
     # ---------- Add by name (prevents duplicates) ----------
     def add_vendor_by_name(self, name: str):
-        existing_map = {}
-        for row in self.vendor_rows:
-            n = row.name_entry.text().strip()
-            if n:
-                existing_map[n.casefold()] = row
-
-        key = name.casefold()
-        if key in existing_map:
+        existing = self._rows_by_name.get(name.strip().casefold())
+        if existing is not None:
             # scroll to and flash existing
-            row = existing_map[key]
+            row = self.materialize(existing)
             try:
                 self.scroll.ensureWidgetVisible(row)
             except Exception:
@@ -234,6 +501,7 @@ class VendorQuoteTab(QWidget):
     def add_vendor_row(self, data=None):
         row = VendorQuoteRow(self, self.dirty_tracker, data)
         self.vendor_rows.append(row)
+        self._index_row_name(row)
         self.row_container_layout.addWidget(row)
 
         sb = self.scroll.verticalScrollBar()
@@ -243,36 +511,125 @@ class VendorQuoteTab(QWidget):
             self.dirty_tracker.mark_dirty()
 
     def remove_vendor_row(self, row_widget):
+        self._index_row_name(row_widget, removed=True)
         self.vendor_rows.remove(row_widget)
+        row_widget.release_screenshots()
         row_widget.setParent(None)
         row_widget.deleteLater()
+        self.prices_changed.emit()
         if self.dirty_tracker:
             self.dirty_tracker.mark_dirty()
 
+    def screenshot_bytes(self):
+        """Encoded bytes of every screenshot on the tab (what the budget counts)."""
+        return sum(image_store.size(key) for row in self.vendor_rows for _, key in row.screenshots if key)
+
+    def find_duplicate(self, key=None, pixel_hash=None, dhash=None, exclude=None):
+        """
+        (kind, row, thumb_widget, bits) for a screenshot on the tab matching the
+        fingerprints: "exact" (same stored image or same pasted pixels) or
+        "near" (dHash within NEAR_DUPLICATE_BITS). None if there isn't one.
+        """
+        near = None
+        for row in self.vendor_rows:
+            for thumb_widget, other_key, other_pixels, other_dhash in row.fingerprints():
+                if thumb_widget is not None and thumb_widget is exclude:
+                    continue
+                if (key and other_key == key) or (pixel_hash and other_pixels == pixel_hash):
+                    return "exact", row, thumb_widget, 0
+                if near is None and image_dedupe.is_near(dhash, other_dhash):
+                    near = ("near", row, thumb_widget, image_dedupe.hamming(dhash, other_dhash))
+        return near
+
+    def screenshot_budget_left(self):
+        if SCREENSHOT_BUDGET_BYTES is None:
+            return None
+        return max(SCREENSHOT_BUDGET_BYTES - self.screenshot_bytes(), 0)
+
     def get_vendor_quote_data(self):
         return [row.get_row_data() for row in self.vendor_rows]
 
+    def price_tables(self):
+        """[(vendor name, parsed price table)] for every card, in tab order."""
+        return [(row.vendor_name(), row.price_table) for row in self.vendor_rows]
+
     def load_vendor_quote_data(self, data):
         self.clear_vendor_quote_tab(skip_add=True)
+        width = self.scroll.viewport().width()
         for row_data in data:
-            self.add_vendor_row(row_data)
+            placeholder = VendorCardPlaceholder(self, row_data, width)
+            self.vendor_rows.append(placeholder)
+            self._index_row_name(placeholder)
+            self.row_container_layout.addWidget(placeholder)
+        self._schedule_materialize()
+        self.schedule_rerank()
+        self.prices_changed.emit()
+
+    # ---------- Lazy cards ----------
+    def eventFilter(self, obj, ev):
+        if obj is self.scroll.viewport() and ev.type() in (QEvent.Resize, QEvent.Show):
+            self._schedule_materialize()
+        return super().eventFilter(obj, ev)
+
+    def _schedule_materialize(self, *_):
+        if any(isinstance(row, VendorCardPlaceholder) for row in self.vendor_rows):
+            self._materialize_timer.start(0)
+
+    def _materialize_visible(self):
+        """Build the real cards for placeholders in (or near) the visible part of the list."""
+        if not self.scroll.viewport().isVisible():
+            return
+        self.row_container_layout.activate()
+        top = self.scroll.verticalScrollBar().value() - MATERIALIZE_MARGIN
+        bottom = top + self.scroll.viewport().height() + 2 * MATERIALIZE_MARGIN
+        self.row_container.setUpdatesEnabled(False)
+        try:
+            for row in list(self.vendor_rows):
+                if isinstance(row, VendorCardPlaceholder) and row.y() < bottom and row.y() + row.height() > top:
+                    self.materialize(row)
+        finally:
+            self.row_container.setUpdatesEnabled(True)
+
+    def materialize(self, row):
+        """The real VendorQuoteRow for a card, building it if it's still a placeholder."""
+        if not isinstance(row, VendorCardPlaceholder):
+            return row
+        keys = [key for _, key in row.screenshots]
+        row.screenshots = []  # the store references move to the real card
+        card = VendorQuoteRow(self, self.dirty_tracker, (row.name, row.text, []), keys=keys)
+        self.vendor_rows[self.vendor_rows.index(row)] = card
+        card._name_key = row._name_key
+        if self._rows_by_name.get(row._name_key) is row:
+            self._rows_by_name[row._name_key] = card
+        self.row_container_layout.insertWidget(self.row_container_layout.indexOf(row), card)
+        self.row_container_layout.removeWidget(row)
+        row.setParent(None)
+        row.deleteLater()
+        return card
 
     def clear_vendor_quote_tab(self, skip_add=False):
         for row in self.vendor_rows:
+            row.release_screenshots()
             row.setParent(None)
             row.deleteLater()
         self.vendor_rows.clear()
+        self._rows_by_name.clear()
+        self.prices_changed.emit()
         # no default row added here
 
 
 # --------- Row/Card ---------
 class VendorQuoteRow(QWidget):
-    def __init__(self, tab: QWidget, dirty_tracker=None, data=None):
+    def __init__(self, tab: QWidget, dirty_tracker=None, data=None, keys=None):
         super().__init__()
         self.tab = tab
         self.dirty_tracker = dirty_tracker
         self._loading = bool(data)
-        self.screenshots = []
+        self.screenshots = []   # [thumb_widget, image_store key]
+        self._pending = {}      # thumb_widget -> ScreenshotEncodeTask still running
+        self._height_by_width = {}  # quote_text width -> fitted height, until the text changes
+        self._name_key = ""         # casefolded name this card is filed under in tab._rows_by_name
+        self.price_table = price_breaks.parse_quote("")
 
         # card frame
         outer_frame = QFrame(self)
@@ -349,6 +706,12 @@ class VendorQuoteRow(QWidget):
         self.quote_text.installEventFilter(self)
         layout.addWidget(self.quote_text)
 
+        # price breaks / lead time / tooling found in the text
+        self.price_summary = QLabel()
+        self.price_summary.setStyleSheet("color:#777; font-size: 11px;")
+        self.price_summary.setVisible(False)
+        layout.addWidget(self.price_summary)
+
         # screenshots strip
         self.screenshot_container = QWidget()
         self.screenshot_layout = QHBoxLayout(self.screenshot_container)
@@ -366,7 +729,18 @@ class VendorQuoteRow(QWidget):
                 QTimer.singleShot(0, self.autosize_textedit)
             if len(data) > 2 and data[2]:
                 self.load_screenshots(data[2])
+        if keys:
+            self.load_screenshot_keys(keys)
         self._loading = False
+        self.name_entry.textChanged.connect(lambda: self.tab._index_row_name(self))
+        self.name_entry.textChanged.connect(self.tab.prices_changed.emit)
+
+    def vendor_name(self):
+        return self.name_entry.text().strip()
+
+    def fingerprints(self):
+        """(thumb_widget, key, pixel_hash, dhash) per screenshot, for duplicate checks."""
+        return [(w, key, w.pixel_hash, w.dhash) for w, key in self.screenshots]
 
     # quick flash when duplicate selected
     def flash_card(self):
@@ -391,62 +765,169 @@ class VendorQuoteRow(QWidget):
             self.dirty_tracker.mark_dirty()
 
     def _on_textedit_changed(self):
+        self._height_by_width.clear()
         self.autosize_textedit()
+        self._update_price_table()
         self._on_user_change()
 
+    def _update_price_table(self):
+        # Lines are memoized in price_breaks, so a keystroke only re-parses the line it touched
+        table = price_breaks.parse_quote(self.quote_text.toPlainText())
+        if table == self.price_table:
+            return
+        self.price_table = table
+        summary = price_breaks.summarize(table)
+        self.price_summary.setText(summary)
+        self.price_summary.setVisible(bool(summary))
+        if not self._loading:
+            self.tab.prices_changed.emit()
+
     def autosize_textedit(self):
-        doc = self.quote_text.document()
-        doc.setTextWidth(self.quote_text.viewport().width())
-        doc_h = doc.documentLayout().documentSize().height()
-        m = self.quote_text.contentsMargins()
-        frame = self.quote_text.frameWidth()
-        padding = 6
-        new_h = max(self.min_textedit_height,
-                    int(doc_h + m.top() + m.bottom() + frame * 2 + padding))
-        self.quote_text.setFixedHeight(new_h)
+        # Heights are remembered per width, so resizing back and forth (and the
+        # Resize event our own setFixedHeight causes) skips the document layout
+        width = self.quote_text.viewport().width()
+        new_h = self._height_by_width.get(width)
+        if new_h is None:
+            doc = self.quote_text.document()
+            doc.setTextWidth(width)
+            doc_h = doc.documentLayout().documentSize().height()
+            m = self.quote_text.contentsMargins()
+            frame = self.quote_text.frameWidth()
+            padding = 6
+            new_h = max(self.min_textedit_height,
+                        int(doc_h + m.top() + m.bottom() + frame * 2 + padding))
+            if len(self._height_by_width) > 32:
+                self._height_by_width.clear()
+            self._height_by_width[width] = new_h
+        if self.quote_text.height() != new_h:
+            self.quote_text.setFixedHeight(new_h)
 
     # screenshots
     def paste_screenshot(self):
         clipboard = QGuiApplication.clipboard()
         if clipboard.mimeData().hasImage():
-            img = clipboard.image()
-            pixmap = QPixmap.fromImage(img)
-            b64 = self.encode_qimage_base64(img)
-            self.add_screenshot_entry(b64, pixmap=pixmap, lazy=False)
+            # Encoding + thumbnailing run on the thread pool; a placeholder shows meanwhile
+            self.start_screenshot_encode(clipboard.image())
             self._on_user_change()
         else:
             from PySide6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "No Image", "Clipboard does not contain an image.")
 
-    def encode_qimage_base64(self, img):
-        if hasattr(QImage, "Format_RGBA8888"):
-            img = img.convertToFormat(QImage.Format_RGBA8888)
+    def start_screenshot_encode(self, img):
+        task = ScreenshotEncodeTask(img, MAX_SCREENSHOT_DIM, self.tab.screenshot_budget_left())
+        task.thumb_widget = self.add_screenshot_entry(None, pending=True)
+        self._pending[task.thumb_widget] = task
+        # Bound slot on this widget: queued to the GUI thread, dropped if the row is gone
+        task.signals.done.connect(self._on_screenshot_encoded)
+        QThreadPool.globalInstance().start(task)
+        return task
+
+    def _on_screenshot_encoded(self, task):
+        if self._pending.pop(task.thumb_widget, None) is None:
+            return  # deleted (or already collected by get_row_data) meanwhile
+        if task.result is not None and not (self._confirm_not_duplicate(task.thumb_widget, task.result)
+                                            and self._confirm_within_budget(task.result)):
+            self.remove_screenshot(task.thumb_widget)
+            return
+        self._apply_encoded(task.thumb_widget, task.result)
+
+    def _confirm_within_budget(self, result):
+        """False to drop a finished paste that doesn't fit the checklist's screenshot budget."""
+        from PySide6.QtWidgets import QMessageBox
+        info = result[3]
+        left = self.tab.screenshot_budget_left()   # again: other pastes may have landed meanwhile
+        if left is None:
+            return True
+        info["over_budget"] = info["over_budget"] or info["bytes"] > left
+        if not info["over_budget"]:
+            return True
+        mb = 1024 * 1024
+        reply = QMessageBox.question(
+            self, "Screenshot Budget",
+            f"This screenshot is {info['bytes'] / mb:.1f} MB even at {info['width']}x{info['height']}, "
+            f"and only {(left or 0) / mb:.1f} MB of the {SCREENSHOT_BUDGET_BYTES / mb:.0f} MB "
+            f"screenshot budget for this checklist is left.\n\nAttach it anyway?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        return reply == QMessageBox.Yes
+
+    def _confirm_not_duplicate(self, thumb_widget, result):
+        """False to drop a finished paste: exact repeats always, near ones if the user says so."""
+        from PySide6.QtWidgets import QMessageBox
+        b64, _img, _thumb, info = result
+        match = self.tab.find_duplicate(thumb_cache.image_key(b64), info.get("pixel_hash"),
+                                        info.get("dhash"), exclude=thumb_widget)
+        if match is None:
+            return True
+        kind, row, _widget, bits = match
+        vendor = row.vendor_name() or "another vendor card"
+        row.flash_card()
+        if kind == "exact":
+            QMessageBox.information(self, "Duplicate Screenshot",
+                                    f"This screenshot is already attached to {vendor}; it wasn't added again.")
+            return False
+        reply = QMessageBox.question(
+            self, "Similar Screenshot",
+            f"This looks like a screenshot already attached to {vendor} "
+            f"({bits} of 64 fingerprint bits differ).\n\nAttach it anyway?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        return reply == QMessageBox.Yes
+
+    def _apply_encoded(self, thumb_widget, result):
+        entry = next((e for e in self.screenshots if e[0] is thumb_widget), None)
+        if entry is None:
+            return
+        if result is None:
+            self.remove_screenshot(thumb_widget, None)
+            return
+        b64, _img, thumb, info = result
+        key = image_store.add(b64)
+        entry[1] = thumb_widget.image_key = key
+        thumb_widget.pixel_hash = info.get("pixel_hash")
+        thumb_widget.dhash = _dhash_by_key[key] = info.get("dhash")
+        label = thumb_widget.thumb_label
+        label.setText("")
+        label.setPixmap(QPixmap.fromImage(thumb))
+        tip = (f"Click to view full size\n{info['width']}x{info['height']} "
+               f"{info['format'].upper()}, {info['bytes'] / 1024:.0f} KB")
+        if info["over_budget"]:
+            label.setStyleSheet("border:2px solid #d9822b;")
+            tip += "\nOver the checklist screenshot budget"
         else:
-            img = img.convertToFormat(QImage.Format_ARGB32)
-        buf = QBuffer()
-        buf.open(QBuffer.WriteOnly)
-        img.save(buf, "PNG")
-        return base64.b64encode(buf.data()).decode("utf-8")
+            label.setStyleSheet("")
+        label.setToolTip(tip)
+        thumb_widget.btn_view.setEnabled(True)
 
-    def add_screenshot_entry(self, b64, pixmap=None, lazy=False):
+    def add_screenshot_entry(self, key, lazy=False, pending=False):
+        """Thumbnail + View/Delete for a stored screenshot (key is None while a paste encodes)."""
         thumb_widget = QWidget()
+        thumb_widget.image_key = key
+        thumb_widget.pixel_hash = None   # fingerprints for duplicate checks (image_dedupe)
+        thumb_widget.dhash = None
         vbox = QVBoxLayout(thumb_widget)
         vbox.setContentsMargins(0, 0, 0, 0)
         vbox.setSpacing(3)
 
-        if not lazy and pixmap is not None:
-            thumb = pixmap.scaled(
-                THUMB_SIZE[0], THUMB_SIZE[1],
-                Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
-            label = ClickableLabel()
-            label.setPixmap(thumb)
-            label.setAlignment(Qt.AlignCenter)
-            label.setFixedSize(THUMB_SIZE[0], THUMB_SIZE[1])
-            label.setCursor(Qt.PointingHandCursor)
+        label = ClickableLabel()
+        label.setAlignment(Qt.AlignCenter)
+        label.setFixedSize(THUMB_SIZE[0], THUMB_SIZE[1])
+        label.setCursor(Qt.PointingHandCursor)
+        label.on_click = lambda: self.view_screenshot(thumb_widget)
+        if pending:
+            label.setText("Processing…")
+            label.setStyleSheet(PLACEHOLDER_CSS)
+        elif lazy:
+            # Thumbnail from the disk cache, or made in the background the first time
             label.setToolTip("Click to view full size")
-            label.on_click = lambda pixmap=pixmap: self.show_fullsize_screenshot(pixmap)
-            vbox.addWidget(label, alignment=Qt.AlignCenter)
+            cached = thumb_cache.load_cached(key)
+            if cached is not None:
+                label.setPixmap(QPixmap.fromImage(cached))
+                thumb_widget.dhash = _dhash_by_key[key] = image_dedupe.dhash(cached)
+            else:
+                label.setText("Loading…")
+                label.setStyleSheet(PLACEHOLDER_CSS)
+                thumb_cache.request(key, image_store.data(key), self._on_thumbnail_ready)
+        thumb_widget.thumb_label = label
+        vbox.addWidget(label, alignment=Qt.AlignCenter)
 
         btn_row = QWidget()
         btn_layout = QHBoxLayout(btn_row)
@@ -455,89 +936,160 @@ class VendorQuoteRow(QWidget):
 
         btn_view = QPushButton("View")
         btn_view.setFixedWidth(54)
-        if lazy:
-            btn_view.clicked.connect(lambda: self.load_and_show_screenshot(b64, thumb_widget))
-        else:
-            btn_view.clicked.connect(lambda: self.show_fullsize_screenshot(pixmap))
+        btn_view.clicked.connect(lambda: self.view_screenshot(thumb_widget))
+        btn_view.setEnabled(not pending)
+        thumb_widget.btn_view = btn_view
         btn_layout.addWidget(btn_view)
 
         btn_delete = QPushButton("Delete")
         btn_delete.setFixedWidth(54)
-        btn_delete.clicked.connect(lambda: self.remove_screenshot(thumb_widget, b64))
+        btn_delete.clicked.connect(lambda: self.remove_screenshot(thumb_widget))
         btn_layout.addWidget(btn_delete)
 
         vbox.addWidget(btn_row, alignment=Qt.AlignCenter)
         self.screenshot_layout.addWidget(thumb_widget)
-        self.screenshots.append((thumb_widget, b64))
-
-    def load_and_show_screenshot(self, b64, _container_widget):
-        img_bytes = base64.b64decode(b64)
-        pixmap = QPixmap()
-        pixmap.loadFromData(img_bytes)
-        self.show_fullsize_screenshot(pixmap)
-
-    def remove_screenshot(self, thumb_widget, b64):
-        for widget, encoded in list(self.screenshots):
-            if widget == thumb_widget and encoded == b64:
-                self.screenshot_layout.removeWidget(widget)
-                widget.deleteLater()
-                self.screenshots.remove((widget, b64))
+        self.screenshots.append([thumb_widget, key])  # key is None while encoding
+        return thumb_widget
+
+    def _on_thumbnail_ready(self, key, thumb):
+        for thumb_widget, _ in self.screenshots:
+            if getattr(thumb_widget, "image_key", None) != key:
+                continue
+            label = thumb_widget.thumb_label
+            label.setStyleSheet("")
+            if thumb.isNull():
+                label.setText("No preview")
+            else:
+                label.setText("")
+                label.setPixmap(QPixmap.fromImage(thumb))
+                thumb_widget.dhash = _dhash_by_key[key] = image_dedupe.dhash(thumb)
+
+    def view_screenshot(self, thumb_widget):
+        key = thumb_widget.image_key
+        if key is None:
+            return  # still encoding
+        # The viewer decodes tiles from the stored bytes as they come on screen
+        self.show_fullsize_screenshot(image_store.data(key))
+
+    def remove_screenshot(self, thumb_widget, _key=None):
+        self._pending.pop(thumb_widget, None)
+        for entry in list(self.screenshots):
+            if entry[0] is thumb_widget:
+                self.screenshot_layout.removeWidget(thumb_widget)
+                thumb_widget.deleteLater()
+                self.screenshots.remove(entry)
+                if entry[1]:
+                    image_store.release(entry[1])
                 break
         self._on_user_change()
 
+    def release_screenshots(self):
+        """Let go of this card's images in the shared store (the card is being removed)."""
+        self._pending.clear()
+        for _, key in self.screenshots:
+            if key:
+                image_store.release(key)
+        self.screenshots = []
+
     def load_screenshots(self, b64_list):
         self.screenshot_container.setUpdatesEnabled(False)
         try:
             for b64 in b64_list:
-                self.add_screenshot_entry(b64, lazy=True)
+                self.add_screenshot_entry(image_store.add(b64), lazy=True)
         finally:
             self.screenshot_container.setUpdatesEnabled(True)
 
-    def show_fullsize_screenshot(self, pixmap):
-        class ClickToCloseLabel(QLabel):
-            def __init__(self, dialog):
-                super().__init__()
-                self.dialog = dialog
-            def mousePressEvent(self, event):
-                self.dialog.accept()
-
-        dlg = QDialog(self)
-        dlg.setWindowTitle("Screenshot (Full Size)")
-        dlg.setModal(True)
-
-        layout = QVBoxLayout(dlg)
-        scroll = QScrollArea(dlg)
-        label = ClickToCloseLabel(dlg)
-        label.setPixmap(pixmap)
-        label.setAlignment(Qt.AlignCenter)
-        label.setCursor(Qt.PointingHandCursor)
-        label.setToolTip("Click image to close")
-        scroll.setWidget(label)
-        scroll.setWidgetResizable(True)
-        layout.addWidget(scroll)
-
-        hint = QLabel("<span style='font-size:15px; font-weight:bold; text-decoration:underline;'>Click image to close</span>")
-        hint.setAlignment(Qt.AlignCenter)
-        layout.addWidget(hint)
+    def load_screenshot_keys(self, keys):
+        """Show screenshots already in image_store (this card takes over their references)."""
+        self.screenshot_container.setUpdatesEnabled(False)
+        try:
+            for key in keys:
+                self.add_screenshot_entry(key, lazy=True)
+        finally:
+            self.screenshot_container.setUpdatesEnabled(True)
 
-        screen = QGuiApplication.primaryScreen().availableGeometry()
-        dlg.resize(min(pixmap.width() + 40, int(screen.width() * 0.9)),
-                   min(pixmap.height() + 60, int(screen.height() * 0.9)))
-        dlg.exec()
+    def show_fullsize_screenshot(self, data):
+        screenshot_viewer.show_screenshot(data, self)
 
     def get_row_data(self):
+        # A paste still encoding is finished here so it isn't dropped from the save
+        for thumb_widget, task in list(self._pending.items()):
+            del self._pending[thumb_widget]
+            result = task.wait()
+            if result is not None and self.tab.find_duplicate(
+                    thumb_cache.image_key(result[0]), result[3].get("pixel_hash"), exclude=thumb_widget):
+                self.remove_screenshot(thumb_widget)  # exact repeat; no prompt mid-save
+                continue
+            self._apply_encoded(thumb_widget, result)
         name = self.name_entry.text().strip()
         text = self.quote_text.toPlainText().strip()
-        imgs = [b64 for (_, b64) in self.screenshots]
-        return (name, text, imgs)
+        imgs = [image_store.b64(key) for (_, key) in self.screenshots if key]
+        return (name, text, imgs, self.price_table)
 
     def showEvent(self, event):
         super().showEvent(event)
         self.autosize_textedit()
 
 
+def estimate_card_height(text, has_screenshots, fm, width):
+    """Rough height of a built card, so placeholders keep the scroll range close."""
+    usable = max(width - 40, 100)
+    lines = sum(max(1, -(-fm.horizontalAdvance(line) // usable)) for line in text.split("\n"))
+    height = 22 + 16 + 12 + max(lines, 2) * fm.lineSpacing() + 12
+    if has_screenshots:
+        height += THUMB_SIZE[1] + 30
+    return height
+
+
+class VendorCardPlaceholder(QWidget):
+    """
+    Stand-in for a loaded vendor card that hasn't been scrolled into view:
+    holds the card's data (screenshots already in image_store) and paints an
+    outline with the vendor name. VendorQuoteTab.materialize swaps in the real card.
+    """
+    def __init__(self, tab, data, width):
+        super().__init__()
+        self.tab = tab
+        self._name_key = ""
+        self.name = (data[0] if len(data) > 0 else "") or ""
+        self.text = (data[1] if len(data) > 1 else "") or ""
+        shots = data[2] if len(data) > 2 and data[2] else []
+        self.screenshots = [[None, image_store.add(b64)] for b64 in shots]
+        self.price_table = price_breaks.parse_quote(self.text)
+        self.setFixedHeight(estimate_card_height(self.text, bool(shots), self.fontMetrics(), width))
+
+    def vendor_name(self):
+        return self.name.strip()
+
+    def fingerprints(self):
+        return [(None, key, None, _dhash_by_key.get(key)) for _, key in self.screenshots]
+
+    def get_row_data(self):
+        return (self.name.strip(), self.text.strip(), [image_store.b64(key) for _, key in self.screenshots],
+                self.price_table)
+
+    def release_screenshots(self):
+        for _, key in self.screenshots:
+            image_store.release(key)
+        self.screenshots = []
+
+    def flash_card(self):
+        self.tab.materialize(self).flash_card()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QColor("#c5c5c5"))
+        painter.setBrush(QColor("#fafbfc"))
+        painter.drawRoundedRect(self.rect().adjusted(1, 1, -1, -1), 10, 10)
+        painter.setPen(QColor("#888"))
+        painter.drawText(self.rect().adjusted(14, 10, -14, -10), Qt.AlignLeft | Qt.AlignTop,
+                         self.name or "Vendor")
+
+
 # ---- Factory helpers used by launch.py ----
 _tab_instance = None
+_tab_builder = None
 
 def create_vendor_quote_tab(tab_widget: QWidget, dirty_tracker=None):
     global _tab_instance
@@ -546,13 +1098,31 @@ def create_vendor_quote_tab(tab_widget: QWidget, dirty_tracker=None):
     layout.setContentsMargins(0, 0, 0, 0)
     layout.addWidget(_tab_instance)
 
+def set_tab_builder(builder):
+    """Register the callable launch.py uses to build this tab on first use."""
+    global _tab_builder
+    _tab_builder = builder
+
+def ensure_vendor_quote_tab():
+    """Return the tab instance, building it now if construction was deferred."""
+    if _tab_instance is None and _tab_builder is not None:
+        _tab_builder()
+    return _tab_instance
+
 def get_vendor_quote_data():
-    return _tab_instance.get_vendor_quote_data() if _tab_instance else []
+    tab = ensure_vendor_quote_tab()
+    return tab.get_vendor_quote_data() if tab else []
 
 def load_vendor_quote_data(data):
-    if _tab_instance:
-        _tab_instance.load_vendor_quote_data(data)
+    tab = ensure_vendor_quote_tab()
+    if tab:
+        tab.load_vendor_quote_data(data)
 
 def clear_vendor_quote_tab(skip_add=False):
     if _tab_instance:
         _tab_instance.clear_vendor_quote_tab(skip_add=skip_add)
+
+def schedule_vendor_rerank(*_):
+    """Called when the quote changes (drawings, materials, customer); no-op until the tab is built."""
+    if _tab_instance:
+        _tab_instance.schedule_rerank()